@@ -4,21 +4,17 @@ Flask 앱 초기화
 from flask import Flask
 import os
 import logging
-from logging.handlers import RotatingFileHandler
 from flask_wtf.csrf import CSRFProtect, CSRFError
+from jinja2 import FileSystemBytecodeCache
 
-def create_app(config_name=None):
-    """Flask 앱 생성"""
+def create_app(config_name=None, overrides=None):
+    """Flask 앱 생성 (overrides는 설정 파일 값 위에 덮어쓸 설정, 테스트에서 경로 변경 등에 사용)"""
     # 앱 기본 설정
     app = Flask(__name__, 
                 static_folder='static',
                 template_folder='templates')
-    
-    # 프로젝트 루트 디렉토리를 Python 경로에 추가
-    import sys
-    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    
-    # 환경 설정 로드
+
+    # 환경 설정 로드 (config 패키지는 app과 같은 디렉터리에 있어 따로 경로를 추가하지 않음)
     if config_name is None:
         config_name = os.environ.get('FLASK_ENV', 'development')
     
@@ -26,13 +22,27 @@ def create_app(config_name=None):
         app.config.from_object('config.production')
     else:
         app.config.from_object('config.settings')
+    if overrides:
+        app.config.update(overrides)
 
     # Jinja2 환경에 zip 함수 추가
     app.jinja_env.globals.update(zip=zip)
 
+    # 컴파일한 템플릿을 디스크에 저장해 다음 프로세스는 파싱/컴파일을 건너뜀 (원본이 바뀌면 다시 컴파일)
+    bytecode_dir = app.config.get('JINJA_BYTECODE_CACHE')
+    if bytecode_dir:
+        os.makedirs(bytecode_dir, exist_ok=True)
+        app.jinja_env.bytecode_cache = FileSystemBytecodeCache(bytecode_dir)
+
+    # 평가/드로우 테이블 파일 (처음 쓸 때 메모리 매핑으로 읽고, 없으면 만들어 저장)
+    from .models.table_cache import set_cache_path
+    set_cache_path(app.config.get('TABLE_CACHE_PATH'))
+
     # 세션 설정
     app.secret_key = os.environ.get('SECRET_KEY', os.urandom(24))
-    app.config['SESSION_TYPE'] = 'filesystem'
+
+    # 게임 저장소 설정
+    init_game_store(app)
     
     # CSRF 보호 설정
     csrf = CSRFProtect(app)
@@ -42,30 +52,52 @@ def create_app(config_name=None):
     def handle_csrf_error(e):
         return render_template('error.html', error="보안 토큰이 만료되었습니다. 다시 시도해주세요."), 400
     
+    # 빌드된 정적 자원 (asset_url, /assets)
+    from .assets import init_assets
+    init_assets(app)
+
+    # 카드 조각/정적 페이지 렌더링 캐시 (csrf_token 전역 등록 이후)
+    from .render_cache import init_render_cache
+    init_render_cache(app)
+
+    # 동적 응답 압축
+    from .compression import init_compression
+    init_compression(app)
+
     # 로깅 설정
     setup_logging(app)
     
+    # 요청 계측
+    from .metrics import init_metrics
+    init_metrics(app)
+
     # 라우트 등록
     from .routes import register_routes
     register_routes(app)
+    from .api import register_api
+    register_api(app)
 
     return app
 
+def init_game_store(app):
+    """게임 저장소 생성 (cookie 백엔드면 세션 쿠키에 저장)"""
+    from .store import create_game_store
+    app.extensions['game_store'] = create_game_store(app.config)
+
 def setup_logging(app):
-    """로깅 설정"""
-    if not os.path.exists('logs'):
-        os.mkdir('logs')
-        
-    file_handler = RotatingFileHandler('logs/poker.log', maxBytes=10240, backupCount=10)
-    file_handler.setFormatter(logging.Formatter(
-        '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
-    ))
-    
-    if app.config['DEBUG']:
-        file_handler.setLevel(logging.DEBUG)
-    else:
-        file_handler.setLevel(logging.INFO)
-        
-    app.logger.addHandler(file_handler)
-    app.logger.setLevel(logging.INFO if not app.config['DEBUG'] else logging.DEBUG)
-    app.logger.info('포커 게임 시작') 
\ No newline at end of file
+    """로깅 설정 (큐 + 백그라운드 리스너, JSON Lines 파일)"""
+    from flask.logging import default_handler
+    from .log import start_logging
+
+    # 콘솔 출력도 리스너가 담당하므로 Flask 기본 핸들러 제거
+    app.logger.removeHandler(default_handler)
+    level = logging.DEBUG if app.config['DEBUG'] else logging.getLevelName(app.config.get('LOG_LEVEL', 'INFO'))
+    start_logging(
+        app.logger, level,
+        log_file=app.config.get('LOG_FILE', 'logs/poker.log'),
+        max_bytes=app.config.get('LOG_MAX_BYTES', 10 * 1024 * 1024),
+        backup_count=app.config.get('LOG_BACKUP_COUNT', 5),
+        console=app.config.get('LOG_CONSOLE', True),
+        sample_rates=app.config.get('LOG_SAMPLE_RATES'),
+    )
+    app.logger.info('포커 게임 시작')
@@ -0,0 +1,108 @@
+"""
+JSON API (v1)
+
+    POST /api/games                   새 게임 시작, 전체 상태 반환
+    GET  /api/games/<id>/state        전체 상태 (If-None-Match가 맞으면 304)
+    POST /api/games/<id>/discard      카드 교체, 이전 상태 대비 변경분만 반환
+
+게임 id는 세션에 연결된 게임의 id이며, 다른 세션의 게임은 404로 처리한다.
+버전(ETag)은 상태 내용의 해시라서 저장 방식(쿠키/저장소)과 무관하다.
+변경분은 get_game_state의 최상위 키 중 바뀐 것만 담고, 플레이어별 딕셔너리는
+바뀐 플레이어만 담는다 (None이면 삭제). base_version이 클라이언트 버전과 다르면
+/state로 전체 상태를 다시 받아야 한다.
+"""
+from typing import Any, Dict
+from flask import jsonify, request, session, url_for
+from .routes import get_game, save_game, current_game_id, validate_game_state
+from config.settings import MAX_CARDS_TO_DISCARD
+
+API_VERSION = 1
+
+
+def state_delta(before: Dict[str, Any], after: Dict[str, Any]) -> Dict[str, Any]:
+    """get_game_state 결과 두 개의 차이"""
+    delta = {}
+    for key, value in after.items():
+        old = before.get(key)
+        if value == old:
+            continue
+        if isinstance(value, dict) and isinstance(old, dict):
+            delta[key] = {name: value.get(name) for name in old.keys() | value.keys()
+                          if old.get(name) != value.get(name)}
+        else:
+            delta[key] = value
+    return delta
+
+
+def api_error(message: str, status: int):
+    """JSON 오류 응답"""
+    response = jsonify(error=message)
+    response.status_code = status
+    return response
+
+
+def register_api(app):
+    """JSON API 라우트 등록"""
+
+    def owned_game(game_id):
+        """세션의 게임이 game_id와 같으면 게임 반환"""
+        if session.get('game_id') != game_id:
+            return None
+        return get_game()
+
+    def state_response(game, body, status=200):
+        version = game.state_version()
+        response = jsonify(api_version=API_VERSION, id=current_game_id(), version=version, **body)
+        response.status_code = status
+        response.set_etag(version)
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
+
+    @app.route('/api/games', methods=['POST'])
+    def api_create_game():
+        """새 게임 시작"""
+        game = get_game()
+        game.reset_game()
+        game.start_game()
+        save_game(game)
+        response = state_response(game, {'state': game.get_game_state()}, 201)
+        response.headers['Location'] = url_for('api_game_state', game_id=current_game_id())
+        return response
+
+    @app.route('/api/games/<game_id>/state')
+    def api_game_state(game_id):
+        """전체 상태 (조건부 요청 지원)"""
+        game = owned_game(game_id)
+        if game is None:
+            return api_error("게임을 찾을 수 없습니다.", 404)
+        return state_response(game, {'state': game.get_game_state()}).make_conditional(request)
+
+    @app.route('/api/games/<game_id>/discard', methods=['POST'])
+    def api_discard(game_id):
+        """카드 교체 (빈 목록이면 턴 넘기기)"""
+        game = owned_game(game_id)
+        if game is None:
+            return api_error("게임을 찾을 수 없습니다.", 404)
+        error = validate_game_state(game)
+        if error:
+            return api_error(error, 409)
+
+        # 버전은 Game이 불러오거나 저장한 바이트열로 기억해 두므로 여기서 인코딩하지 않음
+        base_version = game.state_version()
+        if request.if_match and not request.if_match.contains(base_version):
+            return api_error("게임 상태가 변경되었습니다. 상태를 다시 불러오세요.", 412)
+
+        payload = request.get_json(silent=True) or {}
+        indices = payload.get('discard', [])
+        hand_size = len(game.players['Player 1'].hand)
+        if (not isinstance(indices, list) or len(indices) > MAX_CARDS_TO_DISCARD
+                or len(set(indices)) != len(indices)
+                or not all(type(i) is int and 0 <= i < hand_size for i in indices)):
+            return api_error(f"교체할 카드는 0~{hand_size - 1} 범위의 서로 다른 인덱스 "
+                             f"최대 {MAX_CARDS_TO_DISCARD}개여야 합니다.", 400)
+
+        before = game.get_game_state()
+        game.discard_cards('Player 1', indices)
+        save_game(game)
+        return state_response(game, {'base_version': base_version,
+                                     'delta': state_delta(before, game.get_game_state())})
@@ -0,0 +1,213 @@
+"""
+정적 자원 빌드 및 제공
+
+    python -m app.assets            # app/static/dist에 빌드
+    python -m app.assets --clean    # 빌드 결과 삭제
+
+빌드는 CSS/JS를 줄이고(minify) 내용 해시를 파일 이름에 넣어(css/style.<hash>.css)
+gzip, brotli(brotli 패키지가 있으면) 압축본을 함께 쓴 뒤 원래 이름 -> 해시 이름
+매니페스트(manifest.json)를 남긴다.
+
+앱은 시작할 때 매니페스트를 읽고, 템플릿의 asset_url(이름)은 빌드된 자원이 있으면
+/assets/<해시 이름>, 없으면 기존 /static/<이름>을 돌려준다.
+/assets는 Accept-Encoding에 맞는 압축본을 그대로 보내고 이름이 내용으로 정해지므로
+1년짜리 immutable 캐시를 건다 (내용이 바뀌면 이름이 바뀜).
+"""
+import argparse
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+import shutil
+import sys
+from typing import Dict, List, Optional
+from flask import Flask, Response, abort, request, send_file, url_for
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip만 만듦
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# 빌드 대상 확장자
+ASSET_TYPES = ('.css', '.js')
+
+# 빌드 결과 디렉터리 (static 폴더 기준)
+DIST_DIR = 'dist'
+MANIFEST = 'manifest.json'
+
+# 해시 이름 자원의 캐시 기간 (1년)
+IMMUTABLE_MAX_AGE = 365 * 24 * 3600
+
+# 압축본 선택 순서 (Content-Encoding, 확장자)
+_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+_CSS_STRING = re.compile(r'("[^"]*"|\'[^\']*\')')
+_CSS_COMMENT = re.compile(r'/\*.*?\*/', re.S)
+
+
+def minify_css(text: str) -> str:
+    """주석과 불필요한 공백 제거 (문자열 안은 그대로)"""
+    parts = _CSS_STRING.split(_CSS_COMMENT.sub('', text))
+    for i in range(0, len(parts), 2):
+        part = re.sub(r'\s+', ' ', parts[i])
+        part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+        parts[i] = re.sub(r':\s+', ':', part).replace(';}', '}')
+    return ''.join(parts).strip()
+
+
+def minify_js(text: str) -> str:
+    """줄 단위 축소: 들여쓰기, 빈 줄, 한 줄 주석 제거
+
+    줄바꿈은 남겨 자동 세미콜론 삽입 규칙이 바뀌지 않게 하고,
+    여러 줄에 걸친 템플릿 문자열(`...`) 안의 줄은 건드리지 않는다.
+    """
+    out: List[str] = []
+    in_template = False
+    for line in text.splitlines():
+        if in_template:
+            out.append(line)
+        else:
+            stripped = line.strip()
+            if stripped and not stripped.startswith('//'):
+                out.append(stripped)
+        if len(re.findall(r'(?<!\\)`', line)) % 2:
+            in_template = not in_template
+    return '\n'.join(out) + '\n'
+
+
+def _minify(name: str, data: bytes) -> bytes:
+    text = data.decode('utf-8')
+    text = minify_css(text) if name.endswith('.css') else minify_js(text)
+    return text.encode('utf-8')
+
+
+def build_assets(static_dir: str) -> Dict[str, str]:
+    """static_dir의 CSS/JS를 dist에 빌드하고 매니페스트 반환"""
+    dist = os.path.join(static_dir, DIST_DIR)
+    shutil.rmtree(dist, ignore_errors=True)
+    manifest = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = sorted(d for d in dirs if os.path.join(root, d) != dist)
+        for filename in sorted(files):
+            if not filename.endswith(ASSET_TYPES):
+                continue
+            path = os.path.join(root, filename)
+            name = os.path.relpath(path, static_dir).replace(os.sep, '/')
+            with open(path, 'rb') as f:
+                data = _minify(name, f.read())
+            stem, ext = os.path.splitext(name)
+            hashed = f'{stem}.{hashlib.sha256(data).hexdigest()[:12]}{ext}'
+            target = os.path.join(dist, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(data)
+            # mtime=0으로 같은 입력이면 같은 압축본
+            with open(target + '.gz', 'wb') as f:
+                f.write(gzip.compress(data, 9, mtime=0))
+            if brotli is not None:
+                with open(target + '.br', 'wb') as f:
+                    f.write(brotli.compress(data, quality=11))
+            manifest[name] = hashed
+    with open(os.path.join(dist, MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+def load_manifest(static_dir: str) -> Dict[str, str]:
+    """빌드 매니페스트 (없으면 빈 값, 빌드 이후 수정된 원본은 제외)"""
+    path = os.path.join(static_dir, DIST_DIR, MANIFEST)
+    try:
+        with open(path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        built_at = os.path.getmtime(path)
+    except (OSError, ValueError):
+        return {}
+    stale = [name for name in manifest if _modified_since(os.path.join(static_dir, name), built_at)]
+    if stale:
+        logger.warning("빌드 이후 수정된 정적 자원은 원본으로 제공합니다 (python -m app.assets로 다시 빌드): %s",
+                       ', '.join(stale))
+    return {name: hashed for name, hashed in manifest.items() if name not in stale}
+
+
+def _modified_since(path: str, timestamp: float) -> bool:
+    try:
+        return os.path.getmtime(path) > timestamp
+    except OSError:
+        return True  # 원본이 없어짐
+
+
+def init_assets(app: Flask) -> Dict[str, str]:
+    """매니페스트를 읽고 asset_url과 /assets 라우트 등록"""
+    static_dir = app.static_folder
+    dist = os.path.join(static_dir, DIST_DIR)
+    manifest = load_manifest(static_dir) if app.config.get('ASSETS_MANIFEST', True) else {}
+    app.extensions['assets'] = manifest
+
+    def asset_url(filename: str) -> str:
+        """빌드된 자원이면 해시 이름의 /assets URL, 아니면 /static URL"""
+        hashed = manifest.get(filename)
+        if hashed is None:
+            return url_for('static', filename=filename)
+        return url_for('assets', filename=hashed)
+
+    app.jinja_env.globals['asset_url'] = asset_url
+
+    @app.route('/assets/<path:filename>')
+    def assets(filename: str) -> Response:
+        """해시 이름 자원 (압축본 우선, immutable 캐시)"""
+        path = os.path.normpath(os.path.join(dist, filename))
+        if not path.startswith(dist + os.sep) or filename == MANIFEST or not os.path.isfile(path):
+            abort(404)
+        encoding = None
+        for name, suffix in _ENCODINGS:
+            if request.accept_encodings[name] and os.path.isfile(path + suffix):
+                encoding, path = name, path + suffix
+                break
+        response = send_file(path, mimetype=_mimetype(filename), conditional=True,
+                             etag=True, max_age=IMMUTABLE_MAX_AGE)
+        if encoding is not None:
+            response.headers['Content-Encoding'] = encoding
+        response.headers['Vary'] = 'Accept-Encoding'
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+        return response
+
+    return manifest
+
+
+def _mimetype(filename: str) -> str:
+    if filename.endswith('.css'):
+        return 'text/css; charset=utf-8'
+    return 'text/javascript; charset=utf-8'
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 실행"""
+    static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+    parser = argparse.ArgumentParser(description='정적 자원 빌드 (minify, 해시 이름, gzip/brotli)')
+    parser.add_argument('--clean', action='store_true', help='빌드 결과만 삭제')
+    args = parser.parse_args(argv)
+    if args.clean:
+        shutil.rmtree(os.path.join(static_dir, DIST_DIR), ignore_errors=True)
+        return 0
+
+    manifest = build_assets(static_dir)
+    for name, hashed in manifest.items():
+        source = os.path.getsize(os.path.join(static_dir, name))
+        target = os.path.join(static_dir, DIST_DIR, hashed)
+        sizes = [f'{os.path.getsize(target):,} B']
+        for _, suffix in _ENCODINGS:
+            if os.path.isfile(target + suffix):
+                sizes.append(f'{suffix[1:]} {os.path.getsize(target + suffix):,} B')
+        print(f"{name} ({source:,} B) -> {hashed}: {', '.join(sizes)}")
+    if brotli is None:
+        print("brotli 패키지가 없어 gzip 압축본만 만들었습니다 (pip install brotli)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,140 @@
+"""
+큐 기반 로깅
+
+요청 스레드는 레코드를 큐에 넣기만 하고(QueueHandler), 파일 기록과 회전은
+백그라운드 리스너 스레드(QueueListener)가 맡는다.
+파일에는 한 줄에 JSON 객체 하나(JSON Lines)를 기록한다.
+
+    {"ts": "2025-01-01T12:00:00.123+00:00", "level": "INFO", "logger": "app.routes",
+     "message": "새 게임 시작", "module": "routes", "line": 101, "pid": 1234,
+     "method": "GET", "path": "/start"}
+
+LOG_SAMPLE_RATES로 레벨별 기록 비율을 정할 수 있다 (예: get_game의 DEBUG 로그 1%만 기록).
+여러 워커 프로세스가 같은 파일을 회전시키면 충돌할 수 있으므로 멀티 워커에서는
+LOG_FILE을 워커별로 나누거나 None으로 두고 표준 출력을 수집하는 것이 좋다.
+"""
+import atexit
+import copy
+import datetime
+import itertools
+import json
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+from flask import has_request_context, request
+
+# 현재 앱 로거에 연결된 (QueueHandler, QueueListener)
+_active: Optional[tuple] = None
+
+
+class JsonFormatter(logging.Formatter):
+    """로그 레코드를 JSON 한 줄로 변환"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.datetime.fromtimestamp(record.created, datetime.timezone.utc)
+                                   .isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'module': record.module,
+            'line': record.lineno,
+            'pid': record.process,
+        }
+        request_info = getattr(record, 'request', None)
+        if request_info:
+            entry.update(request_info)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return json.dumps(entry, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """레벨별로 N개 중 1개만 통과 (비율 1 이상이거나 지정되지 않은 레벨은 모두 통과)"""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self._every = {logging.getLevelName(level): max(1, round(1 / rate)) if rate > 0 else 0
+                       for level, rate in rates.items() if rate < 1}
+        self._counters = {level: itertools.count() for level in self._every}
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        every = self._every.get(record.levelno)
+        if every is None:
+            return True
+        return every > 0 and next(self._counters[record.levelno]) % every == 0
+
+
+class RequestQueueHandler(QueueHandler):
+    """요청 정보를 붙이고 메시지를 미리 합쳐 큐에 넣는 핸들러
+
+    리스너 스레드에는 요청 컨텍스트가 없으므로 method/path는 여기서 기록한다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # 메시지를 합쳐 두는 것은 다른 핸들러에도 영향이 없으므로 예외가 있을 때만 복사
+        if record.exc_info:
+            record = copy.copy(record)
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        record.msg = record.getMessage()
+        record.args = None
+        if has_request_context():
+            record.request = {'method': request.method, 'path': request.path}
+        return record
+
+
+def start_logging(logger: logging.Logger, level: int, log_file: Optional[str],
+                  max_bytes: int, backup_count: int, console: bool,
+                  sample_rates: Optional[Dict[str, float]] = None) -> QueueListener:
+    """logger에 큐 핸들러를 달고 리스너 시작 (이전에 시작한 것은 정리)"""
+    stop_logging()
+
+    handlers = []
+    if log_file:
+        directory = os.path.dirname(log_file)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes,
+                                           backupCount=backup_count, encoding='utf-8')
+        file_handler.setFormatter(JsonFormatter())
+        handlers.append(file_handler)
+    if console:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(logging.Formatter('[%(asctime)s] %(levelname)s in %(module)s: %(message)s'))
+        handlers.append(console_handler)
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    queue_handler = RequestQueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    if sample_rates:
+        queue_handler.addFilter(SamplingFilter(sample_rates))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+
+    logger.addHandler(queue_handler)
+    logger.setLevel(level)
+
+    global _active
+    _active = (logger, queue_handler, listener)
+    return listener
+
+
+def stop_logging() -> None:
+    """큐 핸들러를 떼고 남은 레코드를 기록한 뒤 리스너 종료"""
+    global _active
+    if _active is None:
+        return
+    logger, queue_handler, listener = _active
+    _active = None
+    logger.removeHandler(queue_handler)
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+atexit.register(stop_logging)
@@ -0,0 +1,238 @@
+"""
+요청 계측 (opt-in)
+
+METRICS_ENABLED가 켜져 있으면 다음 시간을 히스토그램으로 모아 METRICS_PATH에서
+Prometheus 텍스트 형식으로 노출한다.
+
+    poker_request_duration_seconds{route, method, status}   요청 전체
+    poker_session_seconds{op="load"|"save"}                 게임 상태 로드/저장
+    poker_template_render_seconds{template}                 템플릿 렌더링
+    poker_hand_analyze_seconds                              Hand.analyze
+    poker_ai_decision_seconds{strategy}                     AI 교체 결정
+
+PROFILE_SLOW_REQUEST_MS가 0보다 크면 PROFILE_SAMPLE_RATE 비율의 요청을 cProfile로 측정해
+기준보다 느린 요청의 통계를 PROFILE_DIR에 .prof 파일로 남긴다.
+
+둘 다 꺼져 있으면 훅도 래퍼도 설치하지 않는다 (게임 로드/저장의 설정 조회 한 번만 남음).
+값은 프로세스별로 모이므로 여러 워커로 실행하면 워커마다 따로 수집된다.
+"""
+import bisect
+import cProfile
+import functools
+import os
+import random
+import re
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterator, Optional, Tuple
+from flask import current_app, g, has_app_context, request, Response
+
+# 히스토그램 구간 상한(초)
+DEFAULT_BUCKETS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+_HELP = {
+    'poker_request_duration_seconds': '요청 처리 시간',
+    'poker_session_seconds': '게임 상태 로드/저장 시간',
+    'poker_template_render_seconds': '템플릿 렌더링 시간',
+    'poker_hand_analyze_seconds': 'Hand.analyze 시간',
+    'poker_ai_decision_seconds': 'AI 교체 결정 시간',
+}
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """구간별 개수(누적 전), 합계, 개수"""
+    __slots__ = ('buckets', 'counts', 'sum', 'count')
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Metrics:
+    """이름과 레이블별 히스토그램 모음"""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms: Dict[str, Dict[Labels, Histogram]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, name: str, seconds: float, **labels: str) -> None:
+        """측정값 하나 기록"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(seconds)
+
+    @contextmanager
+    def time(self, name: str, **labels: str) -> Iterator[None]:
+        """with 블록 실행 시간 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines = []
+        with self._lock:
+            for name in sorted(self._histograms):
+                lines.append(f'# HELP {name} {_HELP.get(name, name)}')
+                lines.append(f'# TYPE {name} histogram')
+                for key, histogram in sorted(self._histograms[name].items()):
+                    cumulative = 0
+                    for bound, count in zip(histogram.buckets + (float('inf'),), histogram.counts):
+                        cumulative += count
+                        le = '+Inf' if bound == float('inf') else repr(bound)
+                        lines.append(f'{name}_bucket{_format_labels(key + (("le", le),))} {cumulative}')
+                    lines.append(f'{name}_sum{_format_labels(key)} {histogram.sum!r}')
+                    lines.append(f'{name}_count{_format_labels(key)} {histogram.count}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels: Labels) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(str(value))}"' for key, value in labels) + '}'
+
+
+def current_metrics() -> Optional[Metrics]:
+    """현재 앱의 Metrics (꺼져 있거나 앱 컨텍스트 밖이면 None)"""
+    if not has_app_context():
+        return None
+    return current_app.extensions.get('metrics')
+
+
+_NULL_CONTEXT = nullcontext()
+
+
+def timer(name: str, **labels: str):
+    """계측이 켜져 있으면 시간을 기록하는 컨텍스트 매니저 (요청 처리 중에만 사용)"""
+    metrics = current_app.extensions.get('metrics')
+    return _NULL_CONTEXT if metrics is None else metrics.time(name, **labels)
+
+
+def _timed(func, name: str, **labels: str):
+    """현재 앱의 Metrics에 실행 시간을 기록하는 래퍼"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        metrics = current_metrics()
+        if metrics is None:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            metrics.observe(name, time.perf_counter() - start, **labels)
+    wrapper.__wrapped_for_metrics__ = True
+    return wrapper
+
+
+def _instrument_models() -> None:
+    """Hand.analyze와 AI 결정 메서드에 계측 래퍼 설치 (한 번만)"""
+    from app.models.hand import Hand
+    from app.models.ai import PokerAI, MonteCarloAI, ExactAI
+    if getattr(Hand.analyze, '__wrapped_for_metrics__', False):
+        return
+    Hand.analyze = _timed(Hand.analyze, 'poker_hand_analyze_seconds')
+    for cls, strategy in ((PokerAI, 'heuristic'), (MonteCarloAI, 'montecarlo'), (ExactAI, 'exact')):
+        cls.decide_cards_to_discard = _timed(cls.__dict__['decide_cards_to_discard'],
+                                             'poker_ai_decision_seconds', strategy=strategy)
+
+
+def init_metrics(app) -> None:
+    """설정에 따라 계측 훅과 /metrics 등록"""
+    enabled = app.config.get('METRICS_ENABLED', False)
+    slow_ms = app.config.get('PROFILE_SLOW_REQUEST_MS', 0)
+    if not enabled and not slow_ms:
+        return
+
+    metrics = Metrics()
+    if enabled:
+        app.extensions['metrics'] = metrics
+        _instrument_models()
+        _connect_template_signals(app, metrics)
+
+        @app.route(app.config.get('METRICS_PATH', '/metrics'))
+        def metrics_endpoint():
+            """Prometheus 텍스트 형식 계측 값"""
+            return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+    sample_rate = app.config.get('PROFILE_SAMPLE_RATE', 1.0)
+    profile_dir = app.config.get('PROFILE_DIR', 'logs/profiles')
+
+    @app.before_request
+    def start_request_timer():
+        g.metrics_start = time.perf_counter()
+        if slow_ms and random.random() < sample_rate:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:
+                return  # 다른 스레드에서 이미 프로파일링 중 (Python 3.12+)
+            g.profiler = profiler
+
+    @app.after_request
+    def remember_status(response):
+        g.metrics_status = response.status_code
+        return response
+
+    # teardown은 모든 after_request(게임 저장 등) 뒤에 실행됨
+    @app.teardown_request
+    def record_request(exc):
+        start = g.pop('metrics_start', None)
+        if start is None:
+            return
+        profiler = g.pop('profiler', None)
+        if profiler is not None:
+            profiler.disable()
+        elapsed = time.perf_counter() - start
+        route = request.url_rule.rule if request.url_rule is not None else '<unmatched>'
+        if enabled:
+            status = '500' if exc is not None else str(g.get('metrics_status', 500))
+            metrics.observe('poker_request_duration_seconds', elapsed, route=route,
+                            method=request.method, status=status)
+        if profiler is not None and elapsed * 1000 >= slow_ms:
+            _dump_profile(profiler, profile_dir, route, elapsed)
+
+
+def _connect_template_signals(app, metrics: Metrics) -> None:
+    from flask import before_render_template, template_rendered
+
+    def started(sender, template, context, **extra):
+        g.setdefault('template_starts', []).append(time.perf_counter())
+
+    def finished(sender, template, context, **extra):
+        starts = g.get('template_starts')
+        if starts:
+            metrics.observe('poker_template_render_seconds', time.perf_counter() - starts.pop(),
+                            template=template.name or '<string>')
+
+    before_render_template.connect(started, app, weak=False)
+    template_rendered.connect(finished, app, weak=False)
+
+
+def _dump_profile(profiler: cProfile.Profile, directory: str, route: str, elapsed: float) -> None:
+    """느린 요청의 프로파일 저장"""
+    os.makedirs(directory, exist_ok=True)
+    slug = re.sub(r'[^A-Za-z0-9_-]+', '_', route).strip('_') or 'root'
+    name = f'{time.strftime("%Y%m%d-%H%M%S")}-{slug}-{elapsed * 1000:.0f}ms-{os.getpid()}-{time.perf_counter_ns()}.prof'
+    path = os.path.join(directory, name)
+    profiler.dump_stats(path)
@@ -1,18 +1,37 @@
 """
 AI 관련 클래스 정의
 """
-from typing import List
+import random
+from typing import List, Optional
 from app.models.card import Card
 from app.models.hand import Hand
+from app.models.evaluator import MAX_CARDS
+from app.models.potential import decide_discards
+from app.models.equity import estimate_discards
+from app.models.solver import solve
+from config.settings import AI_STRATEGY, AI_SAMPLES, AI_TIME_BUDGET
 
 class PokerAI:
     """포커 AI 클래스"""
     def __init__(self, hand: List[Card]):
         self.hand = hand
-        self.hand_analyzer = Hand(hand)
+        self._hand_analyzer: Optional[Hand] = None
+
+    @property
+    def hand_analyzer(self) -> Hand:
+        if self._hand_analyzer is None:
+            self._hand_analyzer = Hand(self.hand)
+        return self._hand_analyzer
 
     def decide_cards_to_discard(self) -> List[int]:
         """버릴 카드 결정"""
+        # 7장 이하는 드로우 테이블로 조회
+        if len(self.hand) <= MAX_CARDS:
+            return decide_discards([card.id for card in self.hand])
+        return self._decide_by_scan()
+
+    def _decide_by_scan(self) -> List[int]:
+        """패를 직접 훑어 버릴 카드 결정 (테이블 범위를 넘는 패)"""
         score = self.hand_analyzer.analyze()
         potential = self.hand_analyzer.get_hand_potential()
         
@@ -86,4 +105,52 @@ class PokerAI:
         if len(current_consecutive) > len(best_consecutive):
             best_consecutive = current_consecutive
             
-        return best_consecutive 
\ No newline at end of file
+        return best_consecutive
+
+
+class MonteCarloAI(PokerAI):
+    """남은 덱 표본 추출로 기대 점수가 가장 높은 교체를 고르는 AI"""
+    def __init__(self, hand: List[Card], deck: List[Card],
+                 samples: int = AI_SAMPLES, time_budget: Optional[float] = AI_TIME_BUDGET,
+                 rng: Optional[random.Random] = None):
+        super().__init__(hand)
+        self.deck = deck
+        self.samples = samples
+        self.time_budget = time_budget
+        self.rng = rng
+
+    def decide_cards_to_discard(self) -> List[int]:
+        """버릴 카드 결정"""
+        estimates = estimate_discards(self.hand, self.deck, samples=self.samples,
+                                      time_budget=self.time_budget, rng=self.rng)
+        return list(estimates[0].indices)
+
+
+class ExactAI(PokerAI):
+    """덱 순서를 이용해 남은 턴 전체의 최적 계획을 따르는 AI"""
+    def __init__(self, hand: List[Card], deck: List[Card], turns_left: int = 1):
+        super().__init__(hand)
+        self.deck = deck
+        self.turns_left = turns_left
+
+    def decide_cards_to_discard(self) -> List[int]:
+        """버릴 카드 결정"""
+        plan = solve(self.hand, self.deck, max(self.turns_left, 1))
+        return plan.first_indices(self.hand)
+
+
+# create_ai가 지원하는 전략 이름
+AI_STRATEGIES = ('heuristic', 'montecarlo', 'exact')
+
+
+def create_ai(hand: List[Card], deck: List[Card], strategy: str = AI_STRATEGY,
+              turns_left: int = 1, rng: Optional[random.Random] = None,
+              time_budget: Optional[float] = AI_TIME_BUDGET) -> PokerAI:
+    """전략 이름으로 AI 생성 (time_budget은 montecarlo만 사용, None이면 표본 수로만 제한)"""
+    if strategy == 'heuristic':
+        return PokerAI(hand)
+    if strategy == 'montecarlo':
+        return MonteCarloAI(hand, deck, time_budget=time_budget, rng=rng)
+    if strategy == 'exact':
+        return ExactAI(hand, deck, turns_left)
+    raise ValueError(f"Unknown AI strategy: {strategy}")
@@ -0,0 +1,108 @@
+"""
+NumPy 일괄 패 점수 계산
+
+(N, k) 정수 카드 배열(카드 id 0~51, 무늬 인덱스 * 13 + 랭크 인덱스)을 받아
+점수, 족보 코드, 합계, 배율 배열을 돌려준다. 족보 코드는 HAND_RANKINGS의 인덱스다.
+판정 규칙은 Hand.analyze와 같다 (트리플 2개도 풀하우스, 플러시는 무늬와 무관한
+랭크 조합으로 스트레이트/로얄 플러시 판정 등).
+
+랭크별 장수는 3비트, 무늬별 장수는 4비트 필드로 정수 하나에 누적하고
+페어/트리플 수는 비트 연산과 popcount로 센다.
+numpy 2.0 이상이 필요하다 (웹 앱은 이 모듈을 사용하지 않는다).
+"""
+from typing import List, Sequence, Tuple
+import numpy as np
+from app.models.card import Card
+from config.settings import RANKS, SUITS, RANK_VALUES, HAND_RANKINGS
+
+HAND_TYPE_NAMES = tuple(hand_type for hand_type, _ in HAND_RANKINGS)
+HAND_TYPE_CODES = {hand_type: code for code, hand_type in enumerate(HAND_TYPE_NAMES)}
+MULTIPLIERS = np.array([multiplier for _, multiplier in HAND_RANKINGS], dtype=np.int64)
+
+# 한 번에 처리할 패 수 (임시 배열 메모리 제한)
+CHUNK_SIZE = 1 << 17
+
+_NUM_RANKS = len(RANKS)
+_NUM_CARDS = _NUM_RANKS * len(SUITS)
+
+# 한 패의 최대 장수 (무늬별 장수를 4비트 필드에 담음)
+MAX_BATCH_CARDS = 15
+
+# 카드 id -> 랭크별 3비트 / 무늬별 4비트 필드에 1을 더하는 값, 카드 값
+_RANK_FIELDS = np.array([1 << (3 * (i % _NUM_RANKS)) for i in range(_NUM_CARDS)], dtype=np.int64)
+_SUIT_FIELDS = np.array([1 << (4 * (i // _NUM_RANKS)) for i in range(_NUM_CARDS)], dtype=np.int64)
+_CARD_VALUES = np.array([RANK_VALUES[RANKS[i % _NUM_RANKS]] for i in range(_NUM_CARDS)], dtype=np.int64)
+
+# 랭크 필드마다 최하위 비트만 켠 마스크 (랭크 r은 비트 3r)
+_RANK_LOW = sum(1 << (3 * r) for r in range(_NUM_RANKS))
+_SUIT_LOW = sum(1 << (4 * s) for s in range(len(SUITS)))
+_ROYAL_MASK = sum(1 << (3 * RANKS.index(rank)) for rank in ('10', 'Jack', 'Queen', 'King', 'Ace'))
+_WHEEL_MASK = sum(1 << (3 * r) for r in (0, 1, 2, 3, _NUM_RANKS - 1))  # A-2-3-4-5
+
+
+def cards_to_array(hands: Sequence[Sequence[Card]]) -> np.ndarray:
+    """Card 목록들을 (N, k) 카드 id 배열로 변환 (모든 패의 장수가 같아야 함)"""
+    return np.array([[card.id for card in hand] for hand in hands], dtype=np.int64).reshape(len(hands), -1)
+
+
+def score_batch(cards: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """(N, k) 카드 id 배열의 (점수, 족보 코드, 합계, 배율) 배열"""
+    cards = np.asarray(cards, dtype=np.int64)
+    if cards.ndim != 2:
+        raise ValueError("cards must be a 2-D (N, k) array")
+    if cards.shape[1] > MAX_BATCH_CARDS:
+        raise ValueError(f"at most {MAX_BATCH_CARDS} cards per hand")
+    if cards.size and (cards.min() < 0 or cards.max() >= _NUM_CARDS):
+        raise ValueError("card ids must be in 0..51")
+
+    codes = np.empty(len(cards), dtype=np.int64)
+    totals = np.empty(len(cards), dtype=np.int64)
+    for start in range(0, len(cards), CHUNK_SIZE):
+        chunk = cards[start:start + CHUNK_SIZE]
+        codes[start:start + len(chunk)], totals[start:start + len(chunk)] = _score_chunk(chunk)
+
+    multipliers = MULTIPLIERS[codes]
+    return totals * multipliers, codes, totals, multipliers
+
+
+def _score_chunk(cards: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # 행마다 랭크/무늬별 장수를 정수 하나의 비트 필드로 누적 (N, 13) 히스토그램 불필요
+    ranks = _RANK_FIELDS[cards].sum(axis=1)
+    suits = _SUIT_FIELDS[cards].sum(axis=1)
+
+    bit0 = ranks & _RANK_LOW
+    bit1 = (ranks >> 1) & _RANK_LOW
+    bit2 = (ranks >> 2) & _RANK_LOW
+    mask = bit0 | bit1 | bit2  # 랭크가 있으면 비트 3r
+    pairs = np.bitwise_count(bit1 & ~bit0)  # 장수 2 (한 랭크 최대 4장이므로 bit2와 배타)
+    triples = np.bitwise_count(bit1 & bit0)  # 장수 3
+    quads = bit2 != 0  # 장수 4
+
+    run = mask & (mask >> 3) & (mask >> 6) & (mask >> 9) & (mask >> 12)
+    straight = (run != 0) | ((mask & _WHEEL_MASK) == _WHEEL_MASK)
+    royal = (mask & _ROYAL_MASK) == _ROYAL_MASK
+    # 무늬 필드 값이 5 이상: bit3 또는 (bit2 그리고 bit0/bit1)
+    flush = (((suits >> 3) | ((suits >> 2) & (suits | (suits >> 1)))) & _SUIT_LOW) != 0
+
+    conditions = [
+        flush & royal,
+        flush & straight,
+        quads,
+        (triples == 2) | ((triples == 1) & (pairs >= 1)),
+        flush,
+        straight,
+        (triples == 1) & (pairs == 0),
+        pairs >= 2,
+        pairs == 1,
+    ]
+    choices = [HAND_TYPE_CODES[hand_type] for hand_type in HAND_TYPE_NAMES[:-1]]
+    codes = np.select(conditions, choices, default=HAND_TYPE_CODES['High Card'])
+    totals = _CARD_VALUES[cards].sum(axis=1)
+    return codes, totals
+
+
+def score_tuples(cards: np.ndarray) -> List[Tuple[int, str, int, int]]:
+    """Hand.analyze와 같은 형태의 튜플 목록"""
+    scores, codes, totals, multipliers = score_batch(cards)
+    return [(int(s), HAND_TYPE_NAMES[c], int(t), int(m))
+            for s, c, t, m in zip(scores, codes, totals, multipliers)]
@@ -1,31 +1,83 @@
 """
 카드 관련 클래스 정의
 """
-from dataclasses import dataclass
-from typing import Dict
+from typing import Dict, List, Tuple
 from config.settings import RANKS, SUITS, RANK_VALUES
 
-@dataclass
+
 class Card:
-    """카드 클래스"""
-    suit: str
-    rank: str
-
-    def __post_init__(self):
-        """유효성 검사"""
-        if self.suit not in SUITS:
-            raise ValueError(f"Invalid suit: {self.suit}")
-        if self.rank not in RANKS:
-            raise ValueError(f"Invalid rank: {self.rank}")
-
-    @property
-    def value(self) -> int:
-        """카드의 숫자 값을 반환"""
-        return RANK_VALUES[self.rank]
+    """카드 클래스
+
+    52장은 모듈 로드 시 한 번만 만들어지는 불변 싱글턴이다.
+    `Card(suit, rank)`는 새 객체를 만들지 않고 미리 만든 카드를 반환하며,
+    id는 무늬 인덱스 * 13 + 랭크 인덱스 (0~51)다.
+    """
+    __slots__ = ('suit', 'rank', 'value', 'id')
+
+    def __new__(cls, suit: str, rank: str) -> 'Card':
+        try:
+            return _CARDS_BY_KEY[(suit, rank)]
+        except (KeyError, TypeError):
+            pass
+        # 유효성 검사
+        if suit not in SUITS:
+            raise ValueError(f"Invalid suit: {suit}")
+        raise ValueError(f"Invalid rank: {rank}")
+
+    @classmethod
+    def _create(cls, card_id: int, suit: str, rank: str) -> 'Card':
+        """싱글턴 생성 (모듈 로드 시에만 사용)"""
+        card = object.__new__(cls)
+        object.__setattr__(card, 'suit', suit)
+        object.__setattr__(card, 'rank', rank)
+        object.__setattr__(card, 'value', RANK_VALUES[rank])
+        object.__setattr__(card, 'id', card_id)
+        return card
+
+    @classmethod
+    def from_id(cls, card_id: int) -> 'Card':
+        """id로 카드 반환"""
+        return _CARDS[card_id]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, str]) -> 'Card':
+        """딕셔너리로 카드 반환"""
+        card = _CARDS_BY_KEY.get((data['suit'], data['rank']))
+        return card if card is not None else cls(data['suit'], data['rank'])
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Card is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Card is immutable")
+
+    def __hash__(self) -> int:
+        return self.id
+
+    def __reduce__(self):
+        return (Card.from_id, (self.id,))
+
+    def __repr__(self) -> str:
+        return f"Card(suit={self.suit!r}, rank={self.rank!r})"
 
     def to_dict(self) -> Dict[str, str]:
         """카드를 딕셔너리로 변환"""
         return {
             'suit': self.suit,
             'rank': self.rank
-        } 
\ No newline at end of file
+        }
+
+
+_CARDS: Tuple[Card, ...] = tuple(
+    Card._create(s * len(RANKS) + r, suit, rank)
+    for s, suit in enumerate(SUITS)
+    for r, rank in enumerate(RANKS)
+)
+_CARDS_BY_KEY: Dict[Tuple[str, str], Card] = {
+    (card.suit, card.rank): card for card in _CARDS
+}
+
+
+def full_deck() -> List[Card]:
+    """52장 덱 (id 순서)"""
+    return list(_CARDS)
@@ -0,0 +1,189 @@
+"""
+게임 상태 바이너리 코덱
+
+세션 쿠키에 들어가는 게임 상태를 카드당 1바이트로 압축한다.
+
+형식 (버전 1, 모든 정수는 부호 없는 값):
+    version(1) current_turn(1, 0=None) max_turns(1) winner(str)
+    player_count(1) + 플레이어별:
+        name(str) hand(cards) deck(cards) score(score) previous_score(score)
+        discarded(cards) drawn(cards)
+
+    str   = 길이(1, 0xFF=None) + UTF-8 바이트
+    cards = 장수(1) + 카드 id(장수 바이트)
+    score = 족보 인덱스(1, 0xFF=None) + 합계(2, big-endian)
+            점수는 합계 * 배율로 복원한다.
+
+형식 (버전 2, 시드로 시작한 게임):
+    version(1) max_turns(1) seed(8, big-endian) action_count(1) actions(action_count)
+
+    action = 교체 순서대로 버린 카드 인덱스의 비트마스크 (비트 i = 인덱스 i, 0이면 넘김)
+    상태는 시드로 덱을 다시 만들고 행동을 재생해 복원한다.
+
+형식 (버전 3, 기본 좌석이 아닌 게임):
+    version(1) max_turns(1) seed(8, big-endian) layout(1) computers(1)
+    action_count(1) actions(action_count)
+
+    layout    = 좌석 수 - 1 (하위 4비트) | 덱 정책 인덱스 << 4
+    computers = 컴퓨터 좌석 비트마스크 (비트 i = 좌석 i)
+    좌석 이름은 좌석 수와 비트마스크로 정해지므로 저장하지 않는다 (game.seat_names).
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from app.models.card import Card
+from app.models.player import Player
+from config.settings import HAND_RANKINGS
+
+CODEC_VERSION = 1
+REPLAY_VERSION = 2
+SEATED_REPLAY_VERSION = 3
+
+# 행동 하나(1바이트)로 표현할 수 있는 최대 패 장수
+MAX_ACTION_CARDS = 8
+
+_NONE = 0xFF
+_HAND_TYPE_INDEX = {hand_type: i for i, (hand_type, _) in enumerate(HAND_RANKINGS)}
+
+
+def encode_state(current_turn: Optional[int], max_turns: int, winner: Optional[str],
+                 players: Dict[str, Player]) -> bytes:
+    """게임 상태를 바이트열로 인코딩"""
+    out = bytearray((CODEC_VERSION, current_turn or 0, max_turns))
+    _write_str(out, winner)
+    out.append(len(players))
+    for player in players.values():
+        _write_str(out, player.name)
+        _write_cards(out, [card.id for card in player.hand])
+        _write_cards(out, [card.id for card in player.deck])
+        _write_score(out, player.score)
+        _write_score(out, player.previous_score)
+        _write_cards(out, [Card.from_dict(c).id for c in player.card_changes['discarded']])
+        _write_cards(out, [Card.from_dict(c).id for c in player.card_changes['drawn']])
+    return bytes(out)
+
+
+def decode_state(data: bytes) -> Tuple[Optional[int], int, Optional[str], Dict[str, Player]]:
+    """바이트열을 (current_turn, max_turns, winner, players)로 디코딩"""
+    if not data or data[0] != CODEC_VERSION:
+        raise ValueError(f"Unsupported game state version: {data[:1]!r}")
+    try:
+        current_turn = data[1] or None
+        max_turns = data[2]
+        winner, pos = _read_str(data, 3)
+        players = {}
+        count = data[pos]
+        pos += 1
+        for _ in range(count):
+            name, pos = _read_str(data, pos)
+            player = Player(name)
+            player.hand, pos = _read_cards(data, pos)
+            player.deck, pos = _read_cards(data, pos)
+            player.score, pos = _read_score(data, pos)
+            player.previous_score, pos = _read_score(data, pos)
+            discarded, pos = _read_cards(data, pos)
+            drawn, pos = _read_cards(data, pos)
+            player.card_changes = {
+                'discarded': [card.to_dict() for card in discarded],
+                'drawn': [card.to_dict() for card in drawn]
+            }
+            players[name] = player
+    except IndexError:
+        raise ValueError("Truncated game state")
+    return current_turn, max_turns, winner, players
+
+
+def encode_replay(seed: int, max_turns: int, actions: bytes) -> bytes:
+    """시드와 행동 로그를 바이트열로 인코딩"""
+    if len(actions) > 0xFF:
+        raise ValueError("Too many actions")
+    return bytes((REPLAY_VERSION, max_turns)) + seed.to_bytes(8, 'big') + bytes((len(actions),)) + actions
+
+
+def decode_replay(data: bytes) -> Tuple[int, int, bytes]:
+    """바이트열을 (seed, max_turns, actions)로 디코딩"""
+    if not data or data[0] != REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version: {data[:1]!r}")
+    if len(data) < 11 or len(data) != 11 + data[10]:
+        raise ValueError("Truncated replay")
+    return int.from_bytes(data[2:10], 'big'), data[1], bytes(data[11:])
+
+
+def encode_seated_replay(seed: int, max_turns: int, actions: bytes,
+                         seat_count: int, computer_mask: int, policy: int) -> bytes:
+    """좌석 구성과 시드, 행동 로그를 바이트열로 인코딩"""
+    if len(actions) > 0xFF:
+        raise ValueError("Too many actions")
+    if not 1 <= seat_count <= 16 or not 0 <= policy < 16 or not 0 <= computer_mask < 1 << seat_count:
+        raise ValueError("Invalid seat layout")
+    return (bytes((SEATED_REPLAY_VERSION, max_turns)) + seed.to_bytes(8, 'big')
+            + bytes((seat_count - 1 | policy << 4, computer_mask, len(actions))) + actions)
+
+
+def decode_seated_replay(data: bytes) -> Tuple[int, int, bytes, int, int, int]:
+    """바이트열을 (seed, max_turns, actions, seat_count, computer_mask, policy)로 디코딩"""
+    if not data or data[0] != SEATED_REPLAY_VERSION:
+        raise ValueError(f"Unsupported replay version: {data[:1]!r}")
+    if len(data) < 13 or len(data) != 13 + data[12]:
+        raise ValueError("Truncated replay")
+    return (int.from_bytes(data[2:10], 'big'), data[1], bytes(data[13:]),
+            (data[10] & 0x0F) + 1, data[11], data[10] >> 4)
+
+
+def encode_action(indices: Iterable[int]) -> int:
+    """버린 카드 인덱스를 행동 바이트로 변환"""
+    mask = 0
+    for index in indices:
+        if not 0 <= index < MAX_ACTION_CARDS:
+            raise ValueError(f"Card index out of range: {index}")
+        mask |= 1 << index
+    return mask
+
+
+def decode_action(action: int) -> List[int]:
+    """행동 바이트를 버린 카드 인덱스 목록으로 변환"""
+    return [i for i in range(MAX_ACTION_CARDS) if action >> i & 1]
+
+
+def _write_str(out: bytearray, value: Optional[str]) -> None:
+    if value is None:
+        out.append(_NONE)
+        return
+    encoded = value.encode('utf-8')
+    out.append(len(encoded))
+    out += encoded
+
+
+def _read_str(data: bytes, pos: int) -> Tuple[Optional[str], int]:
+    length = data[pos]
+    if length == _NONE:
+        return None, pos + 1
+    end = pos + 1 + length
+    return bytes(data[pos + 1:end]).decode('utf-8'), end
+
+
+def _write_cards(out: bytearray, ids: List[int]) -> None:
+    out.append(len(ids))
+    out += bytes(ids)
+
+
+def _read_cards(data: bytes, pos: int) -> Tuple[List[Card], int]:
+    end = pos + 1 + data[pos]
+    if end > len(data):
+        raise IndexError(end)
+    return [Card.from_id(card_id) for card_id in data[pos + 1:end]], end
+
+
+def _write_score(out: bytearray, score: Optional[Tuple[int, str, int, int]]) -> None:
+    if score is None:
+        out += bytes((_NONE, 0, 0))
+        return
+    out.append(_HAND_TYPE_INDEX[score[1]])
+    out += score[2].to_bytes(2, 'big')
+
+
+def _read_score(data: bytes, pos: int) -> Tuple[Optional[Tuple[int, str, int, int]], int]:
+    index = data[pos]
+    if index == _NONE:
+        return None, pos + 3
+    hand_type, multiplier = HAND_RANKINGS[index]
+    total = int.from_bytes(data[pos + 1:pos + 3], 'big')
+    return (total * multiplier, hand_type, total, multiplier), pos + 3
@@ -0,0 +1,142 @@
+"""
+몬테카를로 교체 기대값 엔진
+
+남은 덱에서 뽑힐 카드를 표본 추출해 각 교체 조합(버릴 카드 인덱스 집합)의
+기대 점수를 추정한다. 모든 후보가 같은 표본(덱 순열)을 공유하고,
+표본마다 뽑힌 카드의 소수 곱/무늬 합을 누적해 두므로
+후보 하나의 평가는 테이블 조회 한 번이다.
+표본을 라운드 단위로 늘리며 신뢰구간 상 열세인 후보는 중간에 제외한다.
+"""
+import math
+import random
+import time
+from typing import List, Optional, Sequence, Tuple
+from app.models.card import Card
+from app.models.evaluator import CARD_PRIMES, CARD_SUIT_FIELDS, get_tables
+
+# 라운드당 표본 수
+BATCH_SIZE = 16
+
+# 가지치기 신뢰구간 폭 (표준오차 배수)
+PRUNE_Z = 3.0
+
+# 가지치기를 시작하는 최소 표본 수
+PRUNE_MIN_SAMPLES = 32
+
+
+class DiscardEstimate:
+    """교체 조합별 추정 결과"""
+    __slots__ = ('indices', 'mean', 'samples', '_sum', '_sum_sq')
+
+    def __init__(self, indices: Tuple[int, ...]):
+        self.indices = indices
+        self.mean = 0.0
+        self.samples = 0
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    def add(self, total: float, total_sq: float, count: int) -> None:
+        self._sum += total
+        self._sum_sq += total_sq
+        self.samples += count
+        self.mean = self._sum / self.samples
+
+    @property
+    def stderr(self) -> float:
+        """평균의 표준오차"""
+        if self.samples < 2:
+            return math.inf
+        variance = max(self._sum_sq / self.samples - self.mean ** 2, 0.0)
+        return math.sqrt(variance / self.samples)
+
+    def __repr__(self) -> str:
+        return f"DiscardEstimate(indices={self.indices}, mean={self.mean:.1f}, samples={self.samples})"
+
+
+def candidate_discards(hand_size: int, max_discard: Optional[int] = None) -> List[Tuple[int, ...]]:
+    """버릴 수 있는 모든 인덱스 조합 (적게 버리는 순)"""
+    limit = hand_size if max_discard is None else min(max_discard, hand_size)
+    candidates = []
+    for mask in range(1 << hand_size):
+        indices = tuple(i for i in range(hand_size) if mask >> i & 1)
+        if len(indices) <= limit:
+            candidates.append(indices)
+    candidates.sort(key=len)
+    return candidates
+
+
+def estimate_discards(hand: Sequence[Card], deck: Sequence[Card],
+                      samples: int = 400, time_budget: Optional[float] = None,
+                      max_discard: Optional[int] = None,
+                      rng: Optional[random.Random] = None) -> List[DiscardEstimate]:
+    """교체 조합별 기대 점수 추정 (기대값 내림차순)
+
+    samples는 후보당 최대 표본 수, time_budget은 초 단위 상한이다.
+    가지치기로 제외된 후보는 그때까지의 표본으로 추정한 값을 갖는다.
+    """
+    rng = rng or random
+    deadline = time.perf_counter() + time_budget if time_budget else None
+    rank_table, flush_table = get_tables()
+
+    hand_ids = [card.id for card in hand]
+    deck_ids = [card.id for card in deck]
+    estimates = [DiscardEstimate(indices) for indices in candidate_discards(len(hand_ids), max_discard)]
+
+    # 후보별 남기는 카드의 키/무늬 합과 실제로 뽑게 될 장수
+    kept = []
+    for estimate in estimates:
+        key, suits = 1, 0
+        for i, card_id in enumerate(hand_ids):
+            if i not in estimate.indices:
+                key *= CARD_PRIMES[card_id]
+                suits += CARD_SUIT_FIELDS[card_id]
+        kept.append((key, suits, min(len(estimate.indices), len(deck_ids))))
+
+    # 뽑는 카드가 없는 후보는 결과가 확정적
+    active = []
+    fixed_best = -math.inf
+    for estimate, (key, suits, draws) in zip(estimates, kept):
+        if draws == 0:
+            score = rank_table[key][flush_table[suits]][0]
+            estimate.add(score * samples, score * score * samples, samples)
+            fixed_best = max(fixed_best, score)
+        else:
+            active.append((estimate, key, suits, draws))
+
+    while active and active[0][0].samples < samples:
+        batch = min(BATCH_SIZE, samples - active[0][0].samples)
+        max_draws = max(draws for _, _, _, draws in active)
+        prefixes = []
+        for _ in range(batch):
+            drawn = rng.sample(deck_ids, max_draws)
+            key_prefix, suit_prefix = [1], [0]
+            for card_id in drawn:
+                key_prefix.append(key_prefix[-1] * CARD_PRIMES[card_id])
+                suit_prefix.append(suit_prefix[-1] + CARD_SUIT_FIELDS[card_id])
+            prefixes.append((key_prefix, suit_prefix))
+
+        for estimate, key, suits, draws in active:
+            total = total_sq = 0
+            for key_prefix, suit_prefix in prefixes:
+                score = rank_table[key * key_prefix[draws]][flush_table[suits + suit_prefix[draws]]][0]
+                total += score
+                total_sq += score * score
+            estimate.add(total, total_sq, batch)
+
+        if deadline is not None and time.perf_counter() >= deadline:
+            break
+        if active[0][0].samples < PRUNE_MIN_SAMPLES:
+            continue
+
+        # 최선 후보의 하한보다 상한이 낮은 후보 제외 (확정 후보 포함)
+        best_lower = max(fixed_best, max(e.mean - PRUNE_Z * e.stderr for e, _, _, _ in active))
+        active = [item for item in active
+                  if item[0].mean + PRUNE_Z * item[0].stderr >= best_lower]
+
+    estimates.sort(key=lambda e: (-e.mean, len(e.indices)))
+    return estimates
+
+
+def best_discard(hand: Sequence[Card], deck: Sequence[Card], **options) -> List[int]:
+    """기대 점수가 가장 높은 버릴 카드 인덱스"""
+    return list(estimate_discards(hand, deck, **options)[0].indices)
@@ -0,0 +1,146 @@
+"""
+테이블 기반 패 평가기
+
+카드를 0~51 정수로 인코딩하고, 랭크별 소수의 곱(랭크 멀티셋의 고유 키)과
+무늬별 3비트 카운터의 합(플러시 여부)만으로 족보를 조회한다.
+`Hand.analyze`의 결과는 랭크 멀티셋과 플러시 여부에만 의존하므로
+두 값으로 만든 테이블이 모든 7장 조합에 대해 같은 튜플을 돌려준다.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+from config.settings import SUITS, RANKS, RANK_VALUES, HAND_RANKINGS
+
+# 테이블이 지원하는 최대 카드 수
+MAX_CARDS = 7
+
+# 랭크별 소수 (2 ~ Ace)
+RANK_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+# 무늬 카운터 한 칸의 비트 수 (최대 7장이므로 3비트)
+_SUIT_BITS = 3
+_SUIT_MASK = (1 << _SUIT_BITS) - 1
+
+_MULTIPLIERS = dict(HAND_RANKINGS)
+_ROYAL_MASK = sum(1 << RANKS.index(rank) for rank in ('10', 'Jack', 'Queen', 'King', 'Ace'))
+
+# 카드 id = 무늬 인덱스 * 13 + 랭크 인덱스 (Game.start_game의 덱 생성 순서와 동일)
+CARD_IDS: Dict[Tuple[str, str], int] = {
+    (suit, rank): s * len(RANKS) + r
+    for s, suit in enumerate(SUITS)
+    for r, rank in enumerate(RANKS)
+}
+CARD_PRIMES = tuple(RANK_PRIMES[i % len(RANKS)] for i in range(len(CARD_IDS)))
+CARD_SUIT_FIELDS = tuple(1 << (_SUIT_BITS * (i // len(RANKS))) for i in range(len(CARD_IDS)))
+
+Score = Tuple[int, str, int, int]
+
+_RANK_TABLE: Optional[Dict[int, Tuple[Score, Score]]] = None
+_FLUSH_TABLE: Optional[List[int]] = None
+
+
+def _straight_flags() -> List[bool]:
+    """13비트 랭크 마스크별 스트레이트 여부"""
+    straights = [0b11111 << low for low in range(len(RANKS) - 4)]
+    straights.append(0b1111 | (1 << (len(RANKS) - 1)))  # A-2-3-4-5
+    return [any(mask & s == s for s in straights) for mask in range(1 << len(RANKS))]
+
+
+def _classify(mask: int, straight: bool, flush: bool,
+              pairs: int, triples: int, quads: int) -> str:
+    """랭크 분포와 플러시 여부로 족보 이름 결정 (Hand.is_* 규칙과 동일)"""
+    if flush and mask & _ROYAL_MASK == _ROYAL_MASK:
+        return 'Royal Flush'
+    if flush and straight:
+        return 'Straight Flush'
+    if quads:
+        return 'Four of a Kind'
+    if triples == 2 or (triples == 1 and pairs >= 1):
+        return 'Full House'
+    if flush:
+        return 'Flush'
+    if straight:
+        return 'Straight'
+    if triples == 1 and pairs == 0:
+        return 'Three of a Kind'
+    if pairs >= 2:
+        return 'Two Pair'
+    if pairs == 1:
+        return 'Pair'
+    return 'High Card'
+
+
+def _score(hand_type: str, total: int) -> Score:
+    multiplier = _MULTIPLIERS[hand_type]
+    return (total * multiplier, hand_type, total, multiplier)
+
+
+def _build_tables() -> None:
+    """랭크 멀티셋 테이블과 플러시 테이블 생성"""
+    global _RANK_TABLE, _FLUSH_TABLE
+    straight_flags = _straight_flags()
+    values = [RANK_VALUES[rank] for rank in RANKS]
+    table: Dict[int, Tuple[Score, Score]] = {}
+
+    # 랭크를 하나씩 정하며 키/마스크/합계/페어 수를 누적
+    def fill(index: int, remaining: int, key: int, mask: int, total: int,
+             pairs: int, triples: int, quads: int) -> None:
+        if index == len(RANKS):
+            straight = straight_flags[mask]
+            table[key] = (
+                _score(_classify(mask, straight, False, pairs, triples, quads), total),
+                _score(_classify(mask, straight, True, pairs, triples, quads), total),
+            )
+            return
+        prime = RANK_PRIMES[index]
+        value = values[index]
+        bit = 1 << index
+        fill(index + 1, remaining, key, mask, total, pairs, triples, quads)
+        for count in range(1, min(4, remaining) + 1):
+            key *= prime
+            fill(index + 1, remaining - count, key, mask | bit, total + value * count,
+                 pairs + (count == 2), triples + (count == 3), quads + (count == 4))
+
+    fill(0, MAX_CARDS, 1, 0, 0, 0, 0, 0)
+
+    flush_table = [0] * (1 << (_SUIT_BITS * len(SUITS)))
+    for fields in range(len(flush_table)):
+        flush_table[fields] = int(any(
+            (fields >> (_SUIT_BITS * s)) & _SUIT_MASK >= 5 for s in range(len(SUITS))
+        ))
+
+    _RANK_TABLE = table
+    _FLUSH_TABLE = flush_table
+
+
+def get_tables() -> Tuple[Dict[int, Tuple[Score, Score]], List[int]]:
+    """평가 테이블 반환 (최초 호출 시 테이블 파일에서 읽거나 생성)"""
+    if _RANK_TABLE is None:
+        from .table_cache import load_tables
+        if not load_tables():
+            _build_tables()
+    return _RANK_TABLE, _FLUSH_TABLE
+
+
+def evaluate_ids(card_ids: Iterable[int]) -> Score:
+    """카드 id 목록의 (점수, 족보, 합계, 배율) 반환"""
+    rank_table, flush_table = get_tables()
+    key = 1
+    suits = 0
+    for card_id in card_ids:
+        key *= CARD_PRIMES[card_id]
+        suits += CARD_SUIT_FIELDS[card_id]
+    return rank_table[key][flush_table[suits]]
+
+
+def card_id(suit: str, rank: str) -> int:
+    """무늬와 랭크로 카드 id 반환"""
+    return CARD_IDS[(suit, rank)]
+
+
+def evaluate_cards(cards) -> Score:
+    """Card 객체 목록의 (점수, 족보, 합계, 배율) 반환"""
+    return evaluate_ids([card.id for card in cards])
+
+
+def evaluate_dicts(cards) -> Score:
+    """{'suit', 'rank'} 딕셔너리 카드 목록의 (점수, 족보, 합계, 배율) 반환 (최상위 game.py 호환용)"""
+    return evaluate_ids([CARD_IDS[card['suit'], card['rank']] for card in cards])
@@ -1,56 +1,203 @@
 """
 게임 관련 클래스 정의
 """
+import hashlib
 import random
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple, Union
 from app.models.card import Card
 from app.models.player import Player
-from app.models.ai import PokerAI
-from config.settings import SUITS, RANKS, CARDS_PER_HAND, MAX_TURNS
+from app.models.ai import create_ai
+from app.models.codec import (encode_state, decode_state, encode_replay, decode_replay,
+                              encode_seated_replay, decode_seated_replay, encode_action, decode_action,
+                              REPLAY_VERSION, SEATED_REPLAY_VERSION)
+from app.models.shuffle import DECK_SIZE, counter_random, shuffled_deck
+from config.settings import CARDS_PER_HAND, MAX_TURNS, AI_STRATEGY, AI_TIME_BUDGET
+
+# 기본 좌석 (사람 한 명과 컴퓨터)
+DEFAULT_SEATS = ('Player 1', 'Computer')
+COMPUTER_SEATS = ('Computer',)
+
+# 좌석 수 범위
+MIN_SEATS = 2
+MAX_SEATS = 8
+
+# 덱 정책
+DECK_SPLIT = 'split'        # 덱 하나를 좌석 수로 나눠 각자 자기 몫에서 뽑음 (기본)
+DECK_SHARED = 'shared'      # 덱 하나에서 모두 뽑음
+DECK_PER_SEAT = 'per_seat'  # 좌석마다 52장 덱 (좌석 시드로 섞음)
+DECK_POLICIES = (DECK_SPLIT, DECK_SHARED, DECK_PER_SEAT)
+
+
+def seat_names(count: int, computer_mask: int = 0) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """좌석 수와 컴퓨터 좌석 비트마스크로 (좌석, 컴퓨터 좌석) 이름 생성
+
+    사람은 'Player 1'부터, 컴퓨터는 하나면 'Computer', 여럿이면 'Computer 1'부터 번호를 붙인다.
+    """
+    computer_count = bin(computer_mask).count('1')
+    seats, computers = [], []
+    for i in range(count):
+        if computer_mask >> i & 1:
+            name = 'Computer' if computer_count == 1 else f'Computer {len(computers) + 1}'
+            computers.append(name)
+        else:
+            name = f'Player {len(seats) - len(computers) + 1}'
+        seats.append(name)
+    return tuple(seats), tuple(computers)
+
+
+def seated_layout(count: int, computer_mask: int, policy: int) -> Tuple[Tuple[str, ...], Tuple[str, ...], str]:
+    """버전 3 세션의 (좌석 수, 컴퓨터 비트마스크, 덱 정책 번호)를 (좌석, 컴퓨터 좌석, 덱 정책)으로 변환"""
+    if not count <= MAX_SEATS or policy >= len(DECK_POLICIES):
+        raise ValueError("Invalid seat layout")
+    return (*seat_names(count, computer_mask), DECK_POLICIES[policy])
+
 
 class Game:
-    """포커 게임 클래스"""
-    def __init__(self):
+    """포커 게임 클래스
+
+    덱은 게임마다 정한 64비트 시드로 섞고, 교체(넘김 포함)는 순서대로
+    행동 로그(actions)에 1바이트씩 기록한다. 시드와 로그만으로 상태를 재생할 수 있다.
+
+    매 턴 사람 좌석이 좌석 순서대로 한 번씩 교체하고, 모두 마치면 턴이 넘어가며
+    컴퓨터 좌석이 새 턴의 교체를 한다. 좌석은 2~8개이고 덱 정책(deck_policy)으로
+    카드를 어떻게 나눌지 정한다. 교체는 덱에 남은 장수까지만 하므로(앞쪽 인덱스부터)
+    덱이 모자란 구성에서도 패는 항상 CARDS_PER_HAND장이다.
+
+    ai_time_budget은 컴퓨터 결정당 시간 상한(montecarlo)이다. None이면 표본 수로만
+    제한해 같은 rng에서 항상 같은 게임이 된다(시뮬레이션용).
+    """
+    def __init__(self, ai_strategy: str = AI_STRATEGY, rng: Optional[random.Random] = None,
+                 seed: Optional[int] = None, seats: Sequence[str] = DEFAULT_SEATS,
+                 computers: Sequence[str] = COMPUTER_SEATS, deck_policy: str = DECK_SPLIT,
+                 ai_time_budget: Optional[float] = AI_TIME_BUDGET):
+        self._set_seats(seats, computers, deck_policy)
+        self.ai_strategy = ai_strategy
+        self.ai_time_budget = ai_time_budget
+        self.rng = rng or random
+        self._next_seed = seed  # 다음 start_game에 사용할 시드 (없으면 rng로 생성)
+        self._replay: Optional[Iterator[int]] = None
+        self._version: Optional[str] = None  # 마지막 저장 이후 바뀌지 않았을 때의 state_version
         self.reset_game()
 
+    def _set_seats(self, seats: Sequence[str], computers: Sequence[str], deck_policy: str) -> None:
+        """좌석 구성 검증 및 설정"""
+        if not MIN_SEATS <= len(seats) <= MAX_SEATS or len(set(seats)) != len(seats):
+            raise GameError(f"서로 다른 좌석 {MIN_SEATS}~{MAX_SEATS}개가 필요합니다")
+        if deck_policy not in DECK_POLICIES:
+            raise GameError(f"알 수 없는 덱 정책입니다: {deck_policy}")
+        if deck_policy == DECK_SPLIT and DECK_SIZE // len(seats) < CARDS_PER_HAND \
+                or deck_policy == DECK_SHARED and DECK_SIZE < len(seats) * CARDS_PER_HAND:
+            raise GameError(f"좌석 {len(seats)}개에 나눌 카드가 부족합니다 ({deck_policy})")
+        self.seats = tuple(seats)
+        self.computers = tuple(seat for seat in self.seats if seat in computers)
+        self.humans = tuple(seat for seat in self.seats if seat not in computers)
+        if not self.humans:
+            raise GameError("사람 좌석이 하나 이상 필요합니다")
+        self.deck_policy = deck_policy
+
+    def _layout(self) -> Optional[Tuple[int, int]]:
+        """(좌석 수, 컴퓨터 비트마스크), 좌석 이름이 seat_names 규칙과 다르면 None"""
+        mask = sum(1 << i for i, seat in enumerate(self.seats) if seat in self.computers)
+        if seat_names(len(self.seats), mask) != (self.seats, self.computers):
+            return None
+        return len(self.seats), mask
+
     def reset_game(self) -> None:
         """게임 완전 초기화"""
         self.players = {}
         self.current_turn = None
         self.max_turns = MAX_TURNS
         self.winner = None
+        self.seed: Optional[int] = None  # 이전 형식에서 불러온 게임은 None
+        self.actions = bytearray()
+        self._acting = 0  # 이번 턴에 교체할 사람 좌석 인덱스
         
         # 추가 상태 초기화
         if hasattr(self, 'previous_scores'):
             self.previous_scores = {}
         if hasattr(self, 'card_changes'):
             self.card_changes = {}
-        
-    def save_to_session(self) -> Dict[str, Any]:
-        """게임 상태를 세션에 저장할 수 있는 형태로 변환"""
-        return {
-            'players': {
-                name: {
-                    'name': player.name,
-                    'hand': [card.to_dict() for card in player.hand],
-                    'deck': [card.to_dict() for card in player.deck],
-                    'score': player.score,
-                    'previous_score': player.previous_score,
-                    'card_changes': player.card_changes
-                } for name, player in self.players.items()
-            },
-            'current_turn': self.current_turn,
-            'max_turns': self.max_turns,
-            'winner': self.winner
-        }
-        
-    def load_from_session(self, data: Dict[str, Any]) -> None:
-        """세션에서 게임 상태 복원"""
+        self._dirty = True
+
+    @property
+    def dirty(self) -> bool:
+        """마지막 저장/로드 이후 상태가 바뀌었는지 여부"""
+        return self._dirty or any(player.dirty for player in self.players.values())
+
+    def mark_clean(self, data: Optional[bytes] = None) -> None:
+        """저장 완료 표시 (data는 방금 저장한 save_to_session 결과, 주면 버전을 다시 만들지 않음)"""
+        self._dirty = False
+        for player in self.players.values():
+            player.dirty = False
+        self._version = _version_of(data) if data is not None else None
+
+    @property
+    def waiting_for(self) -> Optional[str]:
+        """교체(또는 넘김)를 기다리는 사람 좌석 (진행 중이 아니면 None)"""
+        if self.current_turn is None:
+            return None
+        return self.humans[self._acting]
+
+    def save_to_session(self) -> bytes:
+        """게임 상태를 세션에 저장할 수 있는 바이트열로 변환 (시드가 있으면 시드와 행동 로그만)
+
+        기본 좌석 게임은 버전 2, 그 밖의 좌석 구성은 좌석 정보를 더한 버전 3으로 저장한다.
+        """
+        default = self.seats == DEFAULT_SEATS and self.computers == COMPUTER_SEATS \
+            and self.deck_policy == DECK_SPLIT
+        if default and self.seed is None:
+            return encode_state(self.current_turn, self.max_turns, self.winner, self.players)
+        layout = self._layout()
+        if layout is None or self.seed is None:
+            raise GameError("seat_names 규칙을 따르는 시드 게임만 세션에 저장할 수 있습니다")
+        if default:
+            return encode_replay(self.seed, self.max_turns, bytes(self.actions))
+        return encode_seated_replay(self.seed, self.max_turns, bytes(self.actions),
+                                    *layout, DECK_POLICIES.index(self.deck_policy))
+
+    def state_version(self) -> str:
+        """상태 내용으로 만든 버전 문자열 (같은 상태면 같은 값, ETag용)
+
+        바뀌지 않은 상태의 버전은 다시 바뀔 때까지 기억해 두고 인코딩하지 않는다.
+        """
+        if self.dirty:
+            return _version_of(self.save_to_session())
+        if self._version is None:
+            self._version = _version_of(self.save_to_session())
+        return self._version
+
+    def load_from_session(self, data: Union[bytes, Dict[str, Any]]) -> None:
+        """세션에서 게임 상태 복원 (바이트열이면 그 내용으로 state_version을 정함)"""
+        saved = None
         if not data:
             self.reset_game()
-            return
-            
+        elif isinstance(data, dict):
+            # 이전 버전의 딕셔너리 형식 세션
+            self._load_from_dict(data)
+        else:
+            try:
+                if data[0] == REPLAY_VERSION:
+                    seed, max_turns, actions = decode_replay(data)
+                    self._set_seats(DEFAULT_SEATS, COMPUTER_SEATS, DECK_SPLIT)
+                    self._replay_game(seed, max_turns, actions)
+                elif data[0] == SEATED_REPLAY_VERSION:
+                    seed, max_turns, actions, *layout = decode_seated_replay(data)
+                    self._set_seats(*seated_layout(*layout))
+                    self._replay_game(seed, max_turns, actions)
+                else:
+                    self._set_seats(DEFAULT_SEATS, COMPUTER_SEATS, DECK_SPLIT)
+                    self.reset_game()
+                    self.current_turn, self.max_turns, self.winner, self.players = decode_state(data)
+                saved = bytes(data)
+            except (ValueError, GameError):
+                # 알 수 없는 버전이나 손상된 데이터는 새 게임으로 처리
+                self.reset_game()
+        self.mark_clean(saved)
+
+    def _load_from_dict(self, data: Dict[str, Any]) -> None:
+        """딕셔너리 형식 세션에서 게임 상태 복원"""
+        self.reset_game()
         self.current_turn = data.get('current_turn')
         self.max_turns = data.get('max_turns', MAX_TURNS)
         self.winner = data.get('winner')
@@ -58,85 +205,188 @@ class Game:
         self.players = {}
         for name, player_data in data.get('players', {}).items():
             player = Player(player_data['name'])
-            player.hand = [Card(**card_dict) for card_dict in player_data['hand']]
-            player.deck = [Card(**card_dict) for card_dict in player_data['deck']]
+            player.hand = [Card.from_dict(card_dict) for card_dict in player_data['hand']]
+            player.deck = [Card.from_dict(card_dict) for card_dict in player_data['deck']]
             player.score = player_data['score']
             player.previous_score = player_data['previous_score']
             player.card_changes = player_data['card_changes']
             self.players[name] = player
 
+    @classmethod
+    def replay(cls, seed: int, actions: bytes, max_turns: int = MAX_TURNS,
+               ai_strategy: str = AI_STRATEGY) -> 'Game':
+        """시드와 행동 로그(플레이어 차례에서 끝나는 앞부분만 주어도 됨)로 게임 상태 재생"""
+        game = cls(ai_strategy)
+        game._replay_game(seed, max_turns, actions)
+        game.mark_clean()
+        return game
+
+    @classmethod
+    def replay_steps(cls, seed: int, actions: bytes, max_turns: int = MAX_TURNS,
+                     ai_strategy: str = AI_STRATEGY, seats: Sequence[str] = DEFAULT_SEATS,
+                     computers: Sequence[str] = COMPUTER_SEATS,
+                     deck_policy: str = DECK_SPLIT) -> Iterator['Game']:
+        """재생하며 플레이어 차례마다(마지막은 로그를 모두 적용한 뒤) 같은 게임 객체 반환"""
+        game = cls(ai_strategy, seats=seats, computers=computers, deck_policy=deck_policy)
+        yield from game._replay_steps(seed, max_turns, actions)
+
+    def _replay_game(self, seed: int, max_turns: int, actions: bytes) -> None:
+        """로그를 모두 적용한 상태로 재생"""
+        for _ in self._replay_steps(seed, max_turns, actions):
+            pass
+
+    def _replay_steps(self, seed: int, max_turns: int, actions: bytes) -> Iterator['Game']:
+        """새 게임을 seed로 시작하고 로그의 행동을 순서대로 적용"""
+        self.reset_game()
+        self.max_turns = max_turns
+        self._next_seed = seed
+        self.start_game()
+        # 플레이어 차례는 이 반복문이, 컴퓨터 차례는 _handle_computer_turn이 같은 반복자에서 읽음
+        replay = iter(actions)
+        for action in replay:
+            if self.current_turn is None:
+                raise ValueError("Actions continue after the game ended")
+            yield self
+            self._replay = replay
+            try:
+                self.discard_cards(self.waiting_for, decode_action(action))
+            finally:
+                self._replay = None
+        yield self
+
     def start_game(self) -> None:
         """게임 시작"""
         if self.current_turn is not None and self.current_turn > 1:
             return
 
         # 플레이어 초기화
-        self.players = {
-            'Player 1': Player('Player 1'),
-            'Computer': Player('Computer')
-        }
+        self.players = {seat: Player(seat) for seat in self.seats}
 
-        # 덱 생성 및 섞기
+        # 시드로 덱 생성 및 섞기
         try:
-            full_deck = [Card(suit, rank) for suit in SUITS for rank in RANKS]
-            random.shuffle(full_deck)
-
-            # 각 플레이어에게 덱 분배
-            deck_size = len(full_deck) // 2
-            self.players['Player 1'].deck = full_deck[:deck_size]
-            self.players['Computer'].deck = full_deck[deck_size:]
+            seed = self._next_seed if self._next_seed is not None else self.rng.getrandbits(64)
+            self._next_seed = None
+            self.seed = seed
+            self.actions = bytearray()
+            self._deal(seed)
 
             # 초기 카드 분배
             for player in self.players.values():
                 player.draw_initial_cards(CARDS_PER_HAND)
 
             self.current_turn = 1
+            self._dirty = True
         except Exception as e:
             raise GameError(f"게임 시작 중 오류 발생: {str(e)}")
 
+    def _deal(self, seed: int) -> None:
+        """덱 정책에 따라 각 플레이어의 덱 지정"""
+        players = list(self.players.values())
+        if self.deck_policy == DECK_PER_SEAT:
+            # 좌석 i의 덱은 시드의 i번째 난수로 섞음
+            for i, player in enumerate(players):
+                player.deck = shuffled_deck(counter_random(seed, i))
+            return
+        deck = shuffled_deck(seed)
+        if self.deck_policy == DECK_SHARED:
+            # 같은 리스트를 공유하므로 모두 같은 덱의 끝에서부터 뽑음
+            for player in players:
+                player.deck = deck
+            return
+        # 좌석 순서대로 같은 장수씩 (두 좌석이면 절반씩, 남는 카드는 쓰지 않음)
+        share = len(deck) // len(players)
+        for i, player in enumerate(players):
+            player.deck = deck[i * share:(i + 1) * share]
+
     def discard_cards(self, player_name: str, indices: List[int]) -> None:
         """카드 버리기"""
-        if not indices:
-            self.next_turn()
-            return
+        if self.current_turn is None:
+            return  # 종료된 게임의 패는 바꾸지 않음
+        self._check_turn(player_name)
 
         player = self.players[player_name]
+        # 중복/범위 밖 인덱스와 덱에 남은 장수를 넘는 인덱스는 무시 (행동 로그와 실제 교체가 같도록)
+        indices = _drawable(player, {i for i in indices if 0 <= i < len(player.hand)})
+        if not indices:
+            self.next_turn(player_name)
+            return
         player.discard_cards(indices)
-        self.next_turn()
+        self._record_action(indices)
+        self._advance_turn()
 
-    def next_turn(self) -> None:
-        """다음 턴으로 진행"""
+    def next_turn(self, player_name: Optional[str] = None) -> None:
+        """교체 없이 넘김 (player_name이 없으면 기다리는 좌석)"""
         # current_turn이 None인 경우(게임이 종료된 경우) 처리
         if self.current_turn is None:
             return  # 게임이 이미 종료된 경우 아무 작업도 하지 않음
-        
+        if player_name is not None:
+            self._check_turn(player_name)
+        self._record_action(())
+        self._advance_turn()
+
+    def _check_turn(self, player_name: str) -> None:
+        if player_name != self.waiting_for:
+            raise GameError(f"{player_name}의 차례가 아닙니다")
+
+    def _record_action(self, indices) -> None:
+        """행동 로그에 교체 기록 (시드로 시작한 게임만)"""
+        if self.seed is not None:
+            self.actions.append(encode_action(indices))
+
+    def _advance_turn(self) -> None:
+        """다음 사람 좌석 또는 다음 턴으로 진행"""
+        self._dirty = True
+        self._acting += 1
+        if self._acting < len(self.humans):
+            return
+        self._acting = 0
         if self.current_turn < self.max_turns:
             self.current_turn += 1
-            self._handle_computer_turn()
+            for name in self.computers:
+                self._handle_computer_turn(name)
         else:
             self.determine_winner()
 
-    def _handle_computer_turn(self) -> None:
+    def _handle_computer_turn(self, name: str = 'Computer') -> None:
         """컴퓨터의 턴 처리"""
-        computer = self.players['Computer']
-        ai = PokerAI(computer.hand)
-        indices_to_discard = ai.decide_cards_to_discard()
+        computer = self.players[name]
+        if self._replay is not None:
+            # 재생 중에는 기록된 결정을 사용 (로그가 여기서 끝나면 진행하지 않은 행동을 지어내지 않음)
+            action = next(self._replay, None)
+            if action is None:
+                raise ValueError("Actions end before a computer turn")
+            indices_to_discard = decode_action(action)
+        else:
+            # 이번 턴을 포함해 컴퓨터에게 남은 교체 횟수
+            turns_left = self.max_turns - self.current_turn + 1
+            ai = create_ai(computer.hand, computer.deck, self.ai_strategy,
+                           turns_left=turns_left, rng=self.rng, time_budget=self.ai_time_budget)
+            indices_to_discard = _drawable(computer, ai.decide_cards_to_discard())
 
         if indices_to_discard:
             computer.discard_cards(indices_to_discard)
+        self._record_action(indices_to_discard)
 
-    def determine_winner(self) -> None:
-        """승자 결정"""
-        player_score = self.players['Player 1'].score[0]
-        computer_score = self.players['Computer'].score[0]
-        
-        if player_score > computer_score:
-            self.winner = 'Player 1'
-        elif player_score < computer_score:
-            self.winner = 'Computer'
-        else:
-            self.winner = 'Draw'
+    def determine_winner(self) -> List[str]:
+        """승자 결정 (최고 점수가 여럿이면 무승부), 좌석 순위 반환"""
+        best, winner = -1, None
+        for name, player in self.players.items():
+            score = player.score[0]
+            if score > best:
+                best, winner = score, name
+            elif score == best:
+                winner = 'Draw'
+        self.winner = winner
         self.current_turn = None
+        self._dirty = True
+        return self.ranking
+
+    @property
+    def ranking(self) -> List[str]:
+        """점수 높은 순 좌석 (같은 점수는 좌석 순서), 게임이 끝나지 않았으면 빈 리스트"""
+        if self.winner is None:
+            return []
+        return sorted(self.players, key=lambda name: -self.players[name].score[0])
 
     def get_game_state(self) -> Dict:
         """현재 게임 상태 반환"""
@@ -153,8 +403,19 @@ class Game:
                            if player.card_changes['discarded'] or player.card_changes['drawn']},
             'current_turn': self.current_turn,
             'max_turns': self.max_turns,
-            'winner': self.winner
-        } 
+            'winner': self.winner,
+            'ranking': self.ranking
+        }
+
+
+def _version_of(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _drawable(player: Player, indices) -> List[int]:
+    """정렬한 교체 인덱스 중 덱에 남은 장수만큼 (공유 덱이면 모두가 쓰는 덱 기준)"""
+    return sorted(set(indices))[:len(player.deck)]
+
 
 class GameError(Exception):
     """게임 관련 예외"""
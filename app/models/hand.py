@@ -4,7 +4,9 @@
 from typing import List, Dict, Tuple, Set
 from collections import Counter
 from .card import Card
-from config.settings import HAND_RANKINGS
+from .evaluator import MAX_CARDS, evaluate_cards
+from .potential import straight_draw
+from config.settings import HAND_RANKINGS, RANKS
 
 class Hand:
     """패 분석 클래스"""
@@ -17,6 +19,10 @@ class Hand:
 
     def analyze(self) -> Tuple[int, str, int, int]:
         """패의 족보와 점수를 분석"""
+        # 7장 이하는 테이블 평가기로 조회
+        if len(self.cards) <= MAX_CARDS:
+            return evaluate_cards(self.cards)
+
         # High Card를 제외한 모든 족보 체크
         for hand_type, multiplier in HAND_RANKINGS[:-1]:  # High Card 제외
             check_method = getattr(self, f'is_{hand_type.lower().replace(" ", "_")}')
@@ -112,8 +118,7 @@ class Hand:
 
     def _has_straight_potential(self) -> bool:
         """스트레이트 가능성 체크"""
-        values = sorted(set(self._sorted_values))
-        for i in range(len(values) - 3):
-            if values[i+3] - values[i] <= 4:
-                return True
-        return False 
\ No newline at end of file
+        mask = 0
+        for card in self.cards:
+            mask |= 1 << (card.id % len(RANKS))
+        return straight_draw(mask) != 0 
\ No newline at end of file
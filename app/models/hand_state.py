@@ -0,0 +1,110 @@
+"""
+증분 패 상태
+
+랭크/무늬 히스토그램, 랭크 비트마스크, 합계와 평가기 키(랭크 소수 곱)를 유지하며,
+카드가 빠지고 들어올 때마다 해당 카드만큼만 갱신한다.
+히스토그램, 장수, 합계는 정수 하나에 비트 필드로 묶어 카드당 덧셈/뺄셈 한 번으로 갱신한다.
+
+    비트 0~38   랭크별 장수 (3비트 x 13)
+    비트 39~50  무늬별 장수 (3비트 x 4, evaluator의 무늬 카운터와 같은 배치)
+    비트 51~54  장수
+    비트 55~    합계
+
+어떤 카드가 들어 있는지는 카드 id 비트마스크(52비트)로 따로 들고 있어,
+패에 없는 카드를 빼거나 이미 있는 카드를 더하면 상태를 바꾸지 않고 ValueError를 낸다.
+
+점수는 evaluate_ids와 같은 테이블 조회라서 Hand.analyze와 항상 같은 튜플이다.
+"""
+from typing import Iterable, List
+from app.models.card import Card, full_deck
+from app.models.evaluator import MAX_CARDS, CARD_PRIMES, CARD_SUIT_FIELDS, Score, get_tables
+from config.settings import RANKS, SUITS
+
+_NUM_RANKS = len(RANKS)
+_FIELD_BITS = 3
+_FIELD_MASK = (1 << _FIELD_BITS) - 1
+_SUIT_SHIFT = _FIELD_BITS * _NUM_RANKS
+_SIZE_SHIFT = _SUIT_SHIFT + _FIELD_BITS * len(SUITS)
+_TOTAL_SHIFT = _SIZE_SHIFT + 4
+
+# 카드 id -> (비트 필드 증가량, 랭크 필드 위치, 랭크 비트, 랭크 소수)
+_CARD_INFO = tuple(
+    ((1 << _FIELD_BITS * (card.id % _NUM_RANKS)) | (CARD_SUIT_FIELDS[card.id] << _SUIT_SHIFT)
+     | (1 << _SIZE_SHIFT) | (card.value << _TOTAL_SHIFT),
+     _FIELD_BITS * (card.id % _NUM_RANKS),
+     1 << (card.id % _NUM_RANKS),
+     CARD_PRIMES[card.id])
+    for card in full_deck()
+)
+
+
+class HandState:
+    """카드 추가/제거 시 카드당 O(1)로 갱신되는 패 분포 (최대 MAX_CARDS장)"""
+    __slots__ = ('_fields', '_key', '_cards', 'rank_mask')
+
+    def __init__(self, cards: Iterable[Card] = ()):
+        self._fields = 0
+        self._key = 1
+        self._cards = 0  # 카드 id i가 있으면 비트 i
+        self.rank_mask = 0  # 랭크 인덱스 r의 카드가 있으면 비트 r
+        self.replace((), cards)
+
+    @property
+    def rank_counts(self) -> List[int]:
+        """랭크별 장수 (RANKS 순서)"""
+        return [(self._fields >> (_FIELD_BITS * r)) & _FIELD_MASK for r in range(_NUM_RANKS)]
+
+    @property
+    def suit_counts(self) -> List[int]:
+        """무늬별 장수 (SUITS 순서)"""
+        return [(self._fields >> (_SUIT_SHIFT + _FIELD_BITS * s)) & _FIELD_MASK
+                for s in range(len(SUITS))]
+
+    @property
+    def size(self) -> int:
+        return (self._fields >> _SIZE_SHIFT) & 0xF
+
+    @property
+    def total(self) -> int:
+        return self._fields >> _TOTAL_SHIFT
+
+    def add(self, card: Card) -> None:
+        """카드 추가"""
+        self.replace((), (card,))
+
+    def remove(self, card: Card) -> None:
+        """카드 제거 (패에 있는 카드여야 함)"""
+        self.replace((card,), ())
+
+    def replace(self, removed: Iterable[Card], added: Iterable[Card]) -> None:
+        """버린 카드를 빼고 뽑은 카드를 더함 (실패하면 상태를 바꾸지 않음)"""
+        fields, key, cards, mask = self._fields, self._key, self._cards, self.rank_mask
+        for card in removed:
+            delta, rank_shift, bit, prime = _CARD_INFO[card.id]
+            if not cards >> card.id & 1:
+                raise ValueError(f"{card!r} is not in the hand")
+            cards ^= 1 << card.id
+            fields -= delta
+            key //= prime
+            if not (fields >> rank_shift) & _FIELD_MASK:
+                mask ^= bit
+        for card in added:
+            delta, _, bit, prime = _CARD_INFO[card.id]
+            if cards >> card.id & 1:
+                raise ValueError(f"{card!r} is already in the hand")
+            cards |= 1 << card.id
+            fields += delta
+            key *= prime
+            mask |= bit
+        # 장수는 카드 id 마스크로 셈 (비트 필드는 MAX_CARDS장을 넘으면 옆 필드로 넘칠 수 있음)
+        if cards.bit_count() > MAX_CARDS:
+            raise ValueError(f"HandState supports at most {MAX_CARDS} cards")
+        self._fields, self._key, self._cards, self.rank_mask = fields, key, cards, mask
+
+    def score(self) -> Score:
+        """(점수, 족보, 합계, 배율) 반환"""
+        rank_table, flush_table = get_tables()
+        return rank_table[self._key][flush_table[(self._fields >> _SUIT_SHIFT) & 0xFFF]]
+
+    def __repr__(self) -> str:
+        return f"HandState(size={self.size}, rank_mask={self.rank_mask:#015b}, total={self.total})"
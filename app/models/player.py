@@ -3,20 +3,39 @@
 """
 from typing import List, Dict, Tuple, Optional
 from app.models.card import Card
-from app.models.hand import Hand
+from app.models.hand_state import HandState
 
 class Player:
-    """플레이어 클래스"""
+    """플레이어 클래스 (좌석 수만큼 만들어지므로 __slots__로 작게 유지)"""
+    __slots__ = ('name', 'deck', '_hand', '_hand_state', 'score', 'previous_score', 'card_changes', 'dirty')
+
     def __init__(self, name: str):
         self.name = name
         self.deck: List[Card] = []
-        self.hand: List[Card] = []
+        self.hand: List[Card] = []  # hand 대입 시 증분 상태 초기화
         self.score: Optional[Tuple[int, str, int, int]] = None
         self.previous_score: Optional[Tuple[int, str, int, int]] = None
         self.card_changes: Dict[str, List[Dict[str, str]]] = {
             'discarded': [],
             'drawn': []
         }
+        self.dirty = False
+
+    @property
+    def hand(self) -> List[Card]:
+        return self._hand
+
+    @hand.setter
+    def hand(self, cards: List[Card]) -> None:
+        self._hand = cards
+        self._hand_state: Optional[HandState] = None
+
+    @property
+    def hand_state(self) -> HandState:
+        """패의 증분 상태 (처음 접근 시 생성)"""
+        if self._hand_state is None:
+            self._hand_state = HandState(self._hand)
+        return self._hand_state
 
     def draw_initial_cards(self, num_cards: int) -> None:
         """초기 카드를 뽑음"""
@@ -24,11 +43,13 @@ class Player:
         self._sort_hand()
         self._calculate_score()
         self.card_changes = {'discarded': [], 'drawn': []}
+        self.dirty = True
 
     def discard_cards(self, indices: List[int]) -> None:
         """카드를 버리고 새로 뽑음"""
         self.previous_score = self.score
         self.card_changes = {'discarded': [], 'drawn': []}
+        state = self.hand_state  # 패를 바꾸기 전에 생성
         
         # 인덱스를 내림차순으로 정렬 (중요!)
         sorted_indices = sorted(indices, reverse=True)
@@ -50,8 +71,10 @@ class Player:
                 self.hand.append(new_card)
                 self.card_changes['drawn'].append(new_card.to_dict())
         
+        state.replace(discarded_cards, new_cards)
         self._sort_hand()
-        self._calculate_score()
+        self.score = state.score()
+        self.dirty = True
 
     def _sort_hand(self) -> None:
         """패를 정렬"""
@@ -59,8 +82,7 @@ class Player:
 
     def _calculate_score(self) -> None:
         """점수 계산"""
-        hand_analyzer = Hand(self.hand)
-        self.score = hand_analyzer.analyze()
+        self.score = self.hand_state.score()
 
     def get_hand_dict(self) -> List[Dict[str, str]]:
         """패를 딕셔너리 리스트로 변환"""
@@ -0,0 +1,134 @@
+"""
+패 잠재력(드로우) 테이블
+
+휴리스틱 AI가 남길 카드를 몇 번의 조회로 정하도록 다음 테이블을 미리 만든다.
+
+    STRAIGHT_DRAWS[랭크 마스크]     스트레이트 드로우로 남길 랭크 마스크 (드로우가 없으면 0)
+    FLUSH_DRAWS[무늬 카운터 합]     4장 이상인 무늬 인덱스 (없으면 -1)
+    랭크 멀티셋 키(랭크 소수 곱)     스트레이트 > 트리플 > 투페어 > 원페어 > 하이카드 순으로 남길 랭크 마스크
+
+랭크 마스크는 랭크 인덱스 r의 카드가 있으면 비트 r이고, 무늬 카운터와 랭크 소수는
+evaluator와 같은 인코딩이다. 결정은 기존 PokerAI의 분기 순서와 항상 같다.
+"""
+from typing import Dict, List, Optional, Sequence, Tuple
+from app.models.evaluator import MAX_CARDS, RANK_PRIMES, CARD_PRIMES, CARD_SUIT_FIELDS, get_tables
+from config.settings import RANKS, SUITS
+
+_NUM_RANKS = len(RANKS)
+_SUIT_BITS = 3
+_SUIT_MASK = (1 << _SUIT_BITS) - 1
+
+# 랭크 키 테이블 값에서 하이카드(값 내림차순으로 버림) 표시 비트
+_HIGH_CARD = 1 << _NUM_RANKS
+
+# 카드 id -> 랭크 비트, 무늬 인덱스
+_CARD_RANK_BITS = tuple(1 << (i % _NUM_RANKS) for i in range(len(CARD_PRIMES)))
+_CARD_SUITS = tuple(i // _NUM_RANKS for i in range(len(CARD_PRIMES)))
+
+_STRAIGHT_DRAWS: Optional[List[int]] = None
+_FLUSH_DRAWS: Optional[List[int]] = None
+_RANK_KEEP: Optional[Dict[int, int]] = None
+
+
+def _consecutive_mask(mask: int) -> int:
+    """간격 2 이하로 이어진 가장 긴 랭크 묶음의 마스크 (길이가 같으면 낮은 쪽)"""
+    best = best_length = 0
+    current = length = 0
+    previous = None
+    for r in range(_NUM_RANKS):
+        if not mask >> r & 1:
+            continue
+        if previous is not None and r - previous > 2:
+            if length > best_length:
+                best, best_length = current, length
+            current = length = 0
+        current |= 1 << r
+        length += 1
+        previous = r
+    return current if length > best_length else best
+
+
+def _straight_draw(mask: int) -> int:
+    """서로 다른 랭크 4개가 폭 5 이내에 있으면 남길 랭크 마스크, 아니면 0"""
+    ranks = [r for r in range(_NUM_RANKS) if mask >> r & 1]
+    if any(ranks[i + 3] - ranks[i] <= 4 for i in range(len(ranks) - 3)):
+        return _consecutive_mask(mask)
+    return 0
+
+
+def _build_tables() -> None:
+    """스트레이트/플러시 드로우 테이블과 랭크 멀티셋별 남길 랭크 테이블 생성"""
+    global _STRAIGHT_DRAWS, _FLUSH_DRAWS, _RANK_KEEP
+    straight_draws = [_straight_draw(mask) for mask in range(1 << _NUM_RANKS)]
+
+    flush_draws = [-1] * (1 << (_SUIT_BITS * len(SUITS)))
+    for fields in range(len(flush_draws)):
+        counts = [(fields >> (_SUIT_BITS * s)) & _SUIT_MASK for s in range(len(SUITS))]
+        # MAX_CARDS장 이하에서는 4장 이상인 무늬가 하나뿐
+        if max(counts) >= 4:
+            flush_draws[fields] = counts.index(max(counts))
+
+    rank_keep: Dict[int, int] = {}
+
+    # 랭크를 하나씩 정하며 키/마스크/페어/트리플 마스크를 누적 (evaluator와 같은 열거)
+    def fill(index: int, remaining: int, key: int, mask: int, pairs: int, triples: int) -> None:
+        if index == _NUM_RANKS:
+            if straight_draws[mask]:
+                rank_keep[key] = straight_draws[mask]
+            elif triples:
+                rank_keep[key] = triples & -triples  # 트리플 2개는 풀하우스라 여기 오지 않음
+            elif pairs:
+                rank_keep[key] = pairs
+            else:
+                rank_keep[key] = (1 << mask.bit_length() >> 1) | _HIGH_CARD
+            return
+        bit = 1 << index
+        fill(index + 1, remaining, key, mask, pairs, triples)
+        for count in range(1, min(4, remaining) + 1):
+            key *= RANK_PRIMES[index]
+            fill(index + 1, remaining - count, key, mask | bit,
+                 pairs | (bit if count == 2 else 0), triples | (bit if count == 3 else 0))
+
+    fill(0, MAX_CARDS, 1, 0, 0, 0)
+
+    _STRAIGHT_DRAWS, _FLUSH_DRAWS, _RANK_KEEP = straight_draws, flush_draws, rank_keep
+
+
+def get_potential_tables() -> Tuple[List[int], List[int], Dict[int, int]]:
+    """(스트레이트 드로우, 플러시 드로우, 랭크 키별 남길 랭크) 테이블 반환 (최초 호출 시 테이블 파일에서 읽거나 생성)"""
+    if _RANK_KEEP is None:
+        from .table_cache import load_tables
+        if not load_tables():
+            _build_tables()
+    return _STRAIGHT_DRAWS, _FLUSH_DRAWS, _RANK_KEEP
+
+
+def straight_draw(mask: int) -> int:
+    """13비트 랭크 마스크의 스트레이트 드로우로 남길 랭크 마스크 (없으면 0)"""
+    return get_potential_tables()[0][mask]
+
+
+def decide_discards(card_ids: Sequence[int]) -> List[int]:
+    """휴리스틱 AI가 버릴 인덱스 (MAX_CARDS장 이하)"""
+    _, flush_draws, rank_keep = get_potential_tables()
+    rank_table, flush_table = get_tables()
+    key = 1
+    suits = 0
+    for card_id in card_ids:
+        key *= CARD_PRIMES[card_id]
+        suits += CARD_SUIT_FIELDS[card_id]
+
+    # 풀하우스 이상이면 유지
+    if rank_table[key][flush_table[suits]][3] >= 7:
+        return []
+
+    suit = flush_draws[suits]
+    if suit >= 0:
+        return [i for i, card_id in enumerate(card_ids) if _CARD_SUITS[card_id] != suit]
+
+    keep = rank_keep[key]
+    if keep & _HIGH_CARD:
+        # 가장 높은 카드 하나만 남기고 높은 순서로 버림 (랭크가 모두 다름)
+        order = sorted(range(len(card_ids)), key=lambda i: card_ids[i] % _NUM_RANKS, reverse=True)
+        return order[1:]
+    return [i for i, card_id in enumerate(card_ids) if not _CARD_RANK_BITS[card_id] & keep]
@@ -0,0 +1,48 @@
+"""
+시드 기반 덱 섞기
+
+카운터 기반 난수(SplitMix64)는 i번째 값을 (seed, i)만으로 계산하므로
+덱 전체를 저장하지 않아도 시드 하나로 같은 덱을 다시 만들 수 있다.
+random 모듈의 구현이나 파이썬 버전과 무관하게 결과가 같다.
+
+덱은 Fisher-Yates로 섞고, 각 플레이어는 자기 몫의 끝에서부터 뽑으므로
+플레이어의 남은 덱은 (seed, 뽑은 장수)로 정해진다.
+"""
+from functools import lru_cache
+from typing import List, Tuple
+from app.models.card import Card
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+
+# 덱의 카드 수
+DECK_SIZE = 52
+
+
+def counter_random(seed: int, counter: int) -> int:
+    """seed의 counter번째 64비트 난수"""
+    z = (seed + (counter + 1) * _GAMMA) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+@lru_cache(maxsize=1024)
+def shuffled_ids(seed: int) -> Tuple[int, ...]:
+    """seed로 섞은 카드 id 목록 (세션에서 같은 게임을 반복해 불러오므로 캐시)"""
+    ids = list(range(DECK_SIZE))
+    mask = _MASK64
+    for i in range(DECK_SIZE - 1, 0, -1):
+        # counter_random(seed, i)를 펼친 것
+        z = (seed + (i + 1) * _GAMMA) & mask
+        z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & mask
+        z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & mask
+        # 곱셈-시프트로 0..i 범위 (편향은 2^-58 미만)
+        j = ((z ^ (z >> 31)) * (i + 1)) >> 64
+        ids[i], ids[j] = ids[j], ids[i]
+    return tuple(ids)
+
+
+def shuffled_deck(seed: int) -> List[Card]:
+    """seed로 섞은 52장 덱"""
+    return [Card.from_id(card_id) for card_id in shuffled_ids(seed)]
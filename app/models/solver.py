@@ -0,0 +1,142 @@
+"""
+정확한 교체 최적화기
+
+각 플레이어의 덱 순서는 게임 시작 시 고정되므로, 교체 결과는 덱 맨 위 카드만으로
+결정되고 모든 경우를 열거할 수 있다.
+
+- 한 턴: 2^n개 교체 조합을 모두 평가한다.
+- 여러 턴: 최종 점수는 최종 패에만 의존하므로 최종 패 H를 직접 열거한다.
+  카드 흐름(처음 패 + 덱에서 뽑히는 순서)을 앞에서부터 보며 각 카드의 H 포함 여부를 정하고,
+  매 턴 "H에 없는 카드를 (한도까지) 모두 버리는" 탐욕 일정으로 H가 남은 턴 안에
+  만들어지는지 확인한다. 이 일정은 어떤 일정보다도 덱을 빨리 소모하므로
+  탐욕 일정으로 불가능한 H는 어떤 계획으로도 불가능하다.
+  (패, 덱 위치, 남은 턴)별 상태를 턴마다 2^n개씩 펼치는 방식은 5턴에서
+  수십만 상태가 되므로, 같은 답을 내는 이 열거가 훨씬 빠르다.
+  결과는 (패, 남은 덱, 턴 수, 교체 한도)로 메모이제이션한다.
+"""
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Sequence, Tuple
+from app.models.card import Card
+from app.models.evaluator import CARD_PRIMES, CARD_SUIT_FIELDS, get_tables, evaluate_ids
+
+Score = Tuple[int, str, int, int]
+
+
+class Plan:
+    """최적 계획: 턴별로 버릴 카드 목록과 최종 점수"""
+    __slots__ = ('discards', 'score', 'final_hand')
+
+    def __init__(self, discards: List[List[Card]], score: Score, final_hand: List[Card]):
+        self.discards = discards
+        self.score = score
+        self.final_hand = final_hand
+
+    def first_indices(self, hand: Sequence[Card]) -> List[int]:
+        """첫 턴에 버릴 카드의 현재 패 기준 인덱스"""
+        if not self.discards:
+            return []
+        first = set(self.discards[0])
+        return [i for i, card in enumerate(hand) if card in first]
+
+    def __repr__(self) -> str:
+        return f"Plan(score={self.score}, discards={self.discards})"
+
+
+def best_single_discard(hand: Sequence[Card], deck: Sequence[Card],
+                        max_discard: Optional[int] = None) -> Tuple[List[int], Score]:
+    """한 턴 교체에서 최종 점수가 가장 높은 (버릴 인덱스, 점수)"""
+    rank_table, flush_table = get_tables()
+    hand_ids = [card.id for card in hand]
+    draws = [card.id for card in reversed(deck)]  # deck.pop() 순서
+    limit = len(hand_ids) if max_discard is None else max_discard
+
+    key_prefix, suit_prefix = [1], [0]
+    for card_id in draws[:len(hand_ids)]:
+        key_prefix.append(key_prefix[-1] * CARD_PRIMES[card_id])
+        suit_prefix.append(suit_prefix[-1] + CARD_SUIT_FIELDS[card_id])
+
+    best_indices: List[int] = []
+    best_score = evaluate_ids(hand_ids)
+    for mask in range(1, 1 << len(hand_ids)):
+        indices = [i for i in range(len(hand_ids)) if mask >> i & 1]
+        if len(indices) > limit:
+            continue
+        key, suits = 1, 0
+        for i, card_id in enumerate(hand_ids):
+            if not mask >> i & 1:
+                key *= CARD_PRIMES[card_id]
+                suits += CARD_SUIT_FIELDS[card_id]
+        drawn = min(len(indices), len(draws))
+        score = rank_table[key * key_prefix[drawn]][flush_table[suits + suit_prefix[drawn]]]
+        if score[0] > best_score[0] or (score[0] == best_score[0] and len(indices) < len(best_indices)):
+            best_indices, best_score = indices, score
+    return best_indices, best_score
+
+
+def solve(hand: Sequence[Card], deck: Sequence[Card], turns: int,
+          max_discard: Optional[int] = None) -> Plan:
+    """남은 turns번의 교체로 얻을 수 있는 최고 점수와 그 계획
+
+    패가 줄어드는(덱이 바닥나는) 계획은 점수를 높이지 못하므로 제외한다.
+    """
+    limit = len(hand) if max_discard is None else max_discard
+    stream = tuple(card.id for card in hand) + tuple(card.id for card in reversed(deck))
+    score, positions = _solve_stream(stream, len(hand), turns, limit)
+    return _plan_for(hand, deck, positions, limit, score)
+
+
+@lru_cache(maxsize=4096)
+def _solve_stream(stream: Tuple[int, ...], n: int, turns: int,
+                  limit: int) -> Tuple[Score, FrozenSet[int]]:
+    """카드 흐름에서 만들 수 있는 최고 최종 패 (점수, 흐름 위치 집합)"""
+    rank_table, flush_table = get_tables()
+    best = [evaluate_ids(stream[:n]), frozenset(range(n))]
+    chosen: List[int] = []
+
+    def search(pos: int, used: int, frontier: int, excluded: int, discarded: int,
+               included: int, key: int, suits: int) -> None:
+        # 뽑은 카드를 모두 결정했으면 교체 턴 진행
+        if pos == frontier:
+            pending = excluded - discarded
+            if pending == 0:
+                if included == n:
+                    score = rank_table[key][flush_table[suits]]
+                    if score[0] > best[0][0]:
+                        best[0], best[1] = score, frozenset(chosen)
+                return
+            drop = min(limit, pending)
+            if used == turns or frontier + drop > len(stream):
+                return
+            used += 1
+            discarded += drop
+            frontier += drop
+
+        card_id = stream[pos]
+        if included < n:
+            chosen.append(pos)
+            search(pos + 1, used, frontier, excluded, discarded, included + 1,
+                   key * CARD_PRIMES[card_id], suits + CARD_SUIT_FIELDS[card_id])
+            chosen.pop()
+        search(pos + 1, used, frontier, excluded + 1, discarded, included, key, suits)
+
+    search(0, 0, n, 0, 0, 0, 1, 0)
+    return best[0], best[1]
+
+
+def _plan_for(hand: Sequence[Card], deck: Sequence[Card], positions, limit: int,
+              score: Score) -> Plan:
+    """최종 패 위치 집합을 탐욕 일정의 턴별 교체 목록으로 변환"""
+    n = len(hand)
+    stream = list(hand) + list(reversed(deck))
+    keep = {stream[pos] for pos in positions}
+    in_hand = list(hand)
+    frontier = n
+    discards = []
+    while True:
+        drop = [card for card in in_hand if card not in keep][:limit]
+        if not drop:
+            break
+        discards.append(drop)
+        in_hand = [card for card in in_hand if card not in drop] + stream[frontier:frontier + len(drop)]
+        frontier += len(drop)
+    return Plan(discards, score, sorted(keep, key=lambda card: (card.value, card.suit), reverse=True))
@@ -0,0 +1,161 @@
+"""
+평가/드로우 테이블 파일 캐시
+
+evaluator와 potential의 테이블(랭크 멀티셋 약 7만 6천 개)을 만드는 데 수백 ms가 걸려
+워커가 뜰 때마다 다시 만들지 않도록 한 번 만든 테이블을 이진 파일로 저장해 두고,
+다음 프로세스는 파일을 메모리 매핑해 배열 그대로 읽어 딕셔너리/리스트로 채운다.
+
+    헤더    매직, 형식 버전, 지문(설정과 테이블 생성 코드의 해시), 키 수, 점수 쌍 수
+    Q[n]    랭크 멀티셋 키 (랭크 소수 곱)
+    I[m]    서로 다른 (플러시 아님, 플러시) 점수 쌍: 족보 인덱스 4비트씩 + 합계 << 8
+    H[n]    키별 점수 쌍 인덱스
+    H[n]    키별 남길 랭크 마스크 (potential)
+    H[..]   스트레이트 드로우, B[..] 플러시 여부, b[..] 플러시 드로우 무늬
+
+지문이 다르거나(설정/코드 변경, 다른 Python/바이트 순서) 파일이 깨졌으면 새로 만들어 덮어쓴다.
+경로가 설정되지 않으면(set_cache_path(None)) 예전처럼 처음 쓸 때 만들기만 한다.
+"""
+import array
+import hashlib
+import logging
+import mmap
+import os
+import struct
+import sys
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 2
+_MAGIC = b'PKTB'
+_HEADER = struct.Struct('<4sI16sII8x')  # 40바이트: 뒤따르는 Q 배열이 8바이트 경계에서 시작
+
+_path: Optional[str] = None
+
+
+def set_cache_path(path: Optional[str]) -> None:
+    """테이블 파일 경로 설정 (None이면 파일을 쓰지 않음)"""
+    global _path
+    _path = path
+
+
+def _fingerprint() -> bytes:
+    """테이블 내용을 정하는 설정과 생성 코드의 해시"""
+    from config.settings import HAND_RANKINGS, RANKS, RANK_VALUES, SUITS
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((FORMAT_VERSION, sys.byteorder, RANKS, SUITS, RANK_VALUES, HAND_RANKINGS)).encode())
+    directory = os.path.dirname(os.path.abspath(__file__))
+    for name in ('evaluator.py', 'potential.py'):
+        with open(os.path.join(directory, name), 'rb') as f:
+            digest.update(f.read())
+    return digest.digest()
+
+
+def load_tables() -> bool:
+    """evaluator/potential 테이블을 파일에서 채움 (없거나 맞지 않으면 만들어 저장)
+
+    경로가 설정되지 않았으면 아무것도 하지 않고 False를 반환한다.
+    """
+    if _path is None:
+        return False
+    from . import evaluator, potential
+    fingerprint = _fingerprint()
+    tables = _read(_path, fingerprint)
+    if tables is None:
+        evaluator._build_tables()
+        potential._build_tables()
+        try:
+            _write(_path, fingerprint)
+        except OSError as e:
+            logger.warning("평가 테이블 파일을 저장하지 못했습니다 (%s): %s", _path, e)
+        return True
+    rank_table, flush_table, straight_draws, flush_draws, rank_keep = tables
+    evaluator._RANK_TABLE, evaluator._FLUSH_TABLE = rank_table, flush_table
+    potential._STRAIGHT_DRAWS, potential._FLUSH_DRAWS, potential._RANK_KEEP = \
+        straight_draws, flush_draws, rank_keep
+    return True
+
+
+def _hand_types() -> List[Tuple[str, int]]:
+    from config.settings import HAND_RANKINGS
+    return list(HAND_RANKINGS)
+
+
+def _write(path: str, fingerprint: bytes) -> None:
+    """현재 테이블을 파일로 저장 (임시 파일에 쓴 뒤 교체)"""
+    from . import evaluator, potential
+    rank_table, flush_table = evaluator._RANK_TABLE, evaluator._FLUSH_TABLE
+    straight_draws, flush_draws, rank_keep = potential._STRAIGHT_DRAWS, potential._FLUSH_DRAWS, potential._RANK_KEEP
+    type_index = {name: i for i, (name, _) in enumerate(_hand_types())}
+
+    keys = array.array('Q', rank_table)
+    pair_codes: Dict[int, int] = {}
+    key_pairs = array.array('H')
+    for plain, flush in rank_table.values():
+        code = type_index[plain[1]] | type_index[flush[1]] << 4 | plain[2] << 8
+        key_pairs.append(pair_codes.setdefault(code, len(pair_codes)))
+    pairs = array.array('I', pair_codes)
+    keep = array.array('H', (rank_keep[key] for key in rank_table))
+
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    temp = f'{path}.{os.getpid()}.tmp'
+    with open(temp, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, FORMAT_VERSION, fingerprint, len(keys), len(pairs)))
+        for part in (keys, pairs, key_pairs, keep, array.array('H', straight_draws),
+                     array.array('B', flush_table), array.array('b', flush_draws)):
+            part.tofile(f)
+    os.replace(temp, path)
+
+
+def _read(path: str, fingerprint: bytes):
+    """파일에서 (랭크 테이블, 플러시 테이블, 스트레이트 드로우, 플러시 드로우, 남길 랭크) 읽기"""
+    from .evaluator import _SUIT_BITS
+    from config.settings import RANKS, SUITS
+    try:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            views = [memoryview(mapped)]
+            try:
+                return _decode(views, fingerprint, 1 << len(RANKS), 1 << (_SUIT_BITS * len(SUITS)))
+            finally:
+                for view in reversed(views):
+                    view.release()
+    except (OSError, ValueError, struct.error) as e:
+        if not isinstance(e, FileNotFoundError):
+            logger.warning("평가 테이블 파일을 읽지 못해 다시 만듭니다 (%s): %s", path, e)
+        return None
+
+
+def _decode(views: List[memoryview], fingerprint: bytes, rank_masks: int, suit_fields: int):
+    data = views[0]
+    magic, version, stored, count, pair_count = _HEADER.unpack_from(data)
+    if (magic, version, stored) != (_MAGIC, FORMAT_VERSION, fingerprint):
+        return None
+    offset = _HEADER.size
+
+    def take(code: str, length: int) -> memoryview:
+        nonlocal offset
+        size = length * array.array(code).itemsize
+        if offset + size > len(data):
+            raise ValueError("truncated table file")
+        view = data[offset:offset + size]
+        views.append(view)
+        views.append(view.cast(code))
+        offset += size
+        return views[-1]
+
+    keys = take('Q', count)
+    types = _hand_types()
+    pairs = []
+    for code in take('I', pair_count):
+        total = code >> 8
+        (plain, plain_multiplier), (flush, flush_multiplier) = types[code & 0xF], types[code >> 4 & 0xF]
+        pairs.append(((total * plain_multiplier, plain, total, plain_multiplier),
+                      (total * flush_multiplier, flush, total, flush_multiplier)))
+    rank_table = dict(zip(keys, map(pairs.__getitem__, take('H', count))))
+    rank_keep = dict(zip(keys, take('H', count)))
+    straight_draws = take('H', rank_masks).tolist()
+    flush_table = take('B', suit_fields).tolist()
+    flush_draws = take('b', suit_fields).tolist()
+    if offset != len(data):
+        raise ValueError("unexpected table file size")
+    return rank_table, flush_table, straight_draws, flush_draws, rank_keep
@@ -0,0 +1,268 @@
+"""
+사람 대전 실시간 서버 (asyncio, 표준 라이브러리만 사용)
+
+    python -m app.realtime
+    python -m app.realtime --bind 0.0.0.0:5001 --max-tables 20000
+
+    POST /tables                       테이블 생성 {"table": id}
+    POST /tables/<id>/join             빈 좌석 참가 {"seat", "token"}
+    POST /tables/<id>/discard          {"token", "discard": [...]} 교체 (빈 목록이면 넘김)
+    GET  /tables/<id>/events?token=    좌석 상태 스트림 (Server-Sent Events)
+    GET  /healthz                      테이블/스트림 수
+
+상태가 바뀔 때마다 `event: state`로 좌석별 상태를 밀어 주고, 연결 유지를 위해
+REALTIME_HEARTBEAT초마다 주석 줄을 보낸다. 브라우저는 EventSource로 받고 행동은 POST로 보낸다.
+이벤트 루프 하나가 모든 테이블과 연결을 처리하므로 연결당 스레드가 없고,
+테이블은 이 프로세스 메모리에만 있다 (여러 프로세스로 늘리려면 테이블 id로 라우팅해야 함).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import signal
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+from app.tables import TableError, TableManager
+
+logger = logging.getLogger(__name__)
+
+# 요청 본문 최대 크기
+MAX_BODY = 4096
+
+_REASONS = {200: 'OK', 201: 'Created', 204: 'No Content', 400: 'Bad Request', 403: 'Forbidden',
+            404: 'Not Found', 405: 'Method Not Allowed', 409: 'Conflict',
+            413: 'Payload Too Large', 503: 'Service Unavailable'}
+
+
+class Request:
+    """파싱한 HTTP 요청"""
+    __slots__ = ('method', 'path', 'query', 'headers', 'body')
+
+    def __init__(self, method: str, path: str, query: Dict[str, List[str]],
+                 headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.query = query
+        self.headers = headers
+        self.body = body
+
+    @property
+    def keep_alive(self) -> bool:
+        return self.headers.get('connection', '').lower() != 'close'
+
+    def json(self) -> Dict[str, Any]:
+        """JSON 본문 (객체가 아니면 400)"""
+        try:
+            data = json.loads(self.body or b'{}')
+        except ValueError:
+            raise TableError(400, "JSON 본문이 올바르지 않습니다.")
+        if not isinstance(data, dict):
+            raise TableError(400, "JSON 객체가 필요합니다.")
+        return data
+
+
+async def read_request(reader: asyncio.StreamReader) -> Optional[Request]:
+    """요청 하나 읽기 (연결이 닫혔으면 None)"""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        method, target, _ = line.decode('latin-1').split(' ', 2)
+    except ValueError:
+        raise TableError(400, "잘못된 요청입니다.")
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    try:
+        length = int(headers.get('content-length') or 0)
+    except ValueError:
+        raise TableError(400, "Content-Length가 올바르지 않습니다.")
+    if length < 0 or length > MAX_BODY:
+        raise TableError(413, "요청 본문이 너무 큽니다.")
+    body = await reader.readexactly(length) if length else b''
+    url = urlsplit(target)
+    return Request(method.upper(), url.path, parse_qs(url.query), headers, body)
+
+
+class RealtimeServer:
+    """테이블 관리자와 HTTP/SSE 연결 처리"""
+
+    def __init__(self, manager: TableManager, allow_origin: str = '*',
+                 heartbeat: float = 15.0, evict_interval: float = 60.0):
+        self.manager = manager
+        self.allow_origin = allow_origin
+        self.heartbeat = heartbeat
+        self.evict_interval = evict_interval
+        self.streams = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._evictor: Optional[asyncio.Task] = None
+
+    async def start(self, host: str, port: int) -> Tuple[str, int]:
+        """리슨 시작, 실제 (host, port) 반환 (port 0이면 임의 포트)"""
+        self._server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        self._evictor = asyncio.create_task(self._evict_loop())
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def close(self) -> None:
+        if self._evictor is not None:
+            self._evictor.cancel()
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+
+    async def _evict_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.evict_interval)
+            evicted = self.manager.evict_idle()
+            if evicted:
+                logger.info("유휴 테이블 %d개 정리", evicted)
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """연결 하나 처리 (keep-alive면 요청을 이어서 받음)"""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except TableError as e:
+                    await self.send_json(writer, e.status, {'error': str(e)}, keep_alive=False)
+                    break
+                if request is None or not await self.dispatch(request, writer):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, request: Request, writer: asyncio.StreamWriter) -> bool:
+        """요청 처리, 연결을 계속 쓸 수 있으면 True"""
+        parts = [part for part in request.path.split('/') if part]
+        try:
+            if request.method == 'OPTIONS':
+                await self.send(writer, 204, b'', 'text/plain', request.keep_alive)
+                return request.keep_alive
+            if parts == ['healthz'] and request.method == 'GET':
+                body = {'status': 'ok', 'tables': len(self.manager.tables), 'streams': self.streams}
+                status = 200
+            elif parts == ['tables'] and request.method == 'POST':
+                body, status = {'table': self.manager.create().id}, 201
+            elif len(parts) == 3 and parts[0] == 'tables':
+                table_id, action = parts[1], parts[2]
+                if action == 'events' and request.method == 'GET':
+                    token = (request.query.get('token') or [''])[0]
+                    await self.stream(table_id, token, writer)
+                    return False
+                if action == 'join' and request.method == 'POST':
+                    seat, token = self.manager.join(table_id)
+                    body, status = {'table': table_id, 'seat': seat, 'token': token}, 200
+                elif action == 'discard' and request.method == 'POST':
+                    payload = request.json()
+                    version = self.manager.discard(table_id, str(payload.get('token', '')),
+                                                   payload.get('discard', []))
+                    body, status = {'version': version}, 200
+                else:
+                    raise TableError(405, "허용되지 않는 메서드입니다.")
+            else:
+                raise TableError(404, "찾을 수 없습니다.")
+        except TableError as e:
+            body, status = {'error': str(e)}, e.status
+        await self.send_json(writer, status, body, request.keep_alive)
+        return request.keep_alive
+
+    def _headers(self, status: int, content_type: str, extra: str = '') -> bytes:
+        return (f'HTTP/1.1 {status} {_REASONS.get(status, "")}\r\n'
+                f'Content-Type: {content_type}\r\n'
+                f'Access-Control-Allow-Origin: {self.allow_origin}\r\n'
+                'Access-Control-Allow-Methods: GET, POST, OPTIONS\r\n'
+                'Access-Control-Allow-Headers: Content-Type\r\n'
+                f'{extra}\r\n').encode('latin-1')
+
+    async def send(self, writer: asyncio.StreamWriter, status: int, body: bytes,
+                   content_type: str, keep_alive: bool) -> None:
+        connection = 'keep-alive' if keep_alive else 'close'
+        writer.write(self._headers(status, content_type,
+                                   f'Content-Length: {len(body)}\r\nConnection: {connection}\r\n') + body)
+        await writer.drain()
+
+    async def send_json(self, writer: asyncio.StreamWriter, status: int, body: Dict[str, Any],
+                        keep_alive: bool = True) -> None:
+        await self.send(writer, status, json.dumps(body, ensure_ascii=False).encode('utf-8'),
+                        'application/json', keep_alive)
+
+    async def stream(self, table_id: str, token: str, writer: asyncio.StreamWriter) -> None:
+        """좌석 상태를 SSE로 전송 (연결이 끊길 때까지)"""
+        queue: asyncio.Queue = asyncio.Queue()
+        try:
+            unsubscribe = self.manager.subscribe(table_id, token, queue.put_nowait)
+        except TableError as e:
+            await self.send_json(writer, e.status, {'error': str(e)}, keep_alive=False)
+            return
+        self.streams += 1
+        try:
+            writer.write(self._headers(200, 'text/event-stream',
+                                       'Cache-Control: no-cache\r\nConnection: keep-alive\r\n'
+                                       'X-Accel-Buffering: no\r\n'))
+            while True:
+                try:
+                    state = await asyncio.wait_for(queue.get(), self.heartbeat)
+                except asyncio.TimeoutError:
+                    writer.write(b': ping\n\n')
+                    await writer.drain()
+                    continue
+                # 밀린 상태는 마지막 것만 보냄
+                while not queue.empty():
+                    state = queue.get_nowait()
+                data = json.dumps(state, ensure_ascii=False)
+                writer.write(f'id: {state["version"]}\nevent: state\ndata: {data}\n\n'.encode('utf-8'))
+                await writer.drain()
+        finally:
+            self.streams -= 1
+            unsubscribe()
+
+
+def load_realtime_settings(env: str) -> Dict[str, Any]:
+    """환경 이름으로 REALTIME_* 설정 읽기"""
+    from app.serve import load_settings
+    return load_settings(env, prefix='REALTIME_')
+
+
+async def serve(settings: Dict[str, Any], bind: str) -> None:
+    """SIGINT/SIGTERM을 받을 때까지 서버 실행"""
+    manager = TableManager(max_tables=settings['REALTIME_MAX_TABLES'], ttl=settings['REALTIME_TABLE_TTL'])
+    server = RealtimeServer(manager, allow_origin=settings['REALTIME_ALLOW_ORIGIN'],
+                            heartbeat=settings['REALTIME_HEARTBEAT'])
+    host, _, port = bind.rpartition(':')
+    address = await server.start(host or '127.0.0.1', int(port))
+    logger.info("실시간 서버 시작: %s:%d", *address)
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stop.set)
+        except NotImplementedError:  # Windows
+            pass
+    await stop.wait()
+    await server.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 실행"""
+    settings = load_realtime_settings(os.environ.get('FLASK_ENV', 'development'))
+    parser = argparse.ArgumentParser(description='사람 대전 실시간 서버')
+    parser.add_argument('--bind', default=settings['REALTIME_BIND'])
+    parser.add_argument('--max-tables', type=int, default=settings['REALTIME_MAX_TABLES'])
+    args = parser.parse_args(argv)
+    settings['REALTIME_MAX_TABLES'] = args.max_tables
+    logging.basicConfig(level=logging.INFO, format='[%(asctime)s] %(levelname)s in %(module)s: %(message)s')
+    asyncio.run(serve(settings, args.bind))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+템플릿 렌더링 캐시
+
+- 카드: 카드 한 장의 마크업을 _card.html 매크로로 카드/좌석별로 한 번씩 렌더링해 두고
+  (52장 x 좌석 x 선택 가능 여부) 템플릿에서는 card_row(카드 목록, 좌석, 선택 가능)로
+  인덱스만 끼워 이어 붙인다.
+- 정적 조각: 내용이 고정된 include는 cached_fragment(name)으로 한 번 렌더링한 결과를 넣는다.
+  족보표 팝업처럼 따로 내려주는 조각은 fragment_version(name)(내용 해시)을 ETag로 쓴다.
+- 정적 페이지: 요청마다 내용이 같은 페이지(/)를 통째로 저장한다.
+  페이지마다 다른 CSRF 토큰은 자리표시자로 렌더링한 뒤 응답할 때 바꿔 넣는다.
+
+캐시 키는 템플릿과 그 템플릿이 extends/include/import하는 파일들의 수정 시각이라
+템플릿을 고치면 재시작 없이 다음 요청에서 다시 렌더링된다.
+RENDER_CACHE = False면 캐시 없이 매번 렌더링한다 (비교용).
+"""
+import hashlib
+import os
+from typing import Dict, List, Optional, Tuple
+from flask import Flask, render_template, request
+from jinja2 import meta, nodes
+from markupsafe import Markup
+
+# 자리표시자 (렌더링 결과에 그대로 나올 일이 없는 문자열)
+_CSRF_PLACEHOLDER = '\x00csrf-token\x00'
+_INDEX_PLACEHOLDER = '\x00index\x00'
+
+CARD_TEMPLATE = '_card.html'
+
+
+class CardRow:
+    """카드 목록 -> 카드 마크업 (카드/좌석/선택 가능 여부별 조각을 처음 쓸 때 렌더링)
+
+    조각은 인덱스 자리표시자를 기준으로 나눠 두고 인덱스만 끼워 넣는다.
+    캐시를 쓰지 않으면(cache=False) 매번 매크로로 렌더링한다.
+    """
+
+    def __init__(self, module, cache: bool = True):
+        self._card = module.card
+        self._cache = cache
+        self._parts: Dict[Tuple[str, str, str, bool], Tuple[str, str]] = {}
+
+    def _render(self, key: Tuple[str, str, str, bool]) -> Tuple[str, str]:
+        """카드 마크업을 인덱스 앞/뒤로 나눈 조각"""
+        rank, suit, player, selectable = key
+        html = str(self._card(rank, suit, _INDEX_PLACEHOLDER, player, selectable))
+        before, _, after = html.partition(_INDEX_PLACEHOLDER)
+        if self._cache:
+            self._parts[key] = (before, after)
+        return before, after
+
+    def __call__(self, cards: List[Dict[str, str]], player: str, selectable: bool = False) -> Markup:
+        out = []
+        for index, card in enumerate(cards):
+            key = (card['rank'], card['suit'], player, selectable)
+            parts = self._parts.get(key)
+            if parts is None:
+                parts = self._render(key)
+            out.append(f'{parts[0]}{index}{parts[1]}')
+        return Markup('\n'.join(out))
+
+
+class RenderCache:
+    """앱별 카드 조각/정적 페이지 캐시"""
+
+    def __init__(self, app: Flask, enabled: bool = True):
+        self.app = app
+        self.enabled = enabled
+        self._files: Dict[str, Tuple[str, ...]] = {}  # 템플릿 -> 의존 파일 경로
+        self._stamps: Dict[str, Tuple[int, ...]] = {}  # 템플릿 -> 마지막으로 본 수정 시각
+        self._cards: Optional[Tuple[Tuple[int, ...], CardRow]] = None
+        self._fragments: Dict[str, Tuple[Tuple[int, ...], Markup, str]] = {}  # (수정 시각, 조각, 해시)
+        self._pages: Dict[Tuple[str, str], Tuple[Tuple[int, ...], Tuple[str, ...]]] = {}
+
+    def _dependencies(self, name: str) -> Tuple[str, ...]:
+        """템플릿과 그 템플릿이 참조하는 템플릿 파일 경로 (재귀)"""
+        env = self.app.jinja_env
+        files, pending, seen = [], [name], set()
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            source, filename, _ = env.loader.get_source(env, current)
+            files.append(filename)
+            ast = env.parse(source)
+            pending.extend(ref for ref in meta.find_referenced_templates(ast) if ref)
+            # cached_fragment("이름") 호출도 의존 템플릿으로 취급
+            for call in ast.find_all(nodes.Call):
+                if isinstance(call.node, nodes.Name) and call.node.name == 'cached_fragment' \
+                        and call.args and isinstance(call.args[0], nodes.Const):
+                    pending.append(call.args[0].value)
+        return tuple(files)
+
+    def stamp(self, name: str) -> Tuple[int, ...]:
+        """템플릿 의존 파일들의 수정 시각 (캐시 키)"""
+        files = self._files.get(name)
+        if files is None:
+            files = self._files[name] = self._dependencies(name)
+        try:
+            stamp = tuple(os.stat(path).st_mtime_ns for path in files)
+        except OSError:
+            # 의존 파일이 바뀌었으면 목록을 다시 만듦
+            files = self._files[name] = self._dependencies(name)
+            stamp = tuple(os.stat(path).st_mtime_ns for path in files)
+        if self._stamps.get(name, stamp) != stamp:
+            # 디버그가 아니면 Jinja가 컴파일한 템플릿을 다시 읽지 않으므로 비움
+            self._files[name] = self._dependencies(name)
+            if self.app.jinja_env.cache is not None:
+                self.app.jinja_env.cache.clear()
+        self._stamps[name] = stamp
+        return stamp
+
+    def card_row(self) -> CardRow:
+        """_card.html이 바뀌지 않았으면 같은 CardRow (조각 유지)"""
+        if not self.enabled:
+            return CardRow(self.app.jinja_env.get_template(CARD_TEMPLATE).module, cache=False)
+        stamp = self.stamp(CARD_TEMPLATE)
+        cached = self._cards
+        if cached is None or cached[0] != stamp:
+            cached = self._cards = (stamp, CardRow(self.app.jinja_env.get_template(CARD_TEMPLATE).module))
+        return cached[1]
+
+    def _fragment(self, name: str) -> Tuple[Tuple[int, ...], Markup, str]:
+        if not self.enabled:
+            html = Markup(self.app.jinja_env.get_template(name).render())
+            return (), html, _digest(html)
+        stamp = self.stamp(name)
+        cached = self._fragments.get(name)
+        if cached is None or cached[0] != stamp:
+            html = Markup(self.app.jinja_env.get_template(name).render())
+            cached = self._fragments[name] = (stamp, html, _digest(html))
+        return cached
+
+    def fragment(self, name: str) -> Markup:
+        """요청과 무관한 템플릿 조각 (include 대신 사용)"""
+        return self._fragment(name)[1]
+
+    def fragment_version(self, name: str) -> str:
+        """조각 내용의 해시 (ETag용)"""
+        return self._fragment(name)[2]
+
+    def render_page(self, name: str, **context) -> str:
+        """요청과 무관한 페이지 렌더링 (CSRF 토큰만 요청마다 바꿔 넣음)"""
+        if not self.enabled:
+            return render_template(name, **context)
+        key = (name, request.script_root)
+        stamp = self.stamp(name)
+        cached = self._pages.get(key)
+        if cached is None or cached[0] != stamp:
+            html = render_template(name, csrf_token=lambda: _CSRF_PLACEHOLDER, **context)
+            cached = self._pages[key] = (stamp, tuple(html.split(_CSRF_PLACEHOLDER)))
+        parts = cached[1]
+        if len(parts) == 1:
+            return parts[0]
+        return self.app.jinja_env.globals['csrf_token']().join(parts)
+
+
+def _digest(html: str) -> str:
+    return hashlib.blake2b(html.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def init_render_cache(app: Flask) -> RenderCache:
+    """앱에 렌더링 캐시 등록 (템플릿에서 card_row 사용 가능)"""
+    cache = RenderCache(app, enabled=app.config.get('RENDER_CACHE', True))
+    app.extensions['render_cache'] = cache
+
+    app.jinja_env.globals['cached_fragment'] = cache.fragment
+
+    @app.context_processor
+    def inject_card_row():
+        return {'card_row': cache.card_row()}
+    return cache
@@ -0,0 +1,120 @@
+"""
+저장된 게임 일괄 재생
+
+    python -m app.replay --backend sqlite --path data/games.sqlite3 --jsonl replays.jsonl
+
+게임 저장소의 각 게임을 시드와 행동 로그로 다시 진행해 시뮬레이터와 같은 형식의
+결과(턴별 점수, 최종 족보, 승자)를 만들고 SimulationStats로 집계한다.
+좌석 구성을 함께 저장한 게임(버전 3)은 그 좌석들로 재생해 좌석별로 집계하고,
+시드가 없는 이전 형식(버전 1)으로 저장된 게임은 건너뛴다.
+"""
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from app.models.codec import decode_replay, decode_seated_replay, REPLAY_VERSION, SEATED_REPLAY_VERSION
+from app.models.game import Game, COMPUTER_SEATS, DEFAULT_SEATS, DECK_SPLIT, seated_layout
+from app.simulation import SimulationStats
+from app.store import DirectoryBackend, GameBackend, SQLiteBackend
+
+
+def replay_game(seed: int, max_turns: int, actions: bytes, seats: Sequence[str] = DEFAULT_SEATS,
+                computers: Sequence[str] = COMPUTER_SEATS, deck_policy: str = DECK_SPLIT) -> Dict[str, Any]:
+    """시드와 행동 로그로 게임을 재생한 결과 (simulation.play_game과 같은 형식, 좌석은 seats)
+
+    scores는 도달한 각 턴 시작 시의 점수다.
+    """
+    scores = {seat: [] for seat in seats}
+    game, turn = None, None
+    for game in Game.replay_steps(seed, actions, max_turns, seats=seats, computers=computers,
+                                  deck_policy=deck_policy):
+        # 사람 좌석이 여럿이면 턴마다 여러 번 멈추므로 턴이 바뀔 때만 기록
+        if game.current_turn not in (None, turn):
+            turn = game.current_turn
+            for seat in seats:
+                scores[seat].append(game.players[seat].score[0])
+    return {
+        'seed': seed,
+        'actions': actions.hex(),
+        'winner': game.winner,
+        'ranking': game.ranking,
+        'scores': scores,
+        'final': {seat: list(game.players[seat].score) for seat in seats},
+    }
+
+
+def decode_stored(data: bytes) -> Tuple[int, int, bytes, Dict[str, Any]]:
+    """저장된 상태를 (seed, max_turns, actions, replay_game 좌석 인자)로 디코딩 (시드 없는 형식은 ValueError)"""
+    if data[:1] == bytes([SEATED_REPLAY_VERSION]):
+        seed, max_turns, actions, *layout = decode_seated_replay(data)
+        seats, computers, deck_policy = seated_layout(*layout)
+        return seed, max_turns, actions, {'seats': seats, 'computers': computers, 'deck_policy': deck_policy}
+    if data[:1] == bytes([REPLAY_VERSION]):
+        return (*decode_replay(data), {})
+    raise ValueError(f"Unsupported replay version: {data[:1]!r}")
+
+
+def replay_stored(items: Iterable[Tuple[str, bytes]]) -> Iterator[Dict[str, Any]]:
+    """(게임 id, 저장된 상태) 목록을 재생한 결과 (이전 형식은 건너뜀)"""
+    for game_id, data in items:
+        try:
+            seed, max_turns, actions, layout = decode_stored(data)
+        except ValueError:
+            continue
+        result = replay_game(seed, max_turns, actions, **layout)
+        result['id'] = game_id
+        yield result
+
+
+def open_backend(kind: str, path: str) -> GameBackend:
+    """명령행 인자로 백엔드 생성"""
+    if kind == 'sqlite':
+        return SQLiteBackend(path)
+    if kind == 'directory':
+        return DirectoryBackend(path)
+    raise ValueError(f"Unknown game store backend: {kind}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 실행"""
+    parser = argparse.ArgumentParser(description='저장된 포커 게임 일괄 재생')
+    parser.add_argument('--backend', choices=('sqlite', 'directory'), default='sqlite')
+    parser.add_argument('--path', default='data/games.sqlite3')
+    parser.add_argument('--all', action='store_true', help='진행 중인 게임도 재생')
+    parser.add_argument('--jsonl', help='게임별 결과를 JSON Lines로 기록할 파일 (- 는 표준 출력)')
+    args = parser.parse_args(argv)
+
+    out = None
+    if args.jsonl == '-':
+        out = sys.stdout
+    elif args.jsonl:
+        out = open(args.jsonl, 'w', encoding='utf-8')
+
+    backend = open_backend(args.backend, args.path)
+    stats = SimulationStats()
+    replayed = 0
+    start = time.perf_counter()
+    try:
+        for result in replay_stored(backend.scan(finished_only=not args.all)):
+            replayed += 1
+            if result['winner'] is not None:
+                stats.add(result)
+            if out is not None:
+                out.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        backend.close()
+        if out is not None and out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    summary['replayed'] = replayed
+    summary['elapsed'] = elapsed
+    summary['games_per_second'] = replayed / elapsed if elapsed else 0.0
+    print(json.dumps(summary, ensure_ascii=False, indent=2), file=sys.stderr if out is sys.stdout else sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
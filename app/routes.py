@@ -1,43 +1,97 @@
 """
 라우트 정의
 """
-from flask import render_template, request, redirect, url_for, session, g, current_app, has_request_context
-from .models.game import Game
+from flask import render_template, request, redirect, url_for, session, g, current_app, make_response
+from .metrics import timer
+from config.settings import MAX_CARDS_TO_DISCARD
+import hashlib
 import logging
+import secrets
 import traceback
 
+# 로거 설정
+logger = logging.getLogger(__name__)
+
+# 족보표 조각의 브라우저 캐시 기간(초), 이후에는 ETag로 재검증
+FRAGMENT_MAX_AGE = 3600
+
+
+def current_game_id() -> str:
+    """세션에 연결된 게임 id (없으면 새로 발급)"""
+    if 'game_id' not in session:
+        session['game_id'] = secrets.token_urlsafe(16)
+    return session['game_id']
+
+
+# 게임 인스턴스 가져오기 함수
+def get_game():
+    if not hasattr(g, 'game'):
+        store = current_app.extensions.get('game_store')
+        game_id = current_game_id()
+        with timer('poker_session_seconds', op='load'):
+            if store is None:
+                from .models.game import Game
+                g.game = Game()
+                g.game.load_from_session(session.get('game'))
+            else:
+                g.game, _ = store.get(game_id, session.get('game_rev'))
+        logger.debug("게임 인스턴스 생성 또는 세션에서 로드됨")
+    return g.game
+
+
+# 게임 인스턴스 저장 함수
+def save_game(game):
+    """세션(또는 게임 저장소)에 게임 상태 저장 (변경된 경우만)"""
+    if not game.dirty:
+        return
+    try:
+        store = current_app.extensions.get('game_store')
+        with timer('poker_session_seconds', op='save'):
+            # 한 번만 인코딩해 저장과 상태 버전(ETag)에 함께 사용
+            data = game.save_to_session()
+            if store is None:
+                session['game'] = data
+            else:
+                session['game_rev'] = store.put(current_game_id(), game, data)
+        session.modified = True  # 세션 변경 명시적 알림
+        game.mark_clean(data)
+        g.game_saves = g.get('game_saves', 0) + 1
+    except RuntimeError as e:
+        logger.warning("요청 컨텍스트 외부에서 game 저장 시도\n%s", traceback.format_exc())
+    except Exception as e:
+        logger.error(f"게임 저장 오류: {str(e)}")
+
+
+def game_page_etag(game) -> str:
+    """게임 페이지 ETag (게임 id, 상태 버전, 템플릿 수정 시각으로 만듦)"""
+    stamp = current_app.extensions['render_cache'].stamp('computer.html')
+    key = f"{current_game_id()}:{game.state_version()}:{stamp}"
+    return hashlib.blake2b(key.encode(), digest_size=8).hexdigest()
+
+
+def render_game_page(game):
+    """게임 상태 페이지 (약한 ETag, 상태가 그대로인 GET 재요청은 304)
+
+    페이지의 CSRF 토큰은 렌더링할 때마다 달라지지만 같은 세션에서는 모두 유효하므로
+    내용이 같은 것으로 보고 약한 ETag를 쓴다.
+    """
+    etag = game_page_etag(game)
+    if request.method in ('GET', 'HEAD') and request.if_none_match.contains_weak(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = make_response(render_template('computer.html', **game.get_game_state()))
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
 def register_routes(app):
     """라우트 등록"""
     
-    # 로거 설정
-    logger = logging.getLogger(__name__)
-    
-    # 게임 인스턴스 가져오기 함수
-    def get_game():
-        if 'game' not in session:
-            session['game'] = {}
-        
-        if not hasattr(g, 'game'):
-            g.game = Game()
-            g.game.load_from_session(session['game'])
-            logger.debug("게임 인스턴스 생성 또는 세션에서 로드됨")
-        return g.game
-    
-    # 게임 인스턴스 저장 함수
-    def save_game(game):
-        """세션에 게임 상태 저장"""
-        try:
-            session['game'] = game.save_to_session()
-            session.modified = True  # 세션 변경 명시적 알림
-        except RuntimeError as e:
-            logger.warning("요청 컨텍스트 외부에서 game 저장 시도\n%s", traceback.format_exc())
-        except Exception as e:
-            logger.error(f"게임 저장 오류: {str(e)}")
-    
     @app.route('/')
     def index():
-        """메인 페이지"""
-        return render_template('index.html')
+        """메인 페이지 (렌더링 결과 캐시)"""
+        return current_app.extensions['render_cache'].render_page('index.html')
 
     @app.route('/play/computer')
     def play_computer():
@@ -54,10 +108,10 @@ def register_routes(app):
 
     @app.route('/play/human')
     def play_human():
-        """사람과 대전 (기능 구현 예정)"""
-        game = get_game()
-        game.reset_game()
-        return render_template('human.html')
+        """사람과 대전 (테이블 상태는 실시간 서버가 SSE로 전송)"""
+        from .tables import TABLE_SEATS
+        return render_template('human.html', realtime_url=app.config['REALTIME_URL'],
+                               table_id=request.args.get('table'), seats=TABLE_SEATS)
 
     @app.route('/start')
     def start_game():
@@ -69,7 +123,7 @@ def register_routes(app):
             if game.current_turn is not None and game.current_turn > 1:
                 # 이미 진행 중인 게임이면 현재 상태 반환
                 logger.info("이미 진행 중인 게임입니다.")
-                return render_template('computer.html', **game.get_game_state())
+                return render_game_page(game)
             
             # 완전히 새 게임 시작
             logger.info("새 게임 시작")
@@ -77,7 +131,7 @@ def register_routes(app):
             game.start_game()
             save_game(game)
             
-            return render_template('computer.html', **game.get_game_state())
+            return render_game_page(game)
         except Exception as e:
             logger.error(f"게임 시작 오류: {str(e)}")
             return render_template('error.html', error=str(e))
@@ -91,8 +145,7 @@ def register_routes(app):
             discard_indices = request.form.get('discard', '')
             discard_indices = [int(i) for i in discard_indices.split(',') if i.isdigit()]
             
-            # 최대 5장 제한 검증
-            MAX_CARDS_TO_DISCARD = 5
+            # 최대 교체 장수 제한 검증
             if len(discard_indices) > MAX_CARDS_TO_DISCARD:
                 raise ValueError(f"최대 {MAX_CARDS_TO_DISCARD}장의 카드만 교체할 수 있습니다.")
             
@@ -100,18 +153,24 @@ def register_routes(app):
             save_game(game)
             
             if game.current_turn is None:  # 게임 종료
-                return render_template('computer.html', **game.get_game_state())
+                return render_game_page(game)
             
             # start_game으로 리다이렉트하지 않고 현재 상태 렌더링
-            return render_template('computer.html', **game.get_game_state())
+            return render_game_page(game)
         except Exception as e:
             app.logger.error(f"카드 버리기 오류: {str(e)}")
             return render_template('error.html', error=str(e))
     
     @app.route('/hand-rankings')
     def hand_rankings():
-        """족보 확인 페이지"""
-        return render_template('hand_rankings.html')
+        """족보표 팝업 조각 (처음 열 때 script.js가 불러옴, 렌더링은 프로세스당 한 번)"""
+        cache = current_app.extensions['render_cache']
+        response = make_response(str(cache.fragment('hand_rankings.html')))
+        # 압축본과 원본이 같은 값을 쓰도록 약한 ETag
+        response.set_etag(cache.fragment_version('hand_rankings.html'), weak=True)
+        response.cache_control.public = True
+        response.cache_control.max_age = FRAGMENT_MAX_AGE
+        return response.make_conditional(request)
 
     @app.route('/next_turn')
     def next_turn():
@@ -126,25 +185,42 @@ def register_routes(app):
             game.next_turn()
             save_game(game)
             
-            return render_template('computer.html', **game.get_game_state())
+            return render_game_page(game)
         except Exception as e:
             logger.error(f"턴 넘기기 오류: {str(e)}")
             return render_template('error.html', error=str(e))
             
-    @app.teardown_appcontext
-    def close_game(error):
-        if not has_request_context():
-            return
+    @app.after_request
+    def persist_game(response):
+        """요청 중 변경된 게임 상태를 세션 저장 전에 한 번만 기록"""
+        if request.path.startswith(('/static', '/assets')):
+            return response  # 정적 자원에 대해선 저장 로직 건너뜀
+
+        if hasattr(g, 'game'):
+            save_game(g.game)
+
+        if app.debug or app.config.get('DEBUG_HEADERS'):
+            response.headers['X-Game-Serializations'] = str(g.get('game_saves', 0))
+        return response
 
-        if request.path.startswith('/static'):
-            return  # 정적 자원에 대해선 저장 로직 건너뜀
+    @app.route('/healthz')
+    def liveness():
+        """생존 확인 (요청을 처리할 수 있으면 200)"""
+        return {'status': 'ok'}
 
+    @app.route('/readyz')
+    def readiness():
+        """준비 확인 (평가 테이블 생성, 게임 저장소 연결)"""
         try:
-            if hasattr(g, 'game'):
-                session['game'] = g.game.save_to_session()
-                session.modified = True
+            from .models.evaluator import get_tables
+            get_tables()
+            store = current_app.extensions.get('game_store')
+            if store is not None:
+                store.ping()
         except Exception as e:
-            app.logger.warning("game 저장 중 오류: %s", e)
+            logger.error(f"준비 상태 확인 실패: {str(e)}")
+            return {'status': 'unavailable', 'error': str(e)}, 503
+        return {'status': 'ready'}
 
     @app.route('/new_game')
     def new_game():
@@ -0,0 +1,99 @@
+"""
+프로덕션 서버 실행
+
+    FLASK_ENV=production python -m app.serve
+    python -m app.serve --workers 4 --threads 2 --bind 0.0.0.0:8000
+
+gunicorn의 pre-fork 모델로 워커 프로세스를 띄운다. 워커/스레드 수 등은
+config/production.py(개발 환경이면 config/settings.py)의 SERVER_* 값을 기본으로 한다.
+각 워커가 앱을 따로 만들므로 게임 저장소 스레드와 SQLite 연결은 fork 후에 생성된다.
+
+    kill -HUP <마스터 pid>    설정을 다시 읽고 워커를 차례로 교체 (처리 중인 요청은 완료)
+    kill -TERM <마스터 pid>   SERVER_GRACEFUL_TIMEOUT 동안 처리 중인 요청을 마치고 종료
+
+상태 확인: /healthz (생존), /readyz (평가 테이블, 게임 저장소 준비)
+"""
+import argparse
+import importlib
+import os
+import secrets
+import sys
+from typing import Any, Dict, List, Optional
+
+
+def load_settings(env: str, prefix: str = 'SERVER_') -> Dict[str, Any]:
+    """환경 이름으로 prefix로 시작하는 설정 읽기"""
+    module = importlib.import_module('config.production' if env == 'production' else 'config.settings')
+    return {name: getattr(module, name) for name in dir(module) if name.startswith(prefix)}
+
+
+def gunicorn_options(settings: Dict[str, Any], pidfile: Optional[str] = None) -> Dict[str, Any]:
+    """SERVER_* 설정을 gunicorn 설정으로 변환"""
+    threads = settings['SERVER_THREADS']
+    options = {
+        'bind': settings['SERVER_BIND'],
+        'workers': settings['SERVER_WORKERS'],
+        'threads': threads,
+        'worker_class': 'gthread' if threads > 1 else 'sync',
+        'timeout': settings['SERVER_TIMEOUT'],
+        'graceful_timeout': settings['SERVER_GRACEFUL_TIMEOUT'],
+        'keepalive': settings['SERVER_KEEPALIVE'],
+        'max_requests': settings['SERVER_MAX_REQUESTS'],
+        'max_requests_jitter': settings['SERVER_MAX_REQUESTS_JITTER'],
+        'preload_app': False,
+        'post_worker_init': _warm_up,
+        'accesslog': None,
+    }
+    if pidfile:
+        options['pidfile'] = pidfile
+    return options
+
+
+def _warm_up(worker) -> None:
+    """워커가 요청을 받기 전에 평가 테이블과 AI 드로우 테이블 준비 (TABLE_CACHE_PATH 파일이 있으면 읽기만 함)"""
+    from app.models.evaluator import get_tables
+    from app.models.potential import get_potential_tables
+    get_tables()
+    get_potential_tables()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 실행"""
+    env = os.environ.get('FLASK_ENV', 'development')
+    settings = load_settings(env)
+
+    parser = argparse.ArgumentParser(description='포커 게임 프로덕션 서버 (gunicorn)')
+    parser.add_argument('--bind', default=settings['SERVER_BIND'])
+    parser.add_argument('--workers', type=int, default=settings['SERVER_WORKERS'])
+    parser.add_argument('--threads', type=int, default=settings['SERVER_THREADS'])
+    parser.add_argument('--pidfile', help='마스터 pid를 기록할 파일 (재시작 신호용)')
+    args = parser.parse_args(argv)
+    settings.update(SERVER_BIND=args.bind, SERVER_WORKERS=args.workers, SERVER_THREADS=args.threads)
+
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        print("gunicorn이 필요합니다: pip install gunicorn (Windows는 python run.py 사용)", file=sys.stderr)
+        return 1
+
+    # 워커마다 다른 임의 키를 쓰면 다른 워커에서 세션을 읽을 수 없으므로 마스터에서 한 번 정함
+    if 'SECRET_KEY' not in os.environ:
+        print("경고: SECRET_KEY가 없어 임시 키를 사용합니다 (재시작 시 세션 초기화)", file=sys.stderr)
+        os.environ['SECRET_KEY'] = secrets.token_hex(32)
+
+    class PokerApplication(BaseApplication):
+        def load_config(self):
+            for key, value in gunicorn_options(settings, args.pidfile).items():
+                self.cfg.set(key, value)
+
+        def load(self):
+            # preload_app=False이므로 각 워커에서 호출됨
+            from app import create_app
+            return create_app(env)
+
+    PokerApplication().run()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
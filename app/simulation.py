@@ -0,0 +1,174 @@
+"""
+Flask 없이 게임을 대량으로 진행하는 시뮬레이터
+
+    python -m app.simulation --games 10000 --player heuristic --computer montecarlo --workers 4
+
+게임 i는 (seed, i)로 정해지는 난수로 진행되므로 워커 수와 무관하게 결과가 같다.
+montecarlo AI는 시간 상한 없이 표본 수로만 제한해 머신 부하가 결과를 바꾸지 않게 한다.
+게임은 청크 단위로 프로세스 풀에 나눠 주고, 끝난 청크부터 결과를 흘려보낸다.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from app.models.ai import create_ai, AI_STRATEGIES
+from app.models.game import Game
+from config.settings import MAX_CARDS_TO_DISCARD
+
+SEATS = ('Player 1', 'Computer')
+
+
+def human_discard(indices: List[int]) -> List[int]:
+    """사람 좌석 규칙(/discard, 테이블)대로 MAX_CARDS_TO_DISCARD장까지만 교체
+
+    패는 높은 카드부터 정렬돼 있으므로 넘치면 뒤쪽(낮은 카드)을 버린다.
+    """
+    return sorted(indices)[-MAX_CARDS_TO_DISCARD:] if indices else []
+
+
+def play_game(index: int, seed: int, player: str, computer: str) -> Dict[str, Any]:
+    """게임 하나를 끝까지 진행하고 결과 반환"""
+    rng = random.Random(f'{seed}-{index}')
+    game = Game(ai_strategy=computer, rng=rng, ai_time_budget=None)
+    game.start_game()
+
+    scores = {seat: [] for seat in SEATS}
+    while game.current_turn is not None:
+        for seat in SEATS:
+            scores[seat].append(game.players[seat].score[0])
+        human = game.players['Player 1']
+        turns_left = game.max_turns - game.current_turn + 1
+        ai = create_ai(human.hand, human.deck, player, turns_left=turns_left, rng=rng, time_budget=None)
+        game.discard_cards('Player 1', human_discard(ai.decide_cards_to_discard()))
+
+    return {
+        'index': index,
+        'winner': game.winner,
+        'scores': scores,
+        'final': {seat: list(game.players[seat].score) for seat in SEATS},
+    }
+
+
+def _play_chunk(args: Tuple[int, int, int, str, str]) -> List[Dict[str, Any]]:
+    start, stop, seed, player, computer = args
+    return [play_game(i, seed, player, computer) for i in range(start, stop)]
+
+
+def run_games(games: int, player: str = 'heuristic', computer: str = 'heuristic',
+              seed: int = 0, workers: Optional[int] = None,
+              chunk_size: int = 50) -> Iterator[Dict[str, Any]]:
+    """게임 결과를 끝나는 대로 하나씩 반환
+
+    workers가 1이면 현재 프로세스에서 진행한다. 청크 순서는 완료 순서를 따른다.
+    """
+    for name in (player, computer):
+        if name not in AI_STRATEGIES:
+            raise ValueError(f"Unknown AI strategy: {name}")
+    chunks = [(start, min(start + chunk_size, games), seed, player, computer)
+              for start in range(0, games, chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    if workers == 1:
+        for chunk in chunks:
+            yield from _play_chunk(chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # 한 번에 워커 수의 두 배까지만 제출해 결과가 쌓이지 않게 함
+        chunk_iter = iter(chunks)
+        pending = set()
+        for chunk in chunk_iter:
+            pending.add(executor.submit(_play_chunk, chunk))
+            if len(pending) >= workers * 2:
+                break
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                next_chunk = next(chunk_iter, None)
+                if next_chunk is not None:
+                    pending.add(executor.submit(_play_chunk, next_chunk))
+                yield from future.result()
+
+
+class SimulationStats:
+    """스트리밍 결과 집계"""
+    def __init__(self):
+        self.games = 0
+        self.wins: Counter = Counter()
+        # 좌석은 결과에 나온 순서대로 추가 (저장된 게임 재생은 좌석 구성이 게임마다 다를 수 있음)
+        self.hand_types: Dict[str, Counter] = {}
+        self._turn_totals: Dict[str, List[List[int]]] = {}
+
+    def add(self, result: Dict[str, Any]) -> None:
+        """게임 결과 하나 반영"""
+        self.games += 1
+        self.wins[result['winner']] += 1
+        for seat, final in result['final'].items():
+            self.hand_types.setdefault(seat, Counter())[final[1]] += 1
+            totals = self._turn_totals.setdefault(seat, [])
+            for turn, score in enumerate(result['scores'][seat] + [final[0]]):
+                if turn == len(totals):
+                    totals.append([0, 0])
+                totals[turn][0] += score
+                totals[turn][1] += 1
+
+    def summary(self) -> Dict[str, Any]:
+        """집계 결과 (마지막 값이 최종 점수)"""
+        games = self.games or 1
+        return {
+            'games': self.games,
+            'win_rates': {name: count / games for name, count in self.wins.items()},
+            'hand_types': {seat: {name: count / games for name, count in counter.most_common()}
+                           for seat, counter in self.hand_types.items()},
+            'average_score_per_turn': {seat: [total / count for total, count in totals]
+                                       for seat, totals in self._turn_totals.items()},
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """명령행 실행"""
+    parser = argparse.ArgumentParser(description='포커 게임 헤드리스 시뮬레이션')
+    parser.add_argument('--games', type=int, default=1000)
+    parser.add_argument('--player', choices=AI_STRATEGIES, default='heuristic',
+                        help='Player 1 자리 전략')
+    parser.add_argument('--computer', choices=AI_STRATEGIES, default='heuristic',
+                        help='Computer 자리 전략')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--workers', type=int, default=None, help='프로세스 수 (기본: CPU 수)')
+    parser.add_argument('--chunk-size', type=int, default=50)
+    parser.add_argument('--jsonl', help='게임별 결과를 JSON Lines로 기록할 파일 (- 는 표준 출력)')
+    args = parser.parse_args(argv)
+
+    out = None
+    if args.jsonl == '-':
+        out = sys.stdout
+    elif args.jsonl:
+        out = open(args.jsonl, 'w', encoding='utf-8')
+
+    stats = SimulationStats()
+    start = time.perf_counter()
+    try:
+        for result in run_games(args.games, args.player, args.computer, args.seed,
+                                args.workers, args.chunk_size):
+            stats.add(result)
+            if out is not None:
+                out.write(json.dumps(result, ensure_ascii=False) + '\n')
+    finally:
+        if out is not None and out is not sys.stdout:
+            out.close()
+    elapsed = time.perf_counter() - start
+
+    summary = stats.summary()
+    summary['elapsed'] = elapsed
+    summary['games_per_second'] = stats.games / elapsed if elapsed else 0.0
+    print(json.dumps(summary, ensure_ascii=False, indent=2), file=sys.stderr if out is sys.stdout else sys.stdout)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
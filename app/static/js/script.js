@@ -5,7 +5,10 @@ const MAX_CARDS_TO_DISCARD = 5;
 
 // 카드 선택 토글 함수
 function toggleCardSelection(card) {
-    if (card.dataset.player !== 'Player 1') return;
+    // 사람 대전 페이지는 내 좌석을 data-seat로 지정
+    const container = document.querySelector('.game-container');
+    const mySeat = (container && container.dataset.seat) || 'Player 1';
+    if (card.dataset.player !== mySeat) return;
     
     const index = parseInt(card.dataset.index);
     const selectedIndex = selectedCards.indexOf(index);
@@ -71,6 +74,19 @@ function submitDiscard() {
     console.log("[디버깅] 선택된 카드 인덱스:", indices);
     console.log("[디버깅] 전송될 데이터:", indices.join(','));
 
+    // JSON API로 변경분만 받아 화면 일부만 갱신 (실패 시 폼 제출)
+    const container = document.querySelector('.game-container[data-game-id]');
+    if (container && container.dataset.gameId && window.fetch) {
+        discardViaApi(container.dataset.gameId, indices.map(Number)).catch(error => {
+            console.error("API 카드 교체 실패, 폼으로 제출:", error);
+            submitDiscardForm(indices);
+        });
+        return;
+    }
+    submitDiscardForm(indices);
+}
+
+function submitDiscardForm(indices) {
     document.getElementById('discardInput').value = indices.join(',');
     
     // 폼 유효성 검사
@@ -81,6 +97,146 @@ function submitDiscard() {
     }
 }
 
+// JSON API 상태 (페이지에 포함된 초기 상태 + 받은 변경분)
+let gameState = null;
+let gameVersion = null;
+
+function loadGameState() {
+    if (gameState === null) {
+        const stateElement = document.getElementById('gameState');
+        gameState = stateElement ? JSON.parse(stateElement.textContent) : {};
+    }
+    return gameState;
+}
+
+async function discardViaApi(gameId, indices) {
+    const csrfToken = document.querySelector('meta[name="csrf-token"]').getAttribute('content');
+    const headers = {'Content-Type': 'application/json', 'X-CSRFToken': csrfToken};
+    if (gameVersion) headers['If-Match'] = `"${gameVersion}"`;
+
+    const response = await fetch(`/api/games/${encodeURIComponent(gameId)}/discard`, {
+        method: 'POST',
+        headers: headers,
+        body: JSON.stringify({discard: indices})
+    });
+    if (response.status === 412) {
+        // 다른 탭 등에서 상태가 바뀐 경우 전체 상태를 다시 받음
+        gameVersion = null;
+        return refreshGameState(gameId);
+    }
+    const data = await response.json();
+    if (!response.ok) {
+        alert(data.error);
+        return;
+    }
+    if (gameVersion && data.base_version !== gameVersion) {
+        return refreshGameState(gameId);
+    }
+    gameVersion = data.version;
+    applyGameDelta(data.delta);
+}
+
+async function refreshGameState(gameId) {
+    const response = await fetch(`/api/games/${encodeURIComponent(gameId)}/state`);
+    if (!response.ok) throw new Error(`state ${response.status}`);
+    const data = await response.json();
+    gameVersion = data.version;
+    gameState = {};
+    applyGameDelta(data.state);
+}
+
+// 변경분 병합 (플레이어별 딕셔너리는 플레이어 단위로, null이면 삭제)
+function applyGameDelta(delta) {
+    const state = loadGameState();
+    for (const [key, value] of Object.entries(delta)) {
+        if (value && typeof value === 'object' && !Array.isArray(value)) {
+            const merged = Object.assign({}, state[key] || {}, value);
+            Object.keys(merged).forEach(name => { if (merged[name] === null) delete merged[name]; });
+            state[key] = merged;
+        } else {
+            state[key] = value;
+        }
+    }
+
+    selectedCards = [];
+    updateCardSelectionUI();
+    if (delta.hands) {
+        Object.keys(delta.hands).forEach(name => renderPlayerCards(name, state.hands[name] || []));
+    }
+    document.querySelectorAll('.player-section[data-player]').forEach(section => {
+        renderScoreInfo(section, section.dataset.player, state);
+    });
+
+    const status = document.querySelector('.game-status p');
+    if (status && state.current_turn !== null) {
+        status.textContent = `현재 턴: ${state.current_turn} / ${state.max_turns}`;
+    }
+    if (state.winner !== null && state.winner !== undefined) {
+        renderGameResult(state.winner);
+    }
+}
+
+function cardInnerHtml(card) {
+    const suit = card.suit.toLowerCase();
+    if (card.rank === 'Ace') {
+        return `<div class="card-top"><div class="rank-top">A</div></div>
+            <div class="card-center"><div class="big-suit ${suit}"></div></div>
+            <div class="card-bottom"><div class="rank-bottom">A</div></div>`;
+    }
+    const center = /^\d+$/.test(card.rank)
+        ? `<div class="big-number">${card.rank}</div>`
+        : `<div class="big-text">${card.rank[0]}</div>`;
+    return `<div class="card-top"><div class="small-suit ${suit}"></div></div>
+        <div class="card-center">${center}</div>
+        <div class="card-bottom"><div class="small-suit ${suit}" style="transform: rotate(180deg);"></div></div>`;
+}
+
+function renderPlayerCards(name, cards) {
+    const section = document.querySelector(`.player-section[data-player="${name}"]`);
+    if (!section) return;
+    const container = section.querySelector('.cards-container');
+    container.innerHTML = cards.map((card, index) => `
+        <div class="card${name === 'Player 1' ? ' selectable' : ''}"
+             data-index="${index}" data-player="${name}"
+             data-rank="${card.rank}" data-suit="${card.suit}">
+            <div class="card-inner">${cardInnerHtml(card)}</div>
+        </div>`).join('');
+}
+
+function renderScoreInfo(section, name, state) {
+    const scoreInfo = section.querySelector('.score-info');
+    const score = state.scores && state.scores[name];
+    if (!scoreInfo || !score) return;
+    let html = `<p>족보: ${score[1]}</p><p>점수 계산: ${score[2]} × ${score[3]} = ${score[0]}</p>`;
+    if (name === 'Computer' && state.current_turn && state.current_turn > 1) {
+        const changes = state.card_changes && state.card_changes[name];
+        const previous = state.previous_scores && state.previous_scores[name];
+        if (changes && (changes.discarded.length || changes.drawn.length)) {
+            html += '<p class="ai-decision"><span class="action-taken">컴퓨터가 카드를 교체했습니다:<br>';
+            if (previous) {
+                html += `<span class="score-change-details">이전 족보: ${previous[1]} (${previous[0]}점)<br>
+                    현재 족보: ${score[1]} (${score[0]}점)</span>`;
+            }
+            html += '</span></p>';
+        } else {
+            html += '<p class="ai-decision"><span class="action-kept">컴퓨터가 카드를 유지했습니다</span></p>';
+        }
+    }
+    scoreInfo.innerHTML = html;
+}
+
+function renderGameResult(winner) {
+    const status = document.querySelector('.game-status');
+    if (status) status.remove();
+    const controls = document.querySelector('.game-controls');
+    if (controls) {
+        controls.innerHTML = `<a href="/new_game" class="btn">새 게임</a>
+            <a href="/" class="btn">메인으로</a>`;
+        controls.insertAdjacentHTML('afterend', `<div class="game-result">
+            <h3>게임 결과</h3><p>승자: ${winner}</p><a href="/" class="btn">메인으로</a></div>`);
+    }
+}
+
 function validateFormBeforeSubmit(form) {
     // CSRF 토큰 확인
     const csrfToken = form.querySelector('input[name="csrf_token"]');
@@ -390,13 +546,42 @@ function highlightCardsForHand(cards, handInfo) {
     });
 }
 
-// 족보표 팝업 관련 함수
+// 족보표 팝업 관련 함수 (팝업 조각은 처음 열 때 한 번만 불러옴)
+let handRankingsRequest = null;
+
+function loadHandRankings() {
+    if (!handRankingsRequest) {
+        const url = document.querySelector('.hand-button').dataset.src;
+        handRankingsRequest = fetch(url, { credentials: 'same-origin' })
+            .then(response => {
+                if (!response.ok) {
+                    throw new Error(`족보표를 불러오지 못했습니다 (${response.status})`);
+                }
+                return response.text();
+            })
+            .then(html => {
+                document.querySelector('main').insertAdjacentHTML('beforeend', html);
+                return document.getElementById('handRankingsPopup');
+            })
+            .catch(error => {
+                handRankingsRequest = null;  // 다음에 다시 시도
+                throw error;
+            });
+    }
+    return handRankingsRequest;
+}
+
 function showHandRankings() {
-    document.getElementById('handRankingsPopup').style.display = 'block';
+    loadHandRankings()
+        .then(popup => { popup.style.display = 'block'; })
+        .catch(error => console.error(error));
 }
 
 function hideHandRankings() {
-    document.getElementById('handRankingsPopup').style.display = 'none';
+    const popup = document.getElementById('handRankingsPopup');
+    if (popup) {
+        popup.style.display = 'none';
+    }
 }
 
 // ESC 키로 팝업 닫기
@@ -0,0 +1,131 @@
+// 사람 대전: 실시간 서버(app.realtime)의 테이블 상태를 SSE로 받아 화면 갱신
+
+const tableContainer = document.getElementById('tableContainer');
+const realtimeUrl = tableContainer.dataset.realtimeUrl.replace(/\/$/, '');
+let tableId = tableContainer.dataset.tableId;
+let tableToken = null;
+let tableEvents = null;
+
+async function tableRequest(path, body) {
+    const response = await fetch(`${realtimeUrl}${path}`, {
+        method: 'POST',
+        headers: {'Content-Type': 'application/json'},
+        body: JSON.stringify(body || {})
+    });
+    const data = await response.json();
+    if (!response.ok) throw new Error(data.error || `HTTP ${response.status}`);
+    return data;
+}
+
+// 테이블을 만들고 주소에 테이블 id를 남긴 뒤 참가
+async function createTable() {
+    try {
+        const data = await tableRequest('/tables');
+        tableId = data.table;
+        history.replaceState(null, '', `?table=${encodeURIComponent(tableId)}`);
+        await joinTable();
+    } catch (e) {
+        alert(`테이블을 만들 수 없습니다: ${e.message}`);
+    }
+}
+
+// 같은 탭에서 새로고침하면 저장한 토큰으로 다시 구독
+async function joinTable() {
+    const key = `table-token:${tableId}`;
+    tableToken = sessionStorage.getItem(key);
+    if (!tableToken) {
+        try {
+            const data = await tableRequest(`/tables/${encodeURIComponent(tableId)}/join`);
+            tableToken = data.token;
+            sessionStorage.setItem(key, tableToken);
+        } catch (e) {
+            document.getElementById('tableControls').innerHTML =
+                `<p>${e.message}</p><a href="/play/human" class="btn">새 테이블</a>`;
+            return;
+        }
+    }
+    subscribeTable();
+}
+
+function subscribeTable() {
+    if (tableEvents) tableEvents.close();
+    const url = `${realtimeUrl}/tables/${encodeURIComponent(tableId)}/events?token=${encodeURIComponent(tableToken)}`;
+    tableEvents = new EventSource(url);
+    tableEvents.addEventListener('state', (event) => renderTable(JSON.parse(event.data)));
+    tableEvents.onerror = () => {
+        // EventSource가 자동으로 다시 연결하므로 상태만 표시
+        const status = document.getElementById('tableStatus');
+        status.hidden = false;
+        status.innerHTML = '<p>실시간 서버와 연결이 끊겼습니다. 다시 연결하는 중...</p>';
+    };
+}
+
+function renderTable(state) {
+    tableContainer.dataset.seat = state.seat;
+    const controls = document.getElementById('tableControls');
+    const status = document.getElementById('tableStatus');
+    const shareUrl = `${location.origin}/play/human?table=${encodeURIComponent(state.table)}`;
+    controls.innerHTML = `<p>내 좌석: <strong>${state.seat}</strong></p>`;
+
+    status.hidden = false;
+    if (state.current_turn === null && state.winner === null) {
+        status.innerHTML = `<p>상대를 기다리는 중입니다. 초대 링크: <a href="${shareUrl}">${shareUrl}</a></p>`;
+    } else if (state.winner === null) {
+        const whose = state.waiting_for === state.seat ? '내 차례입니다' : `${state.waiting_for}의 차례입니다`;
+        status.innerHTML = `<p>현재 턴: ${state.current_turn} / ${state.max_turns} - ${whose}</p>`;
+    } else {
+        status.hidden = true;
+    }
+
+    const area = document.getElementById('tableArea');
+    area.hidden = !Object.keys(state.players).length;
+    for (const [name, player] of Object.entries(state.players)) {
+        const section = area.querySelector(`.player-section[data-player="${name}"]`);
+        if (!section) continue;
+        const container = section.querySelector('.cards-container');
+        if (player.hand) {
+            container.innerHTML = player.hand.map((card, index) => `
+                <div class="card${name === state.seat ? ' selectable' : ''}"
+                     data-index="${index}" data-player="${name}"
+                     data-rank="${card.rank}" data-suit="${card.suit}">
+                    <div class="card-inner">${cardInnerHtml(card)}</div>
+                </div>`).join('');
+        } else {
+            container.innerHTML = '<div class="card card-back"><div class="card-inner"></div></div>'
+                .repeat(player.cards);
+        }
+        const score = player.score;
+        section.querySelector('.score-info').innerHTML = score
+            ? `<p>족보: ${score[1]}</p><p>점수 계산: ${score[2]} × ${score[3]} = ${score[0]}</p>` : '';
+    }
+
+    selectedCards = [];
+    updateCardSelectionUI();
+    document.getElementById('tableActions').hidden =
+        state.winner !== null || state.waiting_for !== state.seat;
+
+    const result = document.getElementById('tableResult');
+    result.hidden = state.winner === null;
+    if (state.winner !== null) {
+        const text = state.winner === 'Draw' ? '무승부' : `승자: ${state.winner}`;
+        const ranking = state.ranking.map(name =>
+            `<li>${name} (${state.players[name].score[0]}점)</li>`).join('');
+        result.innerHTML = `<h3>게임 결과</h3><p>${text}</p><ol class="ranking">${ranking}</ol>
+            <a href="/play/human" class="btn">새 테이블</a><a href="/" class="btn">메인으로</a>`;
+        tableEvents.close();
+    }
+}
+
+async function submitTableDiscard(pass) {
+    const indices = pass ? [] : selectedCards.slice();
+    try {
+        await tableRequest(`/tables/${encodeURIComponent(tableId)}/discard`,
+                           {token: tableToken, discard: indices});
+    } catch (e) {
+        alert(e.message);
+    }
+}
+
+document.addEventListener('DOMContentLoaded', () => {
+    if (tableId) joinTable();
+});
@@ -0,0 +1,449 @@
+"""
+서버 측 게임 저장소
+
+세션에는 게임 id와 리비전만 두고, 게임 상태는 프로세스 내 LRU 캐시와
+영속 백엔드(SQLite 파일 또는 디렉터리)에 저장한다.
+캐시에 살아 있는 Game 객체는 리비전이 세션과 같으면 역직렬화 없이 재사용한다.
+"""
+import atexit
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+if TYPE_CHECKING:  # 모델은 첫 게임 요청 때 불러옴 (앱 시작 시간 단축)
+    from app.models.game import Game
+
+_GAME_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+
+# 같은 게임의 백엔드 쓰기를 순서대로 하기 위한 잠금 수 (게임 id 해시로 나눔)
+_WRITE_LOCK_STRIPES = 64
+
+
+def validate_game_id(game_id: str) -> str:
+    """게임 id 형식 검사"""
+    if not isinstance(game_id, str) or not _GAME_ID_PATTERN.match(game_id):
+        raise ValueError(f"Invalid game id: {game_id!r}")
+    return game_id
+
+
+class GameBackend:
+    """영속 백엔드 인터페이스"""
+
+    def load(self, game_id: str) -> Optional[bytes]:
+        """저장된 상태 반환 (없으면 None)"""
+        raise NotImplementedError
+
+    def save(self, game_id: str, data: bytes, finished: bool) -> None:
+        """상태 저장"""
+        raise NotImplementedError
+
+    def delete(self, game_id: str) -> None:
+        """상태 삭제"""
+        raise NotImplementedError
+
+    def purge_finished(self, before: float) -> int:
+        """before 이전에 저장된 종료 게임 삭제, 삭제 수 반환"""
+        raise NotImplementedError
+
+    def scan(self, finished_only: bool = False) -> Iterator[Tuple[str, bytes]]:
+        """저장된 (게임 id, 상태) 전체 순회"""
+        raise NotImplementedError
+
+    def ping(self) -> None:
+        """백엔드 사용 가능 여부 확인 (불가하면 예외)"""
+
+    def close(self) -> None:
+        """리소스 정리"""
+
+
+class MemoryBackend(GameBackend):
+    """메모리 백엔드 (테스트용)"""
+
+    def __init__(self):
+        self._data: Dict[str, Tuple[bytes, bool, float]] = {}
+
+    def load(self, game_id):
+        entry = self._data.get(game_id)
+        return entry[0] if entry else None
+
+    def save(self, game_id, data, finished):
+        self._data[game_id] = (data, finished, time.time())
+
+    def delete(self, game_id):
+        self._data.pop(game_id, None)
+
+    def purge_finished(self, before):
+        expired = [game_id for game_id, (_, finished, saved_at) in self._data.items()
+                   if finished and saved_at < before]
+        for game_id in expired:
+            del self._data[game_id]
+        return len(expired)
+
+    def scan(self, finished_only=False):
+        for game_id, (data, finished, _) in list(self._data.items()):
+            if finished or not finished_only:
+                yield game_id, data
+
+
+class SQLiteBackend(GameBackend):
+    """SQLite 파일 백엔드"""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS games ('
+            ' id TEXT PRIMARY KEY, data BLOB NOT NULL,'
+            ' finished INTEGER NOT NULL, updated_at REAL NOT NULL)'
+        )
+
+    def load(self, game_id):
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM games WHERE id = ?', (game_id,)).fetchone()
+        return bytes(row[0]) if row else None
+
+    def save(self, game_id, data, finished):
+        with self._lock:
+            self._conn.execute(
+                'INSERT OR REPLACE INTO games (id, data, finished, updated_at) VALUES (?, ?, ?, ?)',
+                (game_id, data, int(finished), time.time())
+            )
+
+    def save_many(self, items) -> None:
+        """여러 게임을 한 트랜잭션으로 저장"""
+        now = time.time()
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO games (id, data, finished, updated_at) VALUES (?, ?, ?, ?)',
+                    [(game_id, data, int(finished), now) for game_id, data, finished in items]
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def delete(self, game_id):
+        with self._lock:
+            self._conn.execute('DELETE FROM games WHERE id = ?', (game_id,))
+
+    def purge_finished(self, before):
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM games WHERE finished = 1 AND updated_at < ?', (before,)
+            )
+        return cursor.rowcount
+
+    def scan(self, finished_only=False):
+        query = 'SELECT id, data FROM games' + (' WHERE finished = 1' if finished_only else '')
+        with self._lock:
+            rows = self._conn.execute(query + ' ORDER BY id').fetchall()
+        for game_id, data in rows:
+            yield game_id, bytes(data)
+
+    def ping(self):
+        with self._lock:
+            self._conn.execute('SELECT 1').fetchone()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class DirectoryBackend(GameBackend):
+    """디렉터리 백엔드 (게임당 파일 하나, 종료된 게임은 .done 확장자)"""
+
+    def __init__(self, path: str):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+
+    def ping(self):
+        if not os.access(self.path, os.W_OK):
+            raise OSError(f"Game directory is not writable: {self.path}")
+
+    def _file(self, game_id: str, finished: bool) -> str:
+        return os.path.join(self.path, game_id + ('.done' if finished else '.bin'))
+
+    def load(self, game_id):
+        for finished in (False, True):
+            try:
+                with open(self._file(game_id, finished), 'rb') as f:
+                    return f.read()
+            except FileNotFoundError:
+                continue
+        return None
+
+    def save(self, game_id, data, finished):
+        target = self._file(game_id, finished)
+        tmp = f'{target}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, target)
+        # 반대 상태의 파일 정리
+        try:
+            os.remove(self._file(game_id, not finished))
+        except FileNotFoundError:
+            pass
+
+    def delete(self, game_id):
+        for finished in (False, True):
+            try:
+                os.remove(self._file(game_id, finished))
+            except FileNotFoundError:
+                pass
+
+    def purge_finished(self, before):
+        removed = 0
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                if entry.name.endswith('.done') and entry.stat().st_mtime < before:
+                    try:
+                        os.remove(entry.path)
+                        removed += 1
+                    except FileNotFoundError:
+                        pass
+        return removed
+
+    def scan(self, finished_only=False):
+        suffixes = ('.done',) if finished_only else ('.done', '.bin')
+        for name in sorted(os.listdir(self.path)):
+            game_id, suffix = os.path.splitext(name)
+            if suffix in suffixes:
+                try:
+                    with open(os.path.join(self.path, name), 'rb') as f:
+                        yield game_id, f.read()
+                except FileNotFoundError:
+                    continue
+
+
+class _Entry:
+    """캐시 항목"""
+    __slots__ = ('game', 'revision', 'dirty', 'data', 'touched_at')
+
+    def __init__(self, game: 'Game', revision: int):
+        self.game = game
+        self.revision = revision
+        self.dirty = False
+        self.data: Optional[bytes] = None  # put 때 받은 인코딩 (없으면 쓸 때 인코딩)
+        self.touched_at = time.time()
+
+    def encoded(self) -> bytes:
+        return self.data if self.data is not None else self.game.save_to_session()
+
+
+class GameStore:
+    """LRU 캐시 + 영속 백엔드 게임 저장소
+
+    flush_interval이 0이면 put 시 바로 백엔드에 쓰고(write-through),
+    0보다 크면 변경된 게임을 모아 주기적으로/캐시에서 밀려날 때 쓴다(write-behind).
+    여러 프로세스가 같은 백엔드를 공유하면 write-through를 사용해야 한다.
+    TTL이 지난 종료 게임 정리는 두 방식 모두 put 때 ttl/4 간격으로 한다.
+
+    백엔드 쓰기는 게임 id별 잠금 안에서 그 시점의 최신 상태를 쓰므로, 같은 게임에 대한
+    동시 요청이 있어도 오래된 상태가 나중에 덮어쓰지 않는다.
+    """
+
+    def __init__(self, backend: GameBackend, capacity: int = 1024,
+                 ttl: float = 3600, flush_interval: float = 0):
+        self.backend = backend
+        self.capacity = capacity
+        self.ttl = ttl
+        self.flush_interval = flush_interval
+        self.stats = {'hits': 0, 'misses': 0, 'flushes': 0, 'evictions': 0}
+        self._cache: 'OrderedDict[str, _Entry]' = OrderedDict()
+        self._lock = threading.RLock()
+        self._write_locks = [threading.Lock() for _ in range(_WRITE_LOCK_STRIPES)]
+        self._pending: Dict[str, _Entry] = {}  # 캐시에서 밀려났지만 아직 쓰지 않은 항목
+        self._last_flush = time.time()
+        self._last_evict = time.time()
+        self._closed = False
+
+    def get(self, game_id: str, revision: Optional[int] = None) -> Tuple['Game', int]:
+        """게임과 리비전 반환
+
+        revision이 캐시와 다르면(다른 프로세스에서 변경됨) 백엔드에서 다시 읽는다.
+        단, 아직 쓰지 않은 변경이 있는 항목(write-behind, 밀려나 기록 중)은 버리지 않고 그대로 반환한다.
+        """
+        validate_game_id(game_id)
+        with self._lock:
+            pending = self._pending.get(game_id)
+            if pending is not None:
+                self.stats['hits'] += 1
+                return pending.game, pending.revision  # 밀려나 기록 중인 항목이 가장 최신
+            entry = self._cache.get(game_id)
+            if entry is not None and (revision is None or entry.revision == revision or entry.dirty):
+                self._cache.move_to_end(game_id)
+                entry.touched_at = time.time()
+                self.stats['hits'] += 1
+                return entry.game, entry.revision
+
+        self.stats['misses'] += 1
+        from app.models.game import Game
+        game = Game()
+        game.load_from_session(self.backend.load(game_id))
+        entry = _Entry(game, revision or 0)
+        with self._lock:
+            current = self._cache.get(game_id) or self._pending.get(game_id)
+            if current is not None and current.dirty:
+                return current.game, current.revision  # 읽는 동안 다른 요청이 변경함
+            self._cache[game_id] = entry
+            self._cache.move_to_end(game_id)
+            evicted = self._evict_overflow()
+        self._write_evicted(evicted)
+        return game, entry.revision
+
+    def put(self, game_id: str, game: 'Game', data: Optional[bytes] = None) -> int:
+        """게임 변경 기록, 새 리비전 반환
+
+        data는 호출한 쪽이 이미 만든 game.save_to_session() 결과 (다시 인코딩하지 않음).
+        """
+        validate_game_id(game_id)
+        with self._lock:
+            entry = self._cache.get(game_id) or self._pending.get(game_id)
+            if entry is None or entry.game is not game:
+                entry = _Entry(game, entry.revision if entry else 0)
+            self._cache[game_id] = entry
+            self._cache.move_to_end(game_id)
+            entry.revision += 1
+            entry.data = data
+            entry.dirty = True
+            entry.touched_at = time.time()
+            revision = entry.revision
+            evicted = self._evict_overflow()
+        self._write_evicted(evicted)
+
+        if not self.flush_interval:
+            self._write(game_id, entry)
+        elif time.time() - self._last_flush >= self.flush_interval:
+            self.flush()
+        if time.time() - self._last_evict >= self.ttl / 4:
+            self.evict_expired()
+        return revision
+
+    def delete(self, game_id: str) -> None:
+        """게임 삭제"""
+        with self._lock:
+            self._cache.pop(game_id, None)
+        self.backend.delete(game_id)
+
+    def flush(self) -> int:
+        """변경된 게임을 백엔드에 쓰고 만료된 종료 게임 정리"""
+        with self._lock:
+            game_ids = {game_id for game_id, entry in self._cache.items() if entry.dirty}
+        # 잠금 번호 순서로 잡아 다른 flush와 교착되지 않게 함
+        stripes = sorted({hash(game_id) % _WRITE_LOCK_STRIPES for game_id in game_ids})
+        for stripe in stripes:
+            self._write_locks[stripe].acquire()
+        try:
+            with self._lock:
+                dirty = [(game_id, self._cache[game_id]) for game_id in game_ids
+                         if game_id in self._cache and self._cache[game_id].dirty]
+                for _, entry in dirty:
+                    entry.dirty = False
+                self._last_flush = time.time()
+            items = [(game_id, entry.encoded(), entry.game.winner is not None) for game_id, entry in dirty]
+            if hasattr(self.backend, 'save_many'):
+                self.backend.save_many(items)
+            else:
+                for game_id, data, finished in items:
+                    self.backend.save(game_id, data, finished)
+        finally:
+            for stripe in stripes:
+                self._write_locks[stripe].release()
+        self.stats['flushes'] += 1
+        self.evict_expired()
+        return len(items)
+
+    def evict_expired(self) -> None:
+        """TTL이 지난 종료 게임을 캐시와 백엔드에서 제거"""
+        now = time.time()
+        before = now - self.ttl
+        with self._lock:
+            self._last_evict = now
+            expired = [game_id for game_id, entry in self._cache.items()
+                       if entry.game.winner is not None and not entry.dirty
+                       and entry.touched_at < before]
+            for game_id in expired:
+                del self._cache[game_id]
+        self.stats['evictions'] += len(expired)
+        self.backend.purge_finished(before)
+
+    def ping(self) -> None:
+        """저장소 사용 가능 여부 확인 (불가하면 예외)"""
+        if self._closed:
+            raise RuntimeError("Game store is closed")
+        self.backend.ping()
+
+    def close(self) -> None:
+        """남은 변경 사항을 쓰고 백엔드 닫기"""
+        if self._closed:
+            return
+        self._closed = True
+        self.flush()
+        self.backend.close()
+
+    def _write(self, game_id: str, entry: _Entry) -> None:
+        """항목의 최신 상태 기록 (_lock을 잡지 않은 상태에서 호출)
+
+        먼저 쓴 요청이 이미 최신 상태를 썼으면 건너뛴다.
+        """
+        with self._write_locks[hash(game_id) % _WRITE_LOCK_STRIPES]:
+            with self._lock:
+                if not entry.dirty:
+                    return
+                entry.dirty = False
+            self.backend.save(game_id, entry.encoded(), entry.game.winner is not None)
+
+    def _evict_overflow(self) -> List[Tuple[str, _Entry]]:
+        """용량을 넘으면 가장 오래된 항목부터 제거하고, 기록해야 할 변경 항목 반환"""
+        evicted = []
+        while len(self._cache) > self.capacity:
+            game_id, entry = self._cache.popitem(last=False)
+            if entry.dirty:
+                self._pending[game_id] = entry
+                evicted.append((game_id, entry))
+            self.stats['evictions'] += 1
+        return evicted
+
+    def _write_evicted(self, evicted: List[Tuple[str, _Entry]]) -> None:
+        """밀려난 변경 항목 기록 (기록 전까지는 get/put이 _pending에서 찾음)"""
+        for game_id, entry in evicted:
+            self._write(game_id, entry)
+            with self._lock:
+                if self._pending.get(game_id) is entry:
+                    del self._pending[game_id]
+
+
+def create_game_store(config) -> Optional[GameStore]:
+    """설정으로 게임 저장소 생성 (cookie 백엔드면 None)"""
+    kind = config.get('GAME_STORE_BACKEND', 'cookie')
+    if kind == 'cookie':
+        return None
+    path = config['GAME_STORE_PATH']
+    if kind == 'sqlite':
+        backend = SQLiteBackend(path)
+    elif kind == 'directory':
+        backend = DirectoryBackend(path)
+    elif kind == 'memory':
+        backend = MemoryBackend()
+    else:
+        raise ValueError(f"Unknown game store backend: {kind}")
+
+    store = GameStore(
+        backend,
+        capacity=config.get('GAME_STORE_CACHE_SIZE', 1024),
+        ttl=config.get('GAME_STORE_TTL', 3600),
+        flush_interval=config.get('GAME_STORE_FLUSH_INTERVAL', 0)
+    )
+    atexit.register(store.close)
+    return store
@@ -0,0 +1,176 @@
+"""
+사람 대전 테이블 관리
+
+테이블마다 두 사람 좌석의 Game 하나를 메모리에 두고, 좌석별 토큰으로 참가자를 구분한다.
+상태가 바뀔 때마다 테이블 버전을 올리고 구독자(좌석별 콜백)에게 그 좌석의 화면 상태를 보낸다.
+구독자는 이벤트 루프 쪽(app.realtime)에서 큐에 넣는 콜백이라 관리자는 루프와 무관하다.
+
+상대의 패는 게임이 끝날 때까지 장수만 보낸다.
+"""
+import secrets
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.models.game import Game, GameError
+from config.settings import MAX_CARDS_TO_DISCARD
+
+# 사람 대전 좌석
+TABLE_SEATS = ('Player 1', 'Player 2')
+
+Subscriber = Callable[[Dict[str, Any]], None]
+
+
+class TableError(Exception):
+    """테이블 요청 오류 (status는 HTTP 상태 코드)"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+
+
+class Table:
+    """두 사람이 참가하는 게임 테이블"""
+    __slots__ = ('id', 'game', 'tokens', 'version', 'subscribers', 'touched_at')
+
+    def __init__(self, table_id: str, game: Game):
+        self.id = table_id
+        self.game = game
+        self.tokens: Dict[str, str] = {}  # 토큰 -> 좌석
+        self.version = 0
+        self.subscribers: Dict[str, List[Subscriber]] = {seat: [] for seat in TABLE_SEATS}
+        self.touched_at = time.monotonic()
+
+    def seat_for(self, token: str) -> str:
+        """토큰의 좌석 (없으면 403)"""
+        seat = self.tokens.get(token)
+        if seat is None:
+            raise TableError(403, "테이블 토큰이 올바르지 않습니다.")
+        return seat
+
+    def view(self, seat: str) -> Dict[str, Any]:
+        """좌석에서 보이는 테이블 상태"""
+        game = self.game
+        finished = game.winner is not None
+        players = {}
+        for name, player in game.players.items():
+            visible = finished or name == seat
+            players[name] = {
+                'joined': name in self.tokens.values(),
+                'hand': player.get_hand_dict() if visible else None,
+                'cards': len(player.hand),
+                'score': player.score if visible else None,
+                'previous_score': player.previous_score if visible else None,
+            }
+        return {
+            'table': self.id,
+            'version': self.version,
+            'seat': seat,
+            'seats': {name: name in self.tokens.values() for name in TABLE_SEATS},
+            'players': players,
+            'current_turn': game.current_turn,
+            'max_turns': game.max_turns,
+            'waiting_for': game.waiting_for,
+            'winner': game.winner,
+            'ranking': game.ranking,
+        }
+
+    def publish(self) -> None:
+        """버전을 올리고 구독자에게 좌석별 상태 전송"""
+        self.version += 1
+        self.touched_at = time.monotonic()
+        for seat, callbacks in self.subscribers.items():
+            if callbacks:
+                state = self.view(seat)
+                for callback in callbacks:
+                    callback(state)
+
+
+class TableManager:
+    """프로세스 내 테이블 목록 (한 이벤트 루프 스레드에서만 사용)"""
+
+    def __init__(self, max_tables: int = 10000, ttl: float = 1800):
+        self.max_tables = max_tables
+        self.ttl = ttl
+        self.tables: Dict[str, Table] = {}
+        self.stats = {'created': 0, 'finished': 0, 'evicted': 0, 'actions': 0}
+
+    def create(self) -> Table:
+        """새 테이블 생성 (가득 차면 503)"""
+        if len(self.tables) >= self.max_tables:
+            self.evict_idle()
+            if len(self.tables) >= self.max_tables:
+                raise TableError(503, "테이블이 너무 많습니다. 잠시 후 다시 시도하세요.")
+        table_id = secrets.token_urlsafe(8)
+        table = Table(table_id, Game(seats=TABLE_SEATS, computers=()))
+        self.tables[table_id] = table
+        self.stats['created'] += 1
+        return table
+
+    def get(self, table_id: str) -> Table:
+        """테이블 반환 (없으면 404)"""
+        table = self.tables.get(table_id)
+        if table is None:
+            raise TableError(404, "테이블을 찾을 수 없습니다.")
+        return table
+
+    def join(self, table_id: str) -> Tuple[str, str]:
+        """빈 좌석에 참가, (좌석, 토큰) 반환 (두 명이 모이면 게임 시작)"""
+        table = self.get(table_id)
+        taken = set(table.tokens.values())
+        free = [seat for seat in TABLE_SEATS if seat not in taken]
+        if not free:
+            raise TableError(409, "빈 좌석이 없습니다.")
+        token = secrets.token_urlsafe(16)
+        table.tokens[token] = free[0]
+        if len(free) == 1:
+            table.game.start_game()
+        table.publish()
+        return free[0], token
+
+    def discard(self, table_id: str, token: str, indices: List[int]) -> int:
+        """토큰 좌석의 교체 (빈 목록이면 넘김), 새 버전 반환"""
+        table = self.get(table_id)
+        seat = table.seat_for(token)
+        game = table.game
+        if game.current_turn is None:
+            raise TableError(409, "진행 중인 게임이 아닙니다.")
+        hand_size = len(game.players[seat].hand)
+        if (not isinstance(indices, list) or len(indices) > MAX_CARDS_TO_DISCARD
+                or len(set(indices)) != len(indices)
+                or not all(type(i) is int and 0 <= i < hand_size for i in indices)):
+            raise TableError(400, f"교체할 카드는 0~{hand_size - 1} 범위의 서로 다른 인덱스 "
+                                  f"최대 {MAX_CARDS_TO_DISCARD}개여야 합니다.")
+        try:
+            if indices:
+                game.discard_cards(seat, indices)
+            else:
+                game.next_turn(seat)
+        except GameError as e:
+            raise TableError(409, str(e))
+        self.stats['actions'] += 1
+        if game.winner is not None:
+            self.stats['finished'] += 1
+        table.publish()
+        return table.version
+
+    def subscribe(self, table_id: str, token: str, callback: Subscriber) -> Callable[[], None]:
+        """좌석 상태 구독 (현재 상태를 바로 보냄), 구독 해제 함수 반환"""
+        table = self.get(table_id)
+        seat = table.seat_for(token)
+        table.subscribers[seat].append(callback)
+        callback(table.view(seat))
+
+        def unsubscribe() -> None:
+            if callback in table.subscribers[seat]:
+                table.subscribers[seat].remove(callback)
+        return unsubscribe
+
+    def evict_idle(self, now: Optional[float] = None) -> int:
+        """ttl 동안 변화가 없고 구독자도 없는 테이블 제거, 제거 수 반환"""
+        now = time.monotonic() if now is None else now
+        expired = [table_id for table_id, table in self.tables.items()
+                   if now - table.touched_at > self.ttl
+                   and not any(table.subscribers.values())]
+        for table_id in expired:
+            del self.tables[table_id]
+        self.stats['evicted'] += len(expired)
+        return len(expired)
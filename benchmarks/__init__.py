@@ -0,0 +1,5 @@
+"""
+성능 측정 스크립트 패키지
+
+프로젝트 루트에서 `python -m benchmarks.<모듈>` 형태로 실행한다.
+"""
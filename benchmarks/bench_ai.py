@@ -0,0 +1,60 @@
+"""
+AI 벤치마크: 휴리스틱 vs 몬테카를로
+
+결정 속도(decisions/s)와, 같은 시드의 게임에서 Player 1 자리에
+각 전략을 앉혀 휴리스틱 컴퓨터를 상대로 한 승률을 비교한다.
+"""
+import random
+import time
+from app.models.ai import PokerAI, MonteCarloAI
+from app.models.card import full_deck
+from app.models.evaluator import get_tables
+from app.models.game import Game
+from app.models.potential import get_potential_tables
+
+STRATEGIES = {
+    'heuristic': lambda hand, deck, rng: PokerAI(hand).decide_cards_to_discard(),
+    'montecarlo': lambda hand, deck, rng: MonteCarloAI(hand, deck, rng=rng).decide_cards_to_discard(),
+}
+
+
+def decisions_per_second(strategy, positions, seed=0):
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    for hand, deck in positions:
+        strategy(hand, deck, rng)
+    return len(positions) / (time.perf_counter() - start)
+
+
+def play(strategy, seed):
+    """Player 1을 strategy로 진행한 게임의 승자"""
+    random.seed(seed)
+    rng = random.Random(seed)
+    game = Game()
+    game.start_game()
+    while game.current_turn is not None:
+        player = game.players['Player 1']
+        game.discard_cards('Player 1', strategy(player.hand, player.deck, rng))
+    return game.winner
+
+
+def main(positions=300, games=300):
+    get_tables()
+    get_potential_tables()
+    rng = random.Random(42)
+    sample = []
+    for _ in range(positions):
+        deck = full_deck()
+        rng.shuffle(deck)
+        sample.append((deck[:7], deck[7:26]))
+
+    for name, strategy in STRATEGIES.items():
+        rate = decisions_per_second(strategy, sample)
+        results = [play(strategy, seed) for seed in range(games)]
+        wins = results.count('Player 1') / games
+        draws = results.count('Draw') / games
+        print(f"{name:10s}: {rate:8.0f} decisions/s, 승률 {wins:.1%} (무승부 {draws:.1%})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,45 @@
+"""
+HTML 라우트 vs JSON API: 액션당 응답 크기와 서버 처리 시간
+
+게임 하나를 시작하고 끝날 때까지 카드 3장씩 교체한다.
+"""
+import statistics
+import time
+from app import create_app, init_game_store
+from app.models.evaluator import get_tables
+
+
+def run(app, games, start, discard):
+    sizes, latencies = [], []
+    for _ in range(games):
+        client = app.test_client()
+        response = start(client)
+        game_id = response.get_json()['id'] if response.is_json else None
+        for _ in range(app.config['MAX_TURNS']):
+            begin = time.perf_counter()
+            response = discard(client, game_id)
+            latencies.append(time.perf_counter() - begin)
+            sizes.append(len(response.data))
+    latencies.sort()
+    return statistics.mean(sizes), statistics.mean(latencies), latencies[int(len(latencies) * 0.95)]
+
+
+def main(games=200):
+    app = create_app('development')
+    app.config.update(WTF_CSRF_ENABLED=False, GAME_STORE_BACKEND='memory')
+    init_game_store(app)
+    get_tables()
+
+    html = run(app, games, lambda c: c.get('/start'),
+               lambda c, _: c.post('/discard', data={'discard': '0,1,2'}))
+    api = run(app, games, lambda c: c.post('/api/games'),
+              lambda c, game_id: c.post(f'/api/games/{game_id}/discard', json={'discard': [0, 1, 2]}))
+    app.extensions['game_store'].close()
+
+    for name, (size, mean, p95) in (('HTML /discard', html), ('API discard', api)):
+        print(f"{name:14s}: 응답 {size:8,.0f} B, 평균 {mean * 1000:6.2f} ms, p95 {p95 * 1000:6.2f} ms")
+    print(f"응답 크기 {html[0] / api[0]:.1f}x, 처리 시간 {html[1] / api[1]:.1f}x 감소")
+
+
+if __name__ == '__main__':
+    main()
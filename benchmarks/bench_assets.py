@@ -0,0 +1,81 @@
+"""
+정적 자원 전송량: /static 원본 vs 빌드된 /assets (해시 이름, 압축본, immutable 캐시)
+
+브라우저 캐시를 흉내 내는 클라이언트로 한 게임(메인 -> 컴퓨터 대전 -> 시작 -> 교체 5번)을
+진행하며 각 페이지의 <link>/<script> 자원 요청 수와 전송 바이트(헤더 + 본문)를 센다.
+- 캐시에 있고 immutable이면 요청하지 않음
+- 캐시에 있으면 조건부 요청(If-None-Match / If-Modified-Since)으로 재검증
+"""
+import re
+from app import create_app, init_game_store
+from app.assets import build_assets
+from app.models.evaluator import get_tables
+
+_ASSET = re.compile(r'<(?:link[^>]*href|script[^>]*src)="(/(?:static|assets)/[^"]+)"')
+
+
+class CachingClient:
+    """Cache-Control/ETag만 처리하는 단순한 브라우저 캐시"""
+
+    def __init__(self, client):
+        self.client = client
+        self.cache = {}  # url -> (immutable, 재검증 헤더)
+        self.requests = 0
+        self.bytes = 0
+
+    def page(self, method, url, **kwargs):
+        response = getattr(self.client, method)(url, headers={'Accept-Encoding': 'gzip, br'}, **kwargs)
+        for asset in _ASSET.findall(response.get_data(as_text=True)):
+            self.fetch(asset)
+
+    def fetch(self, url):
+        cached = self.cache.get(url)
+        if cached is not None and cached[0]:
+            return
+        headers = {'Accept-Encoding': 'gzip, br'}
+        if cached is not None:
+            headers.update(cached[1])
+        response = self.client.get(url, headers=headers)
+        self.requests += 1
+        self.bytes += len(response.data) + sum(len(k) + len(v) + 4 for k, v in response.headers.items())
+        if response.status_code == 200:
+            revalidate = {}
+            if response.headers.get('ETag'):
+                revalidate['If-None-Match'] = response.headers['ETag']
+            if response.headers.get('Last-Modified'):
+                revalidate['If-Modified-Since'] = response.headers['Last-Modified']
+            self.cache[url] = (response.cache_control.immutable, revalidate)
+        response.close()
+
+
+def play(manifest):
+    app = create_app('development')
+    app.config.update(WTF_CSRF_ENABLED=False, GAME_STORE_BACKEND='memory')
+    init_game_store(app)
+    app.extensions['assets'].clear()
+    app.extensions['assets'].update(manifest)
+
+    browser = CachingClient(app.test_client())
+    browser.page('get', '/')
+    first = (browser.requests, browser.bytes)
+    browser.page('get', '/play/computer')
+    browser.page('get', '/start')
+    for _ in range(5):
+        browser.page('post', '/discard', data={'discard': '0,1,2'})
+    app.extensions['game_store'].close()
+    return first, (browser.requests, browser.bytes)
+
+
+def main():
+    get_tables()
+    app = create_app('development')
+    manifest = build_assets(app.static_folder)
+
+    for name, result in (('/static 원본', play({})), ('/assets 빌드', play(manifest))):
+        (first_requests, first_bytes), (requests, total) = result
+        print(f"{name:12s}: 첫 페이지 {first_requests}회 {first_bytes:7,} B, "
+              f"게임 전체(8페이지) {requests:2d}회 {total:7,} B")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+"""
+NumPy 일괄 점수 계산 처리량 벤치마크
+"""
+import random
+import time
+import numpy as np
+from app.models.batch import score_batch
+from app.models.evaluator import evaluate_ids, get_tables
+
+
+def random_hands(count, seed=0):
+    """중복 없는 7장 패 (N, 7) 배열"""
+    rng = np.random.default_rng(seed)
+    return np.argsort(rng.random((count, 52)), axis=1)[:, :7]
+
+
+def main(count=1_000_000):
+    hands = random_hands(count)
+
+    start = time.perf_counter()
+    score_batch(hands)
+    batch_time = time.perf_counter() - start
+
+    get_tables()
+    sample = hands[:100_000].tolist()
+    start = time.perf_counter()
+    for hand in sample:
+        evaluate_ids(hand)
+    table_time = (time.perf_counter() - start) * count / len(sample)
+
+    print(f"score_batch    : {count / batch_time:12,.0f} hands/s")
+    print(f"evaluate_ids   : {count / table_time:12,.0f} hands/s ({table_time / batch_time:.1f}x 느림)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,76 @@
+"""
+카드 표현 벤치마크: 기존 dataclass 카드 vs 인턴된 싱글턴 카드
+"""
+import time
+import tracemalloc
+from dataclasses import dataclass
+from app.models.card import Card
+from app.models.game import Game
+from config.settings import SUITS, RANKS, RANK_VALUES
+
+
+@dataclass
+class LegacyCard:
+    """기존 dataclass 카드 (비교용)"""
+    suit: str
+    rank: str
+
+    def __post_init__(self):
+        if self.suit not in SUITS:
+            raise ValueError(f"Invalid suit: {self.suit}")
+        if self.rank not in RANKS:
+            raise ValueError(f"Invalid rank: {self.rank}")
+
+    @property
+    def value(self) -> int:
+        return RANK_VALUES[self.rank]
+
+
+def memory_of(factory, dicts, copies=100):
+    """카드 목록 copies개를 만들 때 할당된 메모리"""
+    tracemalloc.start()
+    keep = [[factory(d) for d in dicts] for _ in range(copies)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del keep
+    return current / copies
+
+
+def time_of(func, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat=2000):
+    dicts = [{'suit': suit, 'rank': rank} for suit in SUITS for rank in RANKS]
+
+    legacy_mem = memory_of(lambda d: LegacyCard(**d), dicts)
+    new_mem = memory_of(Card.from_dict, dicts)
+    print(f"52장 메모리   : 기존 {legacy_mem:8.0f} B, 인턴 {new_mem:8.0f} B")
+
+    legacy_build = time_of(lambda: [LegacyCard(**d) for d in dicts], repeat)
+    new_build = time_of(lambda: [Card.from_dict(d) for d in dicts], repeat)
+    print(f"52장 복원     : 기존 {legacy_build * 1e6:8.2f} us, 인턴 {new_build * 1e6:8.2f} us "
+          f"({legacy_build / new_build:.1f}x)")
+
+    legacy_cards = [LegacyCard(**d) for d in dicts]
+    new_cards = [Card.from_dict(d) for d in dicts]
+    legacy_value = time_of(lambda: sum(c.value for c in legacy_cards), repeat)
+    new_value = time_of(lambda: sum(c.value for c in new_cards), repeat)
+    print(f"value 52회    : 기존 {legacy_value * 1e6:8.2f} us, 인턴 {new_value * 1e6:8.2f} us "
+          f"({legacy_value / new_value:.1f}x)")
+
+    game = Game()
+    game.start_game()
+    data = game.save_to_session()
+
+    def load():
+        Game().load_from_session(data)
+
+    print(f"load_from_session: {time_of(load, repeat) * 1e6:8.2f} us/회")
+
+
+if __name__ == '__main__':
+    main()
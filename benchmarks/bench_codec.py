@@ -0,0 +1,68 @@
+"""
+세션 코덱 벤치마크: 딕셔너리 형식 vs 바이너리 형식(버전 1) vs 시드 + 행동 로그(버전 2)
+
+Flask 세션 쿠키와 같은 서명 직렬화기로 크기와 왕복 시간을 비교한다.
+버전 2는 불러올 때 게임을 재생하므로 크기 대신 로드 시간이 늘어난다.
+"""
+import time
+from flask.sessions import SecureCookieSessionInterface
+from app import create_app
+from app.models.codec import encode_state
+from app.models.game import Game
+
+
+def legacy_dict(game):
+    """이전 버전의 딕셔너리 세션 형식"""
+    return {
+        'players': {
+            name: {
+                'name': player.name,
+                'hand': [card.to_dict() for card in player.hand],
+                'deck': [card.to_dict() for card in player.deck],
+                'score': player.score,
+                'previous_score': player.previous_score,
+                'card_changes': player.card_changes
+            } for name, player in game.players.items()
+        },
+        'current_turn': game.current_turn,
+        'max_turns': game.max_turns,
+        'winner': game.winner
+    }
+
+
+def round_trip_time(serializer, make_value, load, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        cookie = serializer.dumps({'game': make_value()})
+        load(serializer.loads(cookie)['game'])
+    return (time.perf_counter() - start) / repeat
+
+
+def main(repeat=2000):
+    app = create_app('development')
+    serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+
+    game = Game()
+    game.start_game()
+    game.discard_cards('Player 1', [0, 1, 2])
+
+    def full_state():
+        return encode_state(game.current_turn, game.max_turns, game.winner, game.players)
+
+    formats = (('딕셔너리', lambda: legacy_dict(game)), ('버전 1', full_state),
+               ('버전 2', game.save_to_session))
+    results = []
+    for name, make_value in formats:
+        value = make_value()
+        cookie = serializer.dumps({'game': value})
+        raw = len(value) if isinstance(value, bytes) else None
+        elapsed = round_trip_time(serializer, make_value, lambda data: Game().load_from_session(data), repeat)
+        results.append((name, len(cookie), raw, elapsed))
+
+    base = results[0][3]
+    for name, cookie, raw, elapsed in results:
+        raw_text = f"(원본 {raw} B)" if raw is not None else ""
+        print(f"{name:5s}: 쿠키 {cookie:5d} B {raw_text:12s} 왕복 {elapsed * 1e6:8.1f} us ({base / elapsed:.1f}x)")
+
+if __name__ == '__main__':
+    main()
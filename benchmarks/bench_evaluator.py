@@ -0,0 +1,50 @@
+"""
+패 평가기 벤치마크: 기존 getattr 규칙 체인 vs 테이블 조회
+"""
+import random
+import time
+from app.models.card import Card
+from app.models.hand import Hand
+from app.models.evaluator import get_tables, evaluate_ids, card_id
+from config.settings import SUITS, RANKS, HAND_RANKINGS
+
+
+def legacy_analyze(cards):
+    """기존 Hand.analyze 방식 (Counter + getattr 체인)"""
+    hand = Hand(cards)
+    for hand_type, multiplier in HAND_RANKINGS[:-1]:
+        if getattr(hand, f'is_{hand_type.lower().replace(" ", "_")}')():
+            return (hand._total_value * multiplier, hand_type,
+                    hand._total_value, multiplier)
+    return (hand._total_value, 'High Card', hand._total_value, 1)
+
+
+def measure(func, hands):
+    start = time.perf_counter()
+    for hand in hands:
+        func(hand)
+    return (time.perf_counter() - start) / len(hands)
+
+
+def main(num_hands=50000, seed=1):
+    start = time.perf_counter()
+    get_tables()
+    build_time = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    deck = [Card(suit, rank) for suit in SUITS for rank in RANKS]
+    hands = [rng.sample(deck, 7) for _ in range(num_hands)]
+    id_hands = [[card_id(c.suit, c.rank) for c in hand] for hand in hands]
+
+    legacy = measure(legacy_analyze, hands)
+    table = measure(lambda cards: Hand(cards).analyze(), hands)
+    raw = measure(evaluate_ids, id_hands)
+
+    print(f"테이블 생성: {build_time * 1000:.1f} ms")
+    print(f"기존 규칙 체인     : {legacy * 1e6:8.2f} us/hand")
+    print(f"Hand.analyze(테이블): {table * 1e6:8.2f} us/hand ({legacy / table:.1f}x)")
+    print(f"evaluate_ids       : {raw * 1e6:8.2f} us/hand ({legacy / raw:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
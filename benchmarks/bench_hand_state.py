@@ -0,0 +1,69 @@
+"""
+교체 후 점수 계산 벤치마크: 전체 재계산 vs 증분 패 상태
+
+같은 교체 순서(7장 패에서 3장 교체 x 5턴)를 세 가지 방식으로 처리한다.
+"""
+import random
+import time
+from app.models.card import full_deck
+from app.models.evaluator import evaluate_cards, get_tables
+from app.models.hand import Hand
+from app.models.hand_state import HandState
+
+
+def make_games(count, seed=4):
+    """(처음 패, [(버릴 카드, 뽑을 카드)] x 5) 목록"""
+    rng = random.Random(seed)
+    games = []
+    for _ in range(count):
+        deck = full_deck()
+        rng.shuffle(deck)
+        hand = [deck.pop() for _ in range(7)]
+        current, steps = list(hand), []
+        for _ in range(5):
+            removed = rng.sample(current, 3)
+            added = [deck.pop() for _ in removed]
+            current = [card for card in current if card not in removed] + added
+            steps.append((removed, added))
+        games.append((hand, steps))
+    return games
+
+
+def full_hand(games):
+    for hand, steps in games:
+        for removed, added in steps:
+            hand = [card for card in hand if card not in removed] + added
+            Hand(hand).analyze()
+
+
+def full_table(games):
+    for hand, steps in games:
+        for removed, added in steps:
+            hand = [card for card in hand if card not in removed] + added
+            evaluate_cards(hand)
+
+
+def incremental(games):
+    for hand, steps in games:
+        state = HandState(hand)
+        for removed, added in steps:
+            state.replace(removed, added)
+            state.score()
+
+
+def main(count=20000):
+    get_tables()
+    games = make_games(count)
+    results = []
+    for name, func in (('Hand(...).analyze', full_hand), ('evaluate_cards', full_table),
+                       ('HandState.replace', incremental)):
+        start = time.perf_counter()
+        func(games)
+        results.append((name, (time.perf_counter() - start) / (count * 5)))
+    base = results[0][1]
+    for name, elapsed in results:
+        print(f"{name:18s}: {elapsed * 1e6:6.2f} us/교체 ({base / elapsed:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
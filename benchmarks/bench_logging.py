@@ -0,0 +1,99 @@
+"""
+로깅 방식별 요청 지연 시간 (동시 요청)
+
+기존: 앱 로거에 RotatingFileHandler(10 KB, 동기 기록)
+변경: QueueHandler + 백그라운드 리스너 (JSON Lines, 10 MB 회전)
+
+여러 스레드가 테스트 클라이언트로 /start를 반복 요청한다 (요청마다 INFO 로그 1줄 이상).
+"""
+import logging
+import os
+import statistics
+import tempfile
+import threading
+import time
+from logging.handlers import RotatingFileHandler
+from app import create_app, init_game_store
+from app.log import start_logging, stop_logging
+from app.models.evaluator import get_tables
+
+
+def legacy_logging(app, directory):
+    """변경 전 setup_logging과 같은 구성"""
+    stop_logging()
+    handler = RotatingFileHandler(os.path.join(directory, 'legacy.log'), maxBytes=10240, backupCount=10)
+    handler.setFormatter(logging.Formatter('%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'))
+    handler.setLevel(logging.INFO)
+    app.logger.addHandler(handler)
+    return handler
+
+
+def queue_logging(app, directory):
+    start_logging(app.logger, logging.INFO, os.path.join(directory, 'poker.log'),
+                  max_bytes=10 * 1024 * 1024, backup_count=5, console=False)
+    return None
+
+
+def run(setup, threads, requests_per_thread):
+    app = create_app('development')
+    app.config.update(GAME_STORE_BACKEND='memory')
+    init_game_store(app)
+    with tempfile.TemporaryDirectory() as tmp:
+        stop_logging()
+        handler = setup(app, tmp)
+        latencies = []
+        lock = threading.Lock()
+
+        def worker():
+            client = app.test_client()
+            local = []
+            for _ in range(requests_per_thread):
+                start = time.perf_counter()
+                client.get('/start')
+                local.append(time.perf_counter() - start)
+                client.get('/new_game')  # 다음 /start가 새 게임을 만들도록
+            with lock:
+                latencies.extend(local)
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        stop_logging()
+        if handler is not None:
+            app.logger.removeHandler(handler)
+            handler.close()
+    latencies.sort()
+    return statistics.mean(latencies), latencies[int(len(latencies) * 0.95)]
+
+
+def call_cost(setup, count=20000):
+    """요청 스레드에서 logger.info 한 번에 드는 시간"""
+    app = create_app('development')
+    with tempfile.TemporaryDirectory() as tmp:
+        stop_logging()
+        handler = setup(app, tmp)
+        logger = logging.getLogger('app.routes')
+        start = time.perf_counter()
+        for i in range(count):
+            logger.info("새 게임 시작 %d", i)
+        elapsed = (time.perf_counter() - start) / count
+        stop_logging()
+        if handler is not None:
+            app.logger.removeHandler(handler)
+            handler.close()
+    return elapsed
+
+
+def main(threads=8, requests_per_thread=200):
+    get_tables()
+    for name, setup in (('RotatingFileHandler 10KB', legacy_logging), ('QueueHandler + 리스너', queue_logging)):
+        print(f"{name:24s}: 로그 호출당 {call_cost(setup) * 1e6:6.1f} us (요청 스레드)")
+    for name, setup in (('RotatingFileHandler 10KB', legacy_logging), ('QueueHandler + 리스너', queue_logging)):
+        mean, p95 = run(setup, threads, requests_per_thread)
+        print(f"{name:24s}: 평균 {mean * 1000:6.2f} ms, p95 {p95 * 1000:6.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,47 @@
+"""
+요청 계측 오버헤드: 꺼짐 vs 켜짐 vs 켜짐 + cProfile 샘플링
+
+꺼짐을 먼저 측정한다 (켜면 Hand.analyze/AI 래퍼가 프로세스에 남음).
+"""
+import statistics
+import tempfile
+import time
+from app import create_app, init_game_store
+from app.metrics import init_metrics
+from app.models.evaluator import get_tables
+
+
+def run(config, games):
+    app = create_app('development')
+    app.config.update(WTF_CSRF_ENABLED=False, GAME_STORE_BACKEND='memory', **config)
+    init_game_store(app)
+    init_metrics(app)
+    latencies = []
+    for _ in range(games):
+        client = app.test_client()
+        for method, path, data in [('get', '/start', None)] + [('post', '/discard', {'discard': '0,1,2'})] * 5:
+            start = time.perf_counter()
+            getattr(client, method)(path, data=data)
+            latencies.append(time.perf_counter() - start)
+    return statistics.mean(latencies)
+
+
+def main(games=300):
+    get_tables()
+    run({}, games // 3)  # 워밍업
+    with tempfile.TemporaryDirectory() as tmp:
+        configs = [
+            ('꺼짐', {}),
+            ('히스토그램', {'METRICS_ENABLED': True}),
+            ('히스토그램 + cProfile 10%', {'METRICS_ENABLED': True, 'PROFILE_SLOW_REQUEST_MS': 1000,
+                                          'PROFILE_SAMPLE_RATE': 0.1, 'PROFILE_DIR': tmp}),
+        ]
+        base = None
+        for name, config in configs:
+            mean = run(config, games)
+            base = base or mean
+            print(f"{name:24s}: 평균 {mean * 1000:6.3f} ms ({(mean / base - 1) * 100:+5.1f}%)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""
+휴리스틱 AI 결정 벤치마크: 패 훑기 vs 드로우 테이블 조회
+
+같은 무작위 7장 패 목록에 대해 기존 방식(Hand 생성 + 잠재력 분석 + 분기별 스캔)과
+테이블 조회 결정의 결정/초를 비교하고, 결과가 모두 같은지 확인한다.
+"""
+import random
+import time
+from app.models.ai import PokerAI
+from app.models.card import full_deck
+from app.models.evaluator import get_tables
+from app.models.potential import get_potential_tables
+
+
+def make_hands(count, seed=16):
+    rng = random.Random(seed)
+    deck = full_deck()
+    return [rng.sample(deck, 7) for _ in range(count)]
+
+
+def main(count=50000):
+    get_tables()
+    start = time.perf_counter()
+    get_potential_tables()
+    print(f"테이블 생성: {(time.perf_counter() - start) * 1e3:.0f} ms")
+
+    hands = make_hands(count)
+    results = []
+    for name, decide in (('스캔', lambda hand: PokerAI(hand)._decide_by_scan()),
+                         ('테이블', lambda hand: PokerAI(hand).decide_cards_to_discard())):
+        start = time.perf_counter()
+        decisions = [decide(hand) for hand in hands]
+        results.append((name, count / (time.perf_counter() - start), decisions))
+
+    assert results[0][2] == results[1][2], "결정이 다름"
+    base = results[0][1]
+    for name, rate, _ in results:
+        print(f"{name:6s}: {rate:9.0f} decisions/s ({rate / base:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
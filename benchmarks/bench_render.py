@@ -0,0 +1,79 @@
+"""
+템플릿 렌더링 캐시 벤치마크: RENDER_CACHE 끄기 vs 켜기
+
+- computer.html 렌더링 (카드 14장)
+- GET / (전체 페이지 캐시), GET /hand-rankings (족보표 팝업 조각)
+- POST /discard 요청 전체 (세션 로드, 교체, 컴퓨터 차례, 렌더링, 저장)
+
+측정값은 같은 머신의 다른 부하에 흔들리므로 두 설정을 번갈아 여러 라운드 재고 가장 빠른 라운드를 쓴다.
+"""
+import time
+from flask import render_template
+from app import create_app, init_game_store
+from app.models.evaluator import get_tables
+from app.models.game import Game
+
+
+def timed(fn, repeat):
+    """fn 한 번의 평균 시간 (fn이 시간을 반환하면 그 값의 평균)"""
+    total = 0.0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        spent = fn()
+        total += spent if isinstance(spent, float) else time.perf_counter() - start
+    return total / repeat
+
+
+def cases(enabled):
+    """측정할 (이름, 함수) 목록"""
+    app = create_app('development')
+    app.config.update(WTF_CSRF_ENABLED=False, GAME_STORE_BACKEND='memory', RENDER_CACHE=enabled)
+    init_game_store(app)
+    app.extensions['render_cache'].enabled = enabled
+
+    game = Game(seed=20)
+    game.start_game()
+    game.discard_cards('Player 1', [0, 1, 2])
+    state = game.get_game_state()
+    context = app.test_request_context('/discard')
+
+    def render():
+        with context:
+            render_template('computer.html', **state)
+
+    client = app.test_client()
+    turns = [0]
+
+    def discard():
+        # 5턴이 끝나면 새 게임 (새 게임 요청은 재지 않음)
+        if turns[0] % 5 == 0:
+            client.get('/new_game')
+            client.get('/start')
+        turns[0] += 1
+        start = time.perf_counter()
+        client.post('/discard', data={'discard': '0,1,2'})
+        return time.perf_counter() - start
+
+    return [('computer.html 렌더링', render), ('GET /', lambda: client.get('/')),
+            ('GET /hand-rankings', lambda: client.get('/hand-rankings')),
+            ('POST /discard', discard)]
+
+
+def main(repeat=300, rounds=7):
+    get_tables()
+    off, on = cases(False), cases(True)
+    best = {}
+    # 캐시 없음/있음을 번갈아 재서 머신 부하 변화의 영향을 줄임
+    for _ in range(rounds):
+        for label, items in (('off', off), ('on', on)):
+            for name, fn in items:
+                elapsed = timed(fn, repeat)
+                best[label, name] = min(best.get((label, name), elapsed), elapsed)
+    for name, _ in off:
+        before, after = best['off', name], best['on', name]
+        print(f"{name:28s}: 캐시 없음 {before * 1e6:7.0f} µs, 캐시 {after * 1e6:7.0f} µs "
+              f"({before / after:.1f}x)")
+
+
+if __name__ == '__main__':
+    main()
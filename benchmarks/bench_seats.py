@@ -0,0 +1,68 @@
+"""
+좌석 수별 게임 비용: 2, 4, 8좌석
+
+사람 한 명과 휴리스틱 컴퓨터(좌석 수 - 1)로 게임을 끝까지 진행하며
+게임 시작, 좌석당 행동, 세션 저장/복원 시간과 세션 크기를 잰다.
+좌석 수에 비례해 늘어야 하므로 좌석당 값이 비슷한지 본다.
+"""
+import random
+import time
+from app.models.evaluator import get_tables
+from app.models.game import Game, DECK_PER_SEAT, DECK_SHARED, DECK_SPLIT, seat_names
+from app.models.potential import get_potential_tables
+
+
+def layouts():
+    for count in (2, 4, 8):
+        for policy in (DECK_SPLIT, DECK_SHARED, DECK_PER_SEAT):
+            try:
+                seats, computers = seat_names(count, (1 << count) - 2)
+                Game(seats=seats, computers=computers, deck_policy=policy)
+            except Exception:
+                continue  # 8좌석은 나눌 카드가 부족한 정책이 있음
+            yield count, policy, seats, computers
+
+
+def run(count, policy, seats, computers, games):
+    rng = random.Random(count)
+    start_time = act_time = save_time = load_time = 0.0
+    actions = size = 0
+    for _ in range(games):
+        game = Game('heuristic', rng=rng, seats=seats, computers=computers, deck_policy=policy)
+        t0 = time.perf_counter()
+        game.start_game()
+        t1 = time.perf_counter()
+        while game.current_turn is not None:
+            game.next_turn() if rng.random() < 0.3 else game.discard_cards('Player 1', [0, 1])
+        t2 = time.perf_counter()
+        data = game.save_to_session()
+        t3 = time.perf_counter()
+        Game(seats=seats, computers=computers, deck_policy=policy).load_from_session(data)
+        t4 = time.perf_counter()
+        start_time += t1 - t0
+        act_time += t2 - t1
+        save_time += t3 - t2
+        load_time += t4 - t3
+        actions += len(game.actions)
+        size += len(data)
+    return {
+        'start_us': start_time / games * 1e6,
+        'action_us': act_time / actions * 1e6,
+        'session_bytes': size / games,
+        'save_us': save_time / games * 1e6,
+        'load_us': load_time / games * 1e6,
+    }
+
+
+def main(games=2000):
+    get_tables()
+    get_potential_tables()
+    print(f"{'좌석':>4} {'덱 정책':9s} {'시작 µs':>8} {'행동 µs':>8} {'세션 B':>7} {'저장 µs':>8} {'복원 µs':>8} {'복원/좌석':>9}")
+    for count, policy, seats, computers in layouts():
+        r = run(count, policy, seats, computers, games)
+        print(f"{count:4d} {policy:9s} {r['start_us']:8.1f} {r['action_us']:8.1f} {r['session_bytes']:7.1f} "
+              f"{r['save_us']:8.1f} {r['load_us']:8.1f} {r['load_us'] / count:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+"""
+정확한 최적화기 벤치마크
+
+남은 턴 수별 포지션당 풀이 시간과, 같은 포지션에서 휴리스틱/몬테카를로 AI가
+남은 턴을 진행해 얻은 최종 점수를 최적 점수(오라클)와 비교한다.
+"""
+import random
+import statistics
+import time
+from app.models.ai import PokerAI, MonteCarloAI
+from app.models.card import full_deck
+from app.models.evaluator import get_tables
+from app.models.player import Player
+from app.models.solver import solve, _solve_stream
+
+STRATEGIES = {
+    'heuristic': lambda player, turns_left, rng: PokerAI(player.hand),
+    'montecarlo': lambda player, turns_left, rng: MonteCarloAI(player.hand, player.deck, rng=rng),
+}
+
+
+def deal(rng):
+    deck = full_deck()
+    rng.shuffle(deck)
+    return deck[:7], deck[7:26]
+
+
+def play(make_ai, hand, deck, turns, rng):
+    player = Player('Bench')
+    player.hand, player.deck = list(hand), list(deck)
+    for turn in range(turns):
+        indices = make_ai(player, turns - turn, rng).decide_cards_to_discard()
+        if indices:
+            player.discard_cards(indices)
+    player._calculate_score()
+    return player.score[0]
+
+
+def main(positions=40):
+    get_tables()
+    rng = random.Random(7)
+    sample = [deal(rng) for _ in range(positions)]
+
+    print("풀이 시간 (포지션당)")
+    for turns in range(1, 6):
+        _solve_stream.cache_clear()
+        times = []
+        for hand, deck in sample:
+            start = time.perf_counter()
+            solve(hand, deck, turns)
+            times.append(time.perf_counter() - start)
+        print(f"  {turns}턴: 평균 {statistics.mean(times) * 1000:7.2f} ms, 최대 {max(times) * 1000:7.2f} ms")
+
+    turns = 4
+    optimal = [solve(hand, deck, turns).score[0] for hand, deck in sample]
+    print(f"{turns}턴 최종 점수 (최적 평균 {statistics.mean(optimal):.1f})")
+    for name, make_ai in STRATEGIES.items():
+        scores = [play(make_ai, hand, deck, turns, random.Random(i))
+                  for i, (hand, deck) in enumerate(sample)]
+        ratio = statistics.mean(s / o for s, o in zip(scores, optimal))
+        print(f"  {name:10s}: 평균 {statistics.mean(scores):6.1f}, 최적 대비 {ratio:.1%}")
+
+
+if __name__ == '__main__':
+    main()
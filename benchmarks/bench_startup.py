@@ -0,0 +1,123 @@
+"""
+앱 시작 시간: 새 프로세스 시작부터 첫 게임 페이지 응답까지
+
+    python -m benchmarks.bench_startup              # 캐시 없음 / 첫 실행 / 캐시 있음 비교
+    python -m benchmarks.bench_startup --profile    # import 시간 분석 (python -X importtime)
+
+측정마다 새 인터프리터를 임시 디렉터리에서 띄워(data/, logs/가 거기 생김)
+import app -> create_app -> 첫 GET /start(모델 import, 평가 테이블, 템플릿 컴파일 포함)
+구간을 재고, 부모 프로세스가 잰 전체 시간(인터프리터 시작 포함)을 함께 보여 준다.
+
+    캐시 없음   TABLE_CACHE_PATH/JINJA_BYTECODE_CACHE를 끈 상태 (매번 테이블 생성, 템플릿 컴파일)
+    첫 실행     캐시 디렉터리가 비어 있는 상태 (만들고 저장하는 비용 포함)
+    캐시 있음   이전 실행이 남긴 테이블 파일과 템플릿 바이트코드를 읽는 상태
+"""
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+from app import create_app
+imported = time.perf_counter()
+app = create_app('development')
+if sys.argv[1] == 'off':
+    from app.models.table_cache import set_cache_path
+    set_cache_path(None)
+    app.jinja_env.bytecode_cache = None
+created = time.perf_counter()
+response = app.test_client().get('/start')
+assert response.status_code == 200, response.status_code
+done = time.perf_counter()
+print(json.dumps({'finished_at': time.time(), 'import': imported - start,
+                  'create_app': created - imported, 'first_response': done - created}))
+'''
+
+MODES = (('캐시 없음', 'off', False), ('첫 실행', 'on', False), ('캐시 있음', 'on', True))
+
+
+def run_child(mode, cwd, extra_args=()):
+    """자식 프로세스 한 번 실행, (구간별 시간, 전체 시간, stderr) 반환"""
+    env = dict(os.environ, PYTHONPATH=ROOT, SECRET_KEY='bench-startup')
+    started = time.time()
+    result = subprocess.run([sys.executable, *extra_args, '-c', CHILD, mode], cwd=cwd, env=env,
+                            capture_output=True, text=True, check=True)
+    phases = json.loads(result.stdout.strip().splitlines()[-1])
+    return phases, phases.pop('finished_at') - started, result.stderr
+
+
+def compare(rounds):
+    samples = defaultdict(list)
+    with tempfile.TemporaryDirectory() as warm:
+        run_child('on', warm)  # 캐시 있음 모드용 캐시 채우기
+        # 모드를 번갈아 재서 머신 부하 변화의 영향을 줄임
+        for _ in range(rounds):
+            for name, mode, cached in MODES:
+                if cached:
+                    samples[name].append(run_child(mode, warm)[:2])
+                else:
+                    with tempfile.TemporaryDirectory() as cold:
+                        samples[name].append(run_child(mode, cold)[:2])
+
+    print(f"중앙값 ({rounds}회), 단위 ms")
+    print(f"{'':10s} {'import app':>10s} {'create_app':>10s} {'첫 응답':>8s} {'시작~첫 응답':>12s}")
+    for name, _, _ in MODES:
+        runs = samples[name]
+        median = {key: statistics.median(phases[key] for phases, _ in runs) * 1000
+                  for key in ('import', 'create_app', 'first_response')}
+        total = statistics.median(total for _, total in runs) * 1000
+        print(f"{name:10s} {median['import']:10.1f} {median['create_app']:10.1f} "
+              f"{median['first_response']:10.1f} {total:14.1f}")
+
+
+def profile(top):
+    """-X importtime 출력을 최상위 패키지별 self 시간과 app 모듈별 누적 시간으로 요약"""
+    with tempfile.TemporaryDirectory() as cwd:
+        run_child('on', cwd)
+        phases, total, stderr = run_child('on', cwd, ('-X', 'importtime'))
+    by_package = defaultdict(int)
+    app_modules = []
+    for line in stderr.splitlines():
+        match = re.match(r'import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)', line)
+        if not match:
+            continue
+        self_us, cumulative_us, name = int(match.group(1)), int(match.group(2)), match.group(4)
+        by_package[name.split('.')[0]] += self_us
+        if name == 'app' or name.startswith(('app.', 'config')):
+            app_modules.append((cumulative_us, name))
+
+    print(f"시작~첫 응답 {total * 1000:.1f} ms (import app {phases['import'] * 1000:.1f}, "
+          f"create_app {phases['create_app'] * 1000:.1f}, 첫 응답 {phases['first_response'] * 1000:.1f})")
+    print(f"\n패키지별 import self 시간 합 (상위 {top}개, 첫 응답 중 import 포함)")
+    for package, us in sorted(by_package.items(), key=lambda item: -item[1])[:top]:
+        print(f"  {package:24s} {us / 1000:7.1f} ms")
+    print(f"\napp/config 모듈 누적 import 시간 (상위 {top}개)")
+    for us, name in sorted(app_modules, reverse=True)[:top]:
+        print(f"  {name:24s} {us / 1000:7.1f} ms")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='앱 시작부터 첫 응답까지 시간 측정')
+    parser.add_argument('--rounds', type=int, default=7)
+    parser.add_argument('--profile', action='store_true', help='import 시간 분석')
+    parser.add_argument('--top', type=int, default=12)
+    args = parser.parse_args(argv)
+    if args.profile:
+        profile(args.top)
+    else:
+        compare(args.rounds)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
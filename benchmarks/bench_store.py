@@ -0,0 +1,85 @@
+"""
+게임 저장소 부하 테스트: 쿠키 세션 vs 서버 측 저장소
+
+테스트 클라이언트로 /start -> /discard x4 -> /next_turn 흐름을 반복하며
+요청당 지연 시간을 비교한다.
+"""
+import os
+import statistics
+import tempfile
+import time
+from flask.sessions import SecureCookieSessionInterface
+from app import create_app, init_game_store
+from app.models.game import Game
+from app.store import GameStore, MemoryBackend
+
+
+def run(config, games):
+    app = create_app('development')
+    app.config.update(WTF_CSRF_ENABLED=False, **config)
+    init_game_store(app)
+    latencies = []
+    for _ in range(games):
+        client = app.test_client()
+        requests = [('get', '/start', None)]
+        requests += [('post', '/discard', {'discard': '0,1,2'})] * 4
+        requests += [('get', '/next_turn', None)]
+        for method, path, data in requests:
+            start = time.perf_counter()
+            getattr(client, method)(path, data=data)
+            latencies.append(time.perf_counter() - start)
+    store = app.extensions['game_store']
+    if store is not None:
+        store.close()
+    latencies.sort()
+    return statistics.mean(latencies), latencies[int(len(latencies) * 0.95)]
+
+
+def state_only(repeat=5000):
+    """상태 로드/저장 부분만 비교 (템플릿 렌더링 제외)"""
+    app = create_app('development')
+    serializer = SecureCookieSessionInterface().get_signing_serializer(app)
+    game = Game()
+    game.start_game()
+
+    cookie = serializer.dumps({'game': game.save_to_session()})
+    start = time.perf_counter()
+    for _ in range(repeat):
+        loaded = Game()
+        loaded.load_from_session(serializer.loads(cookie)['game'])
+        cookie = serializer.dumps({'game': loaded.save_to_session()})
+    cookie_time = (time.perf_counter() - start) / repeat
+
+    store = GameStore(MemoryBackend(), flush_interval=60)
+    revision = store.put('bench', game)
+    cookie = serializer.dumps({'game_id': 'bench', 'game_rev': revision})
+    start = time.perf_counter()
+    for _ in range(repeat):
+        data = serializer.loads(cookie)
+        loaded, _ = store.get(data['game_id'], data['game_rev'])
+        revision = store.put('bench', loaded)
+        cookie = serializer.dumps({'game_id': 'bench', 'game_rev': revision})
+    store_time = (time.perf_counter() - start) / repeat
+    print(f"상태 로드+저장: 쿠키 {cookie_time * 1e6:6.1f} us, 저장소(캐시 적중) {store_time * 1e6:6.1f} us")
+
+
+def main(games=200):
+    with tempfile.TemporaryDirectory() as tmp:
+        configs = [
+            ('cookie', {'GAME_STORE_BACKEND': 'cookie'}),
+            ('sqlite', {'GAME_STORE_BACKEND': 'sqlite',
+                        'GAME_STORE_PATH': os.path.join(tmp, 'games.sqlite3')}),
+            ('sqlite (write-through)', {'GAME_STORE_BACKEND': 'sqlite',
+                                        'GAME_STORE_PATH': os.path.join(tmp, 'wt.sqlite3'),
+                                        'GAME_STORE_FLUSH_INTERVAL': 0}),
+            ('directory', {'GAME_STORE_BACKEND': 'directory',
+                           'GAME_STORE_PATH': os.path.join(tmp, 'games')}),
+        ]
+        for name, config in configs:
+            mean, p95 = run(config, games)
+            print(f"{name:24s}: 평균 {mean * 1000:6.2f} ms, p95 {p95 * 1000:6.2f} ms")
+    state_only()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,190 @@
+"""
+실시간 서버 부하 테스트: 동시 테이블 수와 행동 → 상대 화면 반영 지연
+
+    python -m benchmarks.load_realtime --tables 1000 --concurrency 200
+
+python -m app.realtime을 별도 프로세스로 띄우고, 테이블마다 두 클라이언트가
+SSE 스트림을 연 채로 자기 차례에 keep-alive POST로 교체(또는 넘김)를 보낸다.
+모든 스트림을 먼저 열어 둔 뒤 게임을 진행하므로 최대 동시 스트림 수는 tables * 2다.
+지연은 POST를 보낸 시점부터 상대 스트림에 새 상태가 도착할 때까지다.
+(클라이언트도 같은 머신에서 돌기 때문에 CPU를 서버와 나눠 쓴다)
+"""
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import sys
+import time
+from benchmarks.load_test import ROOT, free_port
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))] if values else 0.0
+
+
+def rss_kb(pid) -> int:
+    """프로세스 상주 메모리 (KB, /proc이 없으면 0)"""
+    try:
+        with open(f'/proc/{pid}/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+class Connection:
+    """keep-alive HTTP/1.1 연결 하나 (JSON 요청/응답)"""
+
+    def __init__(self, port):
+        self.port = port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, body=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection('127.0.0.1', self.port)
+        data = json.dumps(body).encode() if body is not None else b''
+        self.writer.write(f'{method} {path} HTTP/1.1\r\nHost: bench\r\n'
+                          f'Content-Length: {len(data)}\r\n\r\n'.encode() + data)
+        head = await self.reader.readuntil(b'\r\n\r\n')
+        length = 0
+        for line in head.split(b'\r\n')[1:]:
+            name, _, value = line.partition(b':')
+            if name.lower() == b'content-length':
+                length = int(value)
+        payload = await self.reader.readexactly(length)
+        return int(head.split()[1]), json.loads(payload)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+async def open_stream(port, table_id, token):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f'GET /tables/{table_id}/events?token={token} HTTP/1.1\r\nHost: bench\r\n\r\n'.encode())
+    await reader.readuntil(b'\r\n\r\n')
+    return reader, writer
+
+
+async def next_state(reader):
+    while True:
+        chunk = (await reader.readuntil(b'\n\n')).decode()
+        if not chunk.startswith(':'):
+            return json.loads(chunk.split('data: ', 1)[1])
+
+
+async def play_seat(port, table_id, seat, token, stream, shared, latencies, rng):
+    """스트림 상태를 따라 자기 차례에 행동, 게임이 끝나면 반환"""
+    reader, writer = stream
+    conn = Connection(port)
+    try:
+        while True:
+            state = await next_state(reader)
+            sent = shared.pop(state['version'], None)
+            if sent is not None and sent[0] != seat:
+                latencies.append(time.perf_counter() - sent[1])
+            if state['winner'] is not None:
+                return
+            if state['waiting_for'] != seat:
+                continue
+            hand_size = len(state['players'][seat]['hand'])
+            indices = sorted(rng.sample(range(hand_size), rng.randint(0, 3)))
+            # 응답을 받기 전에 상대 스트림이 먼저 받을 수 있으므로 다음 버전으로 기록
+            shared[state['version'] + 1] = (seat, time.perf_counter())
+            status, _ = await conn.request('POST', f'/tables/{table_id}/discard',
+                                           {'token': token, 'discard': indices})
+            if status != 200:
+                raise RuntimeError(f'discard failed: {status}')
+    finally:
+        conn.close()
+        writer.close()
+
+
+async def setup_table(port, semaphore):
+    """테이블을 만들고 두 좌석 참가 후 스트림을 열어 둠"""
+    async with semaphore:
+        conn = Connection(port)
+        try:
+            _, body = await conn.request('POST', '/tables')
+            table_id = body['table']
+            seats = []
+            for _ in range(2):
+                _, joined = await conn.request('POST', f'/tables/{table_id}/join')
+                seats.append((joined['seat'], joined['token']))
+        finally:
+            conn.close()
+        streams = [await open_stream(port, table_id, token) for _, token in seats]
+        return table_id, seats, streams
+
+
+async def run(port, tables, concurrency, seed, server_pid):
+    rng = random.Random(seed)
+    semaphore = asyncio.Semaphore(concurrency)
+    idle_memory = rss_kb(server_pid)
+    start = time.perf_counter()
+    prepared = await asyncio.gather(*(setup_table(port, semaphore) for _ in range(tables)))
+    setup = time.perf_counter() - start
+
+    health = await Connection(port).request('GET', '/healthz')
+    memory = rss_kb(server_pid)
+
+    latencies = []
+    start = time.perf_counter()
+    games = []
+    for table_id, seats, streams in prepared:
+        shared = {}
+        for (seat, token), stream in zip(seats, streams):
+            games.append(play_seat(port, table_id, seat, token, stream, shared, latencies,
+                                   random.Random(rng.getrandbits(32))))
+    await asyncio.gather(*games)
+    elapsed = time.perf_counter() - start
+    return {
+        'tables': tables,
+        'setup_seconds': setup,
+        'open_streams': health[1]['streams'],
+        'server_rss_mb': memory / 1024,
+        'server_rss_kb_per_table': (memory - idle_memory) / tables,
+        'actions': len(latencies),
+        'actions_per_second': len(latencies) / elapsed,
+        'games_per_second': tables / elapsed,
+        'push_p50_ms': percentile(latencies, 0.50) * 1000,
+        'push_p95_ms': percentile(latencies, 0.95) * 1000,
+        'push_max_ms': max(latencies) * 1000 if latencies else 0.0,
+    }
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='실시간 서버 동시 테이블 부하 테스트')
+    parser.add_argument('--tables', type=int, default=1000)
+    parser.add_argument('--concurrency', type=int, default=200, help='동시에 준비하는 테이블 수')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    port = free_port()
+    server = subprocess.Popen([sys.executable, '-m', 'app.realtime', '--bind', f'127.0.0.1:{port}',
+                               '--max-tables', str(args.tables)],
+                              cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        deadline = time.time() + 30
+        while True:
+            try:
+                asyncio.run(Connection(port).request('GET', '/healthz'))
+                break
+            except OSError:
+                if time.time() > deadline:
+                    raise RuntimeError("realtime server did not start")
+                time.sleep(0.2)
+        result = asyncio.run(run(port, args.tables, args.concurrency, args.seed, server.pid))
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+    print(json.dumps(result, indent=2))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
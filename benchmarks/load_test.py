@@ -0,0 +1,241 @@
+"""
+로컬 부하 테스트: 워커 수에 따른 초당 요청 수
+
+    python -m benchmarks.load_test --workers 1 2 4 --concurrency 16 --duration 10
+    python -m benchmarks.load_test --scenario game --workers 1   # 게임 진행: 행동당 전송량
+
+워커 수마다 python -m app.serve를 임시 디렉터리에서 띄우고 /readyz가 준비되면
+여러 스레드가 keep-alive 연결로 같은 경로를 반복 요청한다.
+(클라이언트도 같은 머신에서 돌기 때문에 CPU 코어 수 이상으로는 늘지 않는다)
+
+game 시나리오는 클라이언트마다 세션 쿠키를 유지하며 카드 교체(POST /discard)와
+게임 페이지 새로고침(GET /start)을 번갈아 보내고, 압축/조건부 요청 사용 여부별로
+행동당 전송 바이트(헤더 + 본문)와 p95 지연 시간을 잰다.
+"""
+import argparse
+import gzip
+import http.client
+import http.cookies
+import os
+import re
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def wait_ready(port, timeout=30.0) -> None:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            conn = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            conn.request('GET', '/readyz')
+            if conn.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError("server did not become ready")
+
+
+def hammer(port, path, duration, concurrency):
+    """duration초 동안 요청을 보내고 (요청 수, 오류 수, 지연 시간 목록) 반환"""
+    latencies, errors = [], [0]
+    lock = threading.Lock()
+    stop_at = time.time() + duration
+
+    def client():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        local = []
+        while time.time() < stop_at:
+            start = time.perf_counter()
+            try:
+                conn.request('GET', path)
+                response = conn.getresponse()
+                response.read()
+                if response.status != 200:
+                    raise OSError(response.status)
+                local.append(time.perf_counter() - start)
+            except (OSError, http.client.HTTPException):
+                with lock:
+                    errors[0] += 1
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), errors[0], sorted(latencies)
+
+
+# (이름, Accept-Encoding, If-None-Match 사용)
+GAME_MODES = (('압축 없음', None, False), ('gzip', 'gzip', False), ('gzip + ETag', 'gzip', True))
+
+_CSRF = re.compile(r'name="csrf_token" value="([^"]+)"')
+
+
+class GameClient:
+    """세션 쿠키와 마지막 ETag를 기억하는 게임 클라이언트"""
+
+    def __init__(self, port, encoding, conditional):
+        self.conn = http.client.HTTPConnection('127.0.0.1', port, timeout=10)
+        self.encoding = encoding
+        self.conditional = conditional
+        self.cookies = http.cookies.SimpleCookie()
+        self.csrf = ''
+        self.etag = None
+
+    def request(self, method, path, body=None):
+        """(상태 코드, 전송 바이트) 반환"""
+        headers = {'Cookie': '; '.join(f'{k}={m.value}' for k, m in self.cookies.items())}
+        if self.encoding:
+            headers['Accept-Encoding'] = self.encoding
+        if self.conditional and self.etag and method == 'GET':
+            headers['If-None-Match'] = self.etag
+        if body is not None:
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        self.conn.request(method, path, body=body, headers=headers)
+        response = self.conn.getresponse()
+        data = response.read()
+        size = len(data) + len(str(response.msg))
+        for cookie in response.msg.get_all('Set-Cookie') or ():
+            self.cookies.load(cookie)
+        if response.status == 200:
+            self.etag = response.getheader('ETag')
+            if response.getheader('Content-Encoding') == 'gzip':
+                data = gzip.decompress(data)
+            match = _CSRF.search(data.decode('utf-8'))
+            if match:
+                self.csrf = match.group(1)
+        elif response.status != 304:
+            raise OSError(response.status)
+        return response.status, size
+
+    def action(self, turn):
+        """카드 교체와 새로고침을 번갈아 보냄 (게임이 끝난 뒤 새로고침은 새 게임 시작)"""
+        if turn % 2:
+            return self.request('GET', '/start')
+        return self.request('POST', '/discard', f'discard=0%2C1&csrf_token={self.csrf}')
+
+
+def play(port, duration, concurrency, encoding, conditional):
+    """duration초 동안 게임을 진행하고 (요청 수, 총 바이트, 304 수, 지연 시간 목록) 반환"""
+    latencies, totals = [], [0, 0]
+    lock = threading.Lock()
+    stop_at = time.time() + duration
+
+    def client():
+        game = GameClient(port, encoding, conditional)
+        game.request('GET', '/start')
+        local, sent, not_modified, turn = [], 0, 0, 0
+        while time.time() < stop_at:
+            start = time.perf_counter()
+            status, size = game.action(turn)
+            local.append(time.perf_counter() - start)
+            sent += size
+            not_modified += status == 304
+            turn += 1
+        with lock:
+            latencies.extend(local)
+            totals[0] += sent
+            totals[1] += not_modified
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(latencies), totals[0], totals[1], sorted(latencies)
+
+
+def serve(workers, threads):
+    """임시 디렉터리에서 서버를 띄우는 컨텍스트 (포트 반환)"""
+    port = free_port()
+    env = dict(os.environ, PYTHONPATH=ROOT, SECRET_KEY='load-test')
+    tmp = tempfile.TemporaryDirectory()
+    server = subprocess.Popen(
+        [sys.executable, '-m', 'app.serve', '--bind', f'127.0.0.1:{port}',
+         '--workers', str(workers), '--threads', str(threads)],
+        cwd=tmp.name, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def stop():
+        server.terminate()
+        server.wait(timeout=60)
+        tmp.cleanup()
+
+    return port, stop
+
+
+def run_game(workers, threads, duration, concurrency):
+    """모드별 (이름, 초당 요청, 요청당 바이트, 304 비율, p95)"""
+    port, stop = serve(workers, threads)
+    results = []
+    try:
+        wait_ready(port)
+        play(port, 1.0, concurrency, 'gzip', True)  # 워밍업
+        for name, encoding, conditional in GAME_MODES:
+            count, sent, not_modified, latencies = play(port, duration, concurrency, encoding, conditional)
+            p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+            results.append((name, count / duration, sent / max(count, 1), not_modified / max(count, 1), p95))
+    finally:
+        stop()
+    return results
+
+
+def run(workers, threads, path, duration, concurrency):
+    port, stop = serve(workers, threads)
+    try:
+        wait_ready(port)
+        hammer(port, path, 1.0, concurrency)  # 워밍업
+        count, errors, latencies = hammer(port, path, duration, concurrency)
+    finally:
+        stop()
+    p95 = latencies[int(len(latencies) * 0.95)] if latencies else 0.0
+    return count / duration, errors, p95
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='워커 수별 처리량 측정')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--threads', type=int, default=1)
+    parser.add_argument('--scenario', choices=('path', 'game'), default='path',
+                        help='path: 같은 경로 반복, game: 세션을 유지하며 게임 진행')
+    parser.add_argument('--path', default='/start', help='요청 경로 (기본: 새 게임 페이지 렌더링)')
+    parser.add_argument('--duration', type=float, default=10.0)
+    parser.add_argument('--concurrency', type=int, default=16)
+    args = parser.parse_args(argv)
+
+    if args.scenario == 'game':
+        print(f"CPU {os.cpu_count()}개, 게임 진행(교체/새로고침), 동시 연결 {args.concurrency}")
+        for workers in args.workers:
+            for name, rps, size, not_modified, p95 in run_game(workers, args.threads, args.duration,
+                                                               args.concurrency):
+                print(f"워커 {workers:2d} {name:12s}: {rps:7.1f} req/s, 행동당 {size:7,.0f} B, "
+                      f"304 {not_modified:4.0%}, p95 {p95 * 1000:6.1f} ms")
+        return 0
+
+    print(f"CPU {os.cpu_count()}개, 경로 {args.path}, 동시 연결 {args.concurrency}")
+    base = None
+    for workers in args.workers:
+        rps, errors, p95 = run(workers, args.threads, args.path, args.duration, args.concurrency)
+        base = base or rps
+        print(f"워커 {workers:2d}: {rps:8.1f} req/s ({rps / base:.2f}x), p95 {p95 * 1000:7.1f} ms, 오류 {errors}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
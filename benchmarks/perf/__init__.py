@@ -0,0 +1,10 @@
+"""
+pytest-benchmark 성능 회귀 스위트
+
+    python -m benchmarks.perf              # 저장된 기준값과 비교 (임계값 초과 시 실패)
+    python -m benchmarks.perf --save       # 현재 결과를 새 기준값으로 저장
+    python -m benchmarks.perf --threshold 10 -k analyze
+
+기준값은 benchmarks/baselines/<머신 정보>/ 아래 JSON으로 저장되며,
+네트워크 없이 테스트 클라이언트만 사용한다. 기본 pytest 실행(tests/)에는 포함되지 않는다.
+"""
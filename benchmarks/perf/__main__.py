@@ -0,0 +1,36 @@
+"""
+성능 스위트 실행기
+"""
+import argparse
+import os
+import sys
+import pytest
+
+PERF_DIR = os.path.dirname(os.path.abspath(__file__))
+BASELINE_DIR = os.path.join(os.path.dirname(PERF_DIR), 'baselines')
+
+# 기준값 대비 중앙값이 이 비율(%) 이상 느려지면 실패
+DEFAULT_THRESHOLD = 20
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description='성능 회귀 스위트')
+    parser.add_argument('--save', action='store_true', help='결과를 새 기준값으로 저장')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help=f'회귀 판정 임계값 %% (기본 {DEFAULT_THRESHOLD})')
+    args, pytest_args = parser.parse_known_args(argv)
+
+    options = [PERF_DIR, '-q', '-p', 'no:cacheprovider', '--benchmark-only',
+               f'--benchmark-storage=file://{BASELINE_DIR}',
+               '--benchmark-columns=min,median,mean,stddev,rounds',
+               '--benchmark-sort=name']
+    if args.save:
+        options.append('--benchmark-save=baseline')
+    else:
+        # 가장 최근 기준값과 비교 (기준값이 없으면 경고만 출력)
+        options += ['--benchmark-compare', f'--benchmark-compare-fail=median:{args.threshold:g}%']
+    return pytest.main(options + pytest_args)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
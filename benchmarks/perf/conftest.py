@@ -0,0 +1,42 @@
+import random
+import pytest
+from app import create_app
+from app.models.card import full_deck
+from app.models.evaluator import get_tables
+from app.models.potential import get_potential_tables
+from config.settings import CARDS_PER_HAND
+from tests.helpers import TEST_CONFIG
+
+
+@pytest.fixture(scope='session')
+def hands():
+    """고정 시드로 뽑은 CARDS_PER_HAND장 패와 남은 덱 목록 (기본 2인 게임의 한 좌석 몫)"""
+    get_tables()  # 평가/드로우 테이블 생성 시간은 측정에서 제외
+    get_potential_tables()
+    rng = random.Random(10)
+    result = []
+    for _ in range(200):
+        deck = full_deck()
+        rng.shuffle(deck)
+        result.append((deck[:CARDS_PER_HAND], deck[CARDS_PER_HAND:26]))
+    return result
+
+
+@pytest.fixture(scope='session', params=['cookie', 'memory'])
+def app(request):
+    """게임 저장 방식별 앱 (테스트와 같은 설정이라 작업 디렉터리에 파일을 만들지 않음)"""
+    app = create_app('development', dict(TEST_CONFIG, GAME_STORE_BACKEND=request.param))
+    yield app
+    store = app.extensions['game_store']
+    if store is not None:
+        store.close()
+
+
+@pytest.fixture
+def started_client(app):
+    """게임을 시작한 새 테스트 클라이언트를 만드는 함수"""
+    def make():
+        client = app.test_client()
+        client.get('/start')
+        return (client,), {}
+    return make
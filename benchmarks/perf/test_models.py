@@ -0,0 +1,56 @@
+import itertools
+import random
+from app.models.ai import PokerAI
+from app.models.game import Game
+from app.models.hand import Hand
+from app.models.player import Player
+
+
+def cycle(items):
+    """호출마다 다음 항목을 돌려주는 함수 (캐시 효과 방지)"""
+    return itertools.cycle(items).__next__
+
+
+def test_hand_analyze(benchmark, hands):
+    next_hand = cycle([hand for hand, _ in hands])
+    benchmark(lambda: Hand(next_hand()).analyze())
+
+
+def test_hand_potential(benchmark, hands):
+    next_hand = cycle([Hand(hand) for hand, _ in hands])
+    benchmark(lambda: next_hand().get_hand_potential())
+
+
+def test_ai_decide(benchmark, hands):
+    next_hand = cycle([hand for hand, _ in hands])
+    benchmark(lambda: PokerAI(next_hand()).decide_cards_to_discard())
+
+
+def test_player_discard(benchmark, hands):
+    next_hand = cycle(hands)
+
+    def setup():
+        hand, deck = next_hand()
+        player = Player('Player 1')
+        player.deck = list(deck)
+        player.hand = list(hand)
+        return (player,), {}
+
+    benchmark.pedantic(lambda player: player.discard_cards([0, 2, 4]),
+                       setup=setup, rounds=2000)
+
+
+def started_game(seed):
+    game = Game(rng=random.Random(seed))
+    game.start_game()
+    return game
+
+
+def test_save_to_session(benchmark):
+    game = started_game(1)
+    benchmark(game.save_to_session)
+
+
+def test_load_from_session(benchmark):
+    data = started_game(1).save_to_session()
+    benchmark(lambda: Game().load_from_session(data))
@@ -0,0 +1,13 @@
+def test_start(benchmark, app):
+    benchmark.pedantic(lambda client: client.get('/start'),
+                       setup=lambda: ((app.test_client(),), {}), rounds=300)
+
+
+def test_discard(benchmark, started_client):
+    benchmark.pedantic(lambda client: client.post('/discard', data={'discard': '0,1,2'}),
+                       setup=started_client, rounds=300)
+
+
+def test_next_turn(benchmark, started_client):
+    benchmark.pedantic(lambda client: client.get('/next_turn'),
+                       setup=started_client, rounds=300)
@@ -1,6 +1,7 @@
 """
 프로덕션 환경 설정
 """
+import os
 from config.settings import *
 
 # 디버그 모드 비활성화
@@ -11,3 +12,16 @@ SESSION_COOKIE_SECURE = True
 SESSION_COOKIE_HTTPONLY = True
 REMEMBER_COOKIE_SECURE = True
 REMEMBER_COOKIE_HTTPONLY = True
+
+# 여러 워커 프로세스가 저장소를 공유하므로 즉시 기록
+GAME_STORE_FLUSH_INTERVAL = 0
+
+# 로그는 파일로만 기록
+LOG_CONSOLE = False
+
+# 서버 설정 (WEB_CONCURRENCY 환경 변수로 워커 수 지정 가능)
+SERVER_BIND = os.environ.get('BIND', '0.0.0.0:8000')
+SERVER_WORKERS = int(os.environ.get('WEB_CONCURRENCY', (os.cpu_count() or 1) * 2 + 1))
+SERVER_THREADS = int(os.environ.get('SERVER_THREADS', 4))
+SERVER_MAX_REQUESTS = 10000
+SERVER_MAX_REQUESTS_JITTER = 1000
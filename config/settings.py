@@ -13,6 +13,70 @@ RANK_VALUES = {
 # 게임 관련 상수
 CARDS_PER_HAND = 7
 MAX_TURNS = 5
+MAX_CARDS_TO_DISCARD = 5          # 사람 좌석이 한 번에 교체할 수 있는 최대 카드 수 (script.js와 동일)
+
+# 컴퓨터 AI 설정 (heuristic, montecarlo, exact)
+AI_STRATEGY = 'heuristic'
+AI_SAMPLES = 400                  # 교체 조합당 최대 표본 수
+AI_TIME_BUDGET = 0.05             # 결정당 최대 시간(초)
+
+# 시작 시간 단축용 디스크 캐시 (None이면 사용 안 함)
+TABLE_CACHE_PATH = 'data/tables.bin'        # 평가/드로우 테이블 (메모리 매핑으로 읽음)
+JINJA_BYTECODE_CACHE = 'data/jinja_cache'   # 컴파일된 템플릿
+
+# 게임 저장소 설정 (cookie, sqlite, directory, memory)
+GAME_STORE_BACKEND = 'sqlite'
+GAME_STORE_PATH = 'data/games.sqlite3'
+GAME_STORE_CACHE_SIZE = 1024
+GAME_STORE_TTL = 3600             # 종료된 게임 보관 시간(초)
+GAME_STORE_FLUSH_INTERVAL = 5     # 0이면 즉시 기록 (여러 프로세스 공유 시 필수)
+
+# 서버 설정 (python -m app.serve)
+SERVER_BIND = '127.0.0.1:5000'
+SERVER_WORKERS = 1                # 프로세스 수
+SERVER_THREADS = 1                # 워커당 스레드 수 (2 이상이면 gthread 워커)
+SERVER_TIMEOUT = 30               # 응답 없는 워커 재시작 시간(초)
+SERVER_GRACEFUL_TIMEOUT = 30      # 종료/재시작 시 처리 중인 요청 대기 시간(초)
+SERVER_KEEPALIVE = 2
+SERVER_MAX_REQUESTS = 0           # 워커당 요청 수 도달 시 재시작 (0이면 사용 안 함)
+SERVER_MAX_REQUESTS_JITTER = 0
+
+# 사람 대전 실시간 서버 설정 (python -m app.realtime)
+REALTIME_BIND = '127.0.0.1:5001'
+REALTIME_URL = 'http://127.0.0.1:5001'         # 브라우저가 접속할 주소
+REALTIME_ALLOW_ORIGIN = 'http://127.0.0.1:5000'  # 게임 페이지 출처 (CORS)
+REALTIME_MAX_TABLES = 10000       # 프로세스당 최대 테이블 수
+REALTIME_TABLE_TTL = 1800         # 변화와 구독자가 없는 테이블 보관 시간(초)
+REALTIME_HEARTBEAT = 15           # SSE 연결 유지 주석 간격(초)
+
+# 로깅 설정 (큐 + 백그라운드 리스너)
+LOG_LEVEL = 'INFO'
+LOG_FILE = 'logs/poker.log'       # JSON Lines (None이면 파일에 기록하지 않음)
+LOG_MAX_BYTES = 10 * 1024 * 1024  # 회전 기준 크기
+LOG_BACKUP_COUNT = 5
+LOG_CONSOLE = True                # 콘솔에도 텍스트 형식으로 출력
+LOG_SAMPLE_RATES = {'DEBUG': 0.01}  # 레벨별 기록 비율 (get_game 등의 DEBUG 로그)
+
+# 요청 계측 (기본 꺼짐)
+METRICS_ENABLED = False           # 구간별 시간 히스토그램 수집 및 METRICS_PATH 노출
+METRICS_PATH = '/metrics'
+PROFILE_SLOW_REQUEST_MS = 0       # 0보다 크면 이보다 느린 요청의 cProfile 결과 저장
+PROFILE_SAMPLE_RATE = 0.1         # cProfile로 측정할 요청 비율
+PROFILE_DIR = 'logs/profiles'
+
+# 빌드된 정적 자원 사용 (python -m app.assets로 만든 app/static/dist/manifest.json이 있을 때)
+ASSETS_MANIFEST = True
+
+# 동적 응답 압축 (HTML/JSON, gzip)
+COMPRESS_ENABLED = True
+COMPRESS_MIN_SIZE = 1400          # 이보다 작은 응답은 그대로 (TCP 세그먼트 하나 크기)
+COMPRESS_LEVEL = 3                # 게임 페이지 기준 크기 대비 압축 시간이 가장 나은 레벨
+
+# 템플릿 렌더링 캐시 (카드 앞면 조각, /와 /hand-rankings 전체 페이지, 키는 템플릿 수정 시각)
+RENDER_CACHE = True
+
+# 디버그 응답 헤더 (X-Game-Serializations 등) 노출 여부
+DEBUG_HEADERS = False
 
 # 족보 관련 상수
 HAND_RANKINGS = [
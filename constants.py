@@ -1,24 +1,6 @@
-# 게임 관련 상수 정의
-SUITS = ['Spades', 'Hearts', 'Diamonds', 'Clubs']
-RANKS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'Jack', 'Queen', 'King', 'Ace']
-RANK_VALUES = {
-    '2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, '10': 10,
-    'Jack': 11, 'Queen': 12, 'King': 13, 'Ace': 14
-}
+# 게임 관련 상수 정의 (config.settings와 같은 값을 쓰도록 다시 내보냄)
+from config.settings import SUITS, RANKS, RANK_VALUES, MAX_TURNS, CARDS_PER_HAND
+from config.settings import HAND_RANKINGS as _HAND_RANKINGS
 
-# 족보 관련 상수
-HAND_RANKINGS = {
-    'Royal Flush': 10,
-    'Straight Flush': 9,
-    'Four of a Kind': 8,
-    'Full House': 7,
-    'Straight': 6,
-    'Flush': 5,
-    'Three of a Kind': 4,
-    'Two Pair': 3,
-    'Pair': 2,
-    'High Card': 1
-}
-
-MAX_TURNS = 5
-CARDS_PER_HAND = 7
+# 족보 관련 상수 (족보 이름 -> 배율, 순서와 배율은 config.settings.HAND_RANKINGS와 동일)
+HAND_RANKINGS = dict(_HAND_RANKINGS)
@@ -1,6 +1,21 @@
 from typing import Dict, List, Tuple
+import logging
 import random
 from constants import *
+from app.models.card import Card as ModelCard
+from app.models.evaluator import MAX_CARDS, evaluate_dicts
+from app.models.hand import Hand
+
+logger = logging.getLogger(__name__)
+
+# 패 정렬 키 (랭크, 무늬 순서) - RANKS.index/SUITS.index 대신 미리 계산
+_CARD_ORDER = {(suit, rank): (r, s) for s, suit in enumerate(SUITS) for r, rank in enumerate(RANKS)}
+
+
+def card_order(card: dict) -> Tuple[int, int]:
+    """딕셔너리 카드의 정렬 키"""
+    return _CARD_ORDER[card['suit'], card['rank']]
+
 
 class Card:
     def __init__(self, suit: str, rank: str):
@@ -177,7 +192,7 @@ class PokerGame:
         self.hands = {
             player: sorted(
                 [self.players[player].pop() for _ in range(CARDS_PER_HAND)],
-                key=lambda card: (RANKS.index(card['rank']), SUITS.index(card['suit'])),
+                key=card_order,
                 reverse=True
             ) for player in self.players
         }
@@ -214,10 +229,7 @@ class PokerGame:
             hand.extend(new_cards)
             
             # 핸드 정렬
-            hand.sort(
-                key=lambda card: (RANKS.index(card['rank']), SUITS.index(card['suit'])),
-                reverse=True
-            )
+            hand.sort(key=card_order, reverse=True)
 
             # 새로운 점수로 업데이트 (이전 점수와 비교하지 않고 현재 카드의 점수를 사용)
             self.scores[player] = self.calculate_score(hand)
@@ -250,15 +262,19 @@ class PokerGame:
         if self.current_turn is None or 'Computer' not in self.players:
             return
         
-        computer = self.players['Computer']
-        ai = PokerAI(computer.hand)
-        indices_to_discard = ai.decide_cards_to_discard()
-        
+        hand = self.hands['Computer']
+        deck = self.players['Computer']
+        cards_to_discard = PokerAI(hand, deck).decide_cards_to_discard()
+
         # 카드 교체 로그 추가
-        print(f"컴퓨터가 버리는 카드 인덱스: {indices_to_discard}")
+        logger.debug("컴퓨터가 버리는 카드: %s", cards_to_discard)
 
-        if indices_to_discard:
-            computer.discard_cards(indices_to_discard)
+        if cards_to_discard:
+            self.previous_scores['Computer'] = self.scores['Computer']
+            kept = [card for card in hand if card not in cards_to_discard]
+            hand[:] = kept + [deck.pop() for _ in range(len(hand) - len(kept))]
+            hand.sort(key=card_order, reverse=True)
+            self.scores['Computer'] = self.calculate_score(hand)
 
     def determine_winner(self) -> None:
         player_score = self.scores['Player 1'][0]
@@ -273,88 +289,28 @@ class PokerGame:
         self.current_turn = None
 
 class HandAnalyzer:
+    """딕셔너리 카드 패 분석 (app.models 평가기를 쓰는 호환 래퍼)
+
+    7장 이하는 테이블 평가기(evaluate_dicts), 그보다 많으면 app.models.hand.Hand로 분석하므로
+    족보 규칙과 평가기 최적화가 app과 같다. is_* 판정도 Hand에 위임한다.
+    """
     def __init__(self, cards: List[dict]):
         self.cards = cards
-        self.rank_count = {}
-        self.suit_count = {}
-        self.total_rank_value = 0
-        self.sorted_ranks = []
-        self.analyze_cards()
-
-    def analyze_cards(self) -> None:
-        for card in self.cards:
-            rank = card['rank']
-            suit = card['suit']
-            self.total_rank_value += RANK_VALUES[rank]
-            
-            self.rank_count[rank] = self.rank_count.get(rank, 0) + 1
-            self.suit_count[suit] = self.suit_count.get(suit, 0) + 1
+        self._hand = None
 
-        self.sorted_ranks = sorted(RANK_VALUES[rank] for rank in self.rank_count.keys())
+    @property
+    def hand(self) -> Hand:
+        """같은 카드의 Hand"""
+        if self._hand is None:
+            self._hand = Hand([ModelCard.from_dict(card) for card in self.cards])
+        return self._hand
 
     def analyze(self) -> Tuple[int, str, int, int]:
-        # 족보 판정 순서를 명시적으로 지정
-        hand_checks = [
-            ('Royal Flush', 10),
-            ('Straight Flush', 9),
-            ('Four of a Kind', 8),
-            ('Full House', 7),
-            ('Flush', 6),
-            ('Straight', 5),
-            ('Three of a Kind', 4),
-            ('Two Pair', 3),
-            ('Pair', 2)
-        ]
-
-        for hand_type, multiplier in hand_checks:
-            check_method = getattr(self, f'is_{hand_type.lower().replace(" ", "_")}')
-            if check_method():
-                return (self.total_rank_value * multiplier, hand_type, 
-                       self.total_rank_value, multiplier)
-        
-        return (self.total_rank_value, 'High Card', self.total_rank_value, 1)
-
-    def is_royal_flush(self) -> bool:
-        return (any(count >= 5 for count in self.suit_count.values()) and
-                set(['10', 'Jack', 'Queen', 'King', 'Ace']).issubset(self.rank_count.keys()))
-
-    def is_straight_flush(self) -> bool:
-        return (any(count >= 5 for count in self.suit_count.values()) and
-                self.is_straight())
-
-    def is_four_of_a_kind(self) -> bool:
-        return 4 in self.rank_count.values()
-
-    def is_full_house(self) -> bool:
-        return 3 in self.rank_count.values() and 2 in self.rank_count.values()
-
-    def is_flush(self) -> bool:
-        return any(count >= 5 for count in self.suit_count.values())
-
-    def is_straight(self) -> bool:
-        if len(self.sorted_ranks) < 5:
-            return False
-        
-        # 중복 제거하고 정렬된 랭크 값들
-        unique_ranks = sorted(set(self.sorted_ranks))
-        
-        # 5장 이상의 연속된 카드 찾기
-        for i in range(len(unique_ranks) - 4):
-            if all(unique_ranks[j+1] - unique_ranks[j] == 1 
-                   for j in range(i, i + 4)):
-                return True
-            
-        # A-2-3-4-5 스트레이트 체크 (Ace를 1로 사용)
-        if set([14, 2, 3, 4, 5]).issubset(set(unique_ranks)):
-            return True
-        
-        return False
-
-    def is_three_of_a_kind(self) -> bool:
-        return 3 in self.rank_count.values()
-
-    def is_two_pair(self) -> bool:
-        return sum(1 for count in self.rank_count.values() if count == 2) >= 2
-
-    def is_pair(self) -> bool:
-        return sum(1 for count in self.rank_count.values() if count == 2) == 1
+        if len(self.cards) <= MAX_CARDS:
+            return evaluate_dicts(self.cards)
+        return self.hand.analyze()
+
+    def __getattr__(self, name: str):
+        if name.startswith('is_'):
+            return getattr(self.hand, name)
+        raise AttributeError(name)
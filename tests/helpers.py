@@ -0,0 +1,18 @@
+"""
+테스트 공용 도우미
+"""
+from app import create_app
+
+# 작업 디렉터리의 data/, logs/에 파일을 만들지 않는 설정 (게임은 메모리 저장소, 캐시/로그 파일 없음)
+TEST_CONFIG = {
+    'WTF_CSRF_ENABLED': False,
+    'GAME_STORE_BACKEND': 'memory',
+    'TABLE_CACHE_PATH': None,
+    'JINJA_BYTECODE_CACHE': None,
+    'LOG_FILE': None,
+}
+
+
+def create_test_app(**config):
+    """TEST_CONFIG 위에 config를 덮어쓴 개발 설정 앱"""
+    return create_app('development', dict(TEST_CONFIG, **config))
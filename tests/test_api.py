@@ -0,0 +1,96 @@
+import unittest
+from unittest import mock
+from app.api import state_delta
+from app.models.game import Game
+from helpers import create_test_app
+
+
+def apply_delta(state, delta):
+    """script.js applyGameDelta와 같은 병합"""
+    state = dict(state)
+    for key, value in delta.items():
+        if isinstance(value, dict):
+            merged = dict(state.get(key) or {}, **value)
+            state[key] = {name: v for name, v in merged.items() if v is not None}
+        else:
+            state[key] = value
+    return state
+
+
+class TestGameApi(unittest.TestCase):
+
+    def make_client(self, backend):
+        app = create_test_app(DEBUG_HEADERS=True, GAME_STORE_BACKEND=backend)
+        return app.test_client()
+
+    def check_encodes(self, response, expected):
+        """버전/If-Match 확인은 저장하거나 불러온 바이트열을 재사용해 인코딩은 저장할 때만"""
+        self.assertEqual(self.encode.call_count, expected)
+        self.assertEqual(response.headers['X-Game-Serializations'], str(expected))
+        self.encode.reset_mock()
+
+    def check_game(self, client):
+        self.encode = mock.patch.object(Game, 'save_to_session', autospec=True,
+                                        side_effect=Game.save_to_session).start()
+        self.addCleanup(mock.patch.stopall)
+        response = client.post('/api/games')
+        self.assertEqual(response.status_code, 201)
+        self.check_encodes(response, 1)
+        data = response.get_json()
+        game_id, state = data['id'], data['state']
+        self.assertEqual(response.headers['Location'], f'/api/games/{game_id}/state')
+        self.assertEqual(response.headers['ETag'], f'"{data["version"]}"')
+
+        # 같은 버전이면 304
+        etag = response.headers['ETag']
+        self.assertEqual(client.get(f'/api/games/{game_id}/state',
+                                    headers={'If-None-Match': etag}).status_code, 304)
+
+        version = data['version']
+        while state['winner'] is None:
+            response = client.post(f'/api/games/{game_id}/discard', json={'discard': [0, 1, 2]},
+                                   headers={'If-Match': f'"{version}"'})
+            self.assertEqual(response.status_code, 200)
+            self.check_encodes(response, 1)
+            data = response.get_json()
+            self.assertEqual(data['base_version'], version)
+            self.assertNotIn('max_turns', data['delta'])
+            state, version = apply_delta(state, data['delta']), data['version']
+
+            response = client.get(f'/api/games/{game_id}/state')
+            self.check_encodes(response, 0)
+            full = response.get_json()
+            self.assertEqual(full['version'], version)
+            self.assertEqual(state, full['state'])
+
+        # 종료된 게임, 오래된 버전, 다른 게임 id
+        self.assertEqual(client.post(f'/api/games/{game_id}/discard', json={'discard': []}).status_code, 409)
+        self.assertEqual(client.get('/api/games/unknown/state').status_code, 404)
+
+    def test_cookie_backend(self):
+        self.check_game(self.make_client('cookie'))
+
+    def test_store_backend(self):
+        self.check_game(self.make_client('memory'))
+
+    def test_invalid_requests(self):
+        client = self.make_client('memory')
+        data = client.post('/api/games').get_json()
+        url = f'/api/games/{data["id"]}/discard'
+        for discard in ([7], [0, 0], [0, 1, 2, 3, 4, 5], ['1'], [True], 'x'):
+            self.assertEqual(client.post(url, json={'discard': discard}).status_code, 400, discard)
+        self.assertEqual(client.post(url, json={'discard': [0]},
+                                     headers={'If-Match': '"stale"'}).status_code, 412)
+        # 실패한 요청은 상태를 바꾸지 않음
+        state = client.get(f'/api/games/{data["id"]}/state').get_json()
+        self.assertEqual(state['version'], data['version'])
+
+    def test_state_delta(self):
+        before = {'scores': {'A': [1], 'B': [2]}, 'current_turn': 1, 'winner': None}
+        after = {'scores': {'A': [1], 'B': [3]}, 'current_turn': 2, 'winner': None}
+        self.assertEqual(state_delta(before, after), {'scores': {'B': [3]}, 'current_turn': 2})
+        self.assertEqual(state_delta(after, {'scores': {}}), {'scores': {'A': None, 'B': None}})
+
+
+if __name__ == '__main__':
+    unittest.main()
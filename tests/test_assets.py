@@ -0,0 +1,114 @@
+import gzip
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from flask import Flask, render_template_string
+from app.assets import DIST_DIR, MANIFEST, build_assets, init_assets, load_manifest, minify_css, minify_js
+from helpers import create_test_app
+
+
+class TestMinify(unittest.TestCase):
+
+    def test_css(self):
+        css = '/* 주석 */\n.card  >  .rank {\n    color: red;\n    content: "a  ;  b";\n}\n'
+        self.assertEqual(minify_css(css), '.card>.rank{color:red;content:"a  ;  b"}')
+
+    def test_js_keeps_template_literals(self):
+        js = ('// 주석\nfunction f() {\n    return `\n    <div>\n    // 본문\n    </div>`;\n}\n\n'
+              '    const url = "http://x";\n')
+        self.assertEqual(minify_js(js), 'function f() {\nreturn `\n    <div>\n    // 본문\n    </div>`;\n}\n'
+                                        'const url = "http://x";\n')
+
+
+class TestBuild(unittest.TestCase):
+
+    def setUp(self):
+        self.static = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.static)
+        os.makedirs(os.path.join(self.static, 'css'))
+        self.write('css/site.css', 'body {\n    margin: 0;\n}\n')
+        self.write('app.js', '// 시작\n    init();\n')
+        self.write('logo.txt', '빌드 대상 아님')
+
+    def write(self, name, text):
+        with open(os.path.join(self.static, name), 'w', encoding='utf-8') as f:
+            f.write(text)
+
+    def read(self, hashed, suffix=''):
+        with open(os.path.join(self.static, DIST_DIR, hashed + suffix), 'rb') as f:
+            return f.read()
+
+    def test_hashed_and_compressed(self):
+        manifest = build_assets(self.static)
+        self.assertEqual(sorted(manifest), ['app.js', 'css/site.css'])
+        self.assertRegex(manifest['css/site.css'], r'^css/site\.[0-9a-f]{12}\.css$')
+        self.assertEqual(self.read(manifest['css/site.css']), b'body{margin:0}')
+        self.assertEqual(gzip.decompress(self.read(manifest['app.js'], '.gz')), b'init();\n')
+        with open(os.path.join(self.static, DIST_DIR, MANIFEST), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), manifest)
+        # 같은 내용이면 같은 이름, 바뀌면 다른 이름
+        self.assertEqual(build_assets(self.static), manifest)
+        self.write('app.js', 'init(1);\n')
+        self.assertNotEqual(build_assets(self.static)['app.js'], manifest['app.js'])
+
+    def test_stale_sources_skipped(self):
+        build_assets(self.static)
+        path = os.path.join(self.static, DIST_DIR, MANIFEST)
+        built_at = os.path.getmtime(path)
+        os.utime(os.path.join(self.static, 'app.js'), (built_at + 10, built_at + 10))
+        os.remove(os.path.join(self.static, 'css/site.css'))
+        with self.assertLogs('app.assets', 'WARNING'):
+            self.assertEqual(load_manifest(self.static), {})
+        shutil.rmtree(os.path.join(self.static, DIST_DIR))
+        self.assertEqual(load_manifest(self.static), {})
+
+    def test_serving(self):
+        manifest = build_assets(self.static)
+        app = Flask(__name__, static_folder=self.static, static_url_path='/static')
+        init_assets(app)
+        client = app.test_client()
+        with app.test_request_context('/'):
+            html = render_template_string("{{ asset_url('app.js') }} {{ asset_url('logo.txt') }}")
+        url = f"/assets/{manifest['app.js']}"
+        self.assertEqual(html, f'{url} /static/logo.txt')
+
+        response = client.get(url, headers={'Accept-Encoding': 'gzip, deflate'})
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertEqual(gzip.decompress(response.data), b'init();\n')
+        self.assertEqual(response.headers['Vary'], 'Accept-Encoding')
+        self.assertTrue(response.cache_control.immutable)
+        self.assertGreaterEqual(response.cache_control.max_age, 365 * 24 * 3600)
+        self.assertTrue(response.mimetype.endswith('javascript'))
+        etag = response.headers['ETag']
+
+        response = client.get(url)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.data, b'init();\n')
+        self.assertEqual(client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': etag}).status_code,
+                         304)
+
+        for path in (f'/assets/{MANIFEST}', '/assets/../app.js', '/assets/missing.js'):
+            self.assertEqual(client.get(path).status_code, 404)
+
+    def test_disabled_falls_back_to_static(self):
+        build_assets(self.static)
+        app = Flask(__name__, static_folder=self.static, static_url_path='/static')
+        app.config['ASSETS_MANIFEST'] = False
+        init_assets(app)
+        with app.test_request_context('/'):
+            self.assertEqual(render_template_string("{{ asset_url('app.js') }}"), '/static/app.js')
+
+
+class TestPages(unittest.TestCase):
+
+    def test_pages_link_assets(self):
+        """페이지는 빌드 여부와 상관없이 스타일시트와 스크립트를 링크함"""
+        html = create_test_app().test_client().get('/').get_data(as_text=True)
+        self.assertRegex(html, r'href="/(static|assets)/css/style[.0-9a-f]*\.css"')
+        self.assertRegex(html, r'src="/(static|assets)/js/script[.0-9a-f]*\.js"')
+
+
+if __name__ == '__main__':
+    unittest.main()
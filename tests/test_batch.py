@@ -0,0 +1,60 @@
+import itertools
+import random
+import unittest
+from app.models.card import full_deck
+from app.models.hand import Hand
+from app.models.evaluator import evaluate_ids
+from config.settings import RANKS
+
+try:
+    import numpy as np
+    from app.models.batch import score_batch, score_tuples, cards_to_array
+except ImportError:  # numpy 미설치
+    np = None
+
+
+@unittest.skipIf(np is None, "numpy가 설치되지 않음")
+class TestBatch(unittest.TestCase):
+
+    def test_matches_hand_analyze(self):
+        """무작위 7장 패에서 Hand.analyze와 동일"""
+        rng = random.Random(9)
+        deck = full_deck()
+        hands = [rng.sample(deck, 7) for _ in range(3000)]
+        self.assertEqual(score_tuples(cards_to_array(hands)), [Hand(h).analyze() for h in hands])
+
+    def test_all_rank_multisets(self):
+        """모든 7장 랭크 멀티셋(플러시 유/무)에서 테이블 평가기와 동일"""
+        hands = []
+        for combo in itertools.combinations_with_replacement(range(len(RANKS)), 7):
+            if any(combo.count(r) > 4 for r in set(combo)):
+                continue
+            # 무늬 순환 배정 (플러시 없음)
+            hands.append([(i % 4) * 13 + r for i, r in enumerate(combo)])
+            distinct = sorted(set(combo))
+            if len(distinct) >= 5:
+                # 서로 다른 랭크 5장을 Hearts(1)로, 나머지는 다른 무늬로
+                rest = list(combo)
+                for r in distinct[:5]:
+                    rest.remove(r)
+                used = {(r, 1) for r in distinct[:5]}
+                hand = [13 + r for r in distinct[:5]]
+                for r in rest:
+                    suit = next(s for s in (0, 2, 3, 1) if (r, s) not in used)
+                    used.add((r, suit))
+                    hand.append(suit * 13 + r)
+                hands.append(hand)
+        self.assertEqual(score_tuples(np.array(hands)), [evaluate_ids(h) for h in hands])
+
+    def test_shapes(self):
+        scores, codes, totals, multipliers = score_batch(np.zeros((0, 7), dtype=int))
+        self.assertEqual(len(scores), 0)
+        self.assertEqual(score_tuples(np.array([[0, 1, 2, 3, 4]])), [evaluate_ids([0, 1, 2, 3, 4])])
+        with self.assertRaises(ValueError):
+            score_batch(np.array([[52]]))
+        with self.assertRaises(ValueError):
+            score_batch(np.zeros((1, 16), dtype=int))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,41 @@
+import copy
+import pickle
+import unittest
+from app.models.card import Card, full_deck
+from config.settings import SUITS, RANKS
+
+
+class TestCard(unittest.TestCase):
+
+    def test_interned(self):
+        """같은 카드는 같은 객체"""
+        self.assertIs(Card('Hearts', 'Ace'), Card(suit='Hearts', rank='Ace'))
+        self.assertIs(Card.from_dict({'suit': 'Hearts', 'rank': 'Ace'}), Card('Hearts', 'Ace'))
+        self.assertIs(copy.deepcopy(Card('Clubs', '2')), Card('Clubs', '2'))
+        self.assertIs(pickle.loads(pickle.dumps(Card('Clubs', '2'))), Card('Clubs', '2'))
+
+    def test_ids(self):
+        """id는 덱 생성 순서와 일치"""
+        deck = full_deck()
+        self.assertEqual(deck, [Card(suit, rank) for suit in SUITS for rank in RANKS])
+        for card_id, card in enumerate(deck):
+            self.assertEqual(card.id, card_id)
+            self.assertIs(Card.from_id(card_id), card)
+        self.assertEqual(len(set(deck)), 52)
+
+    def test_compat(self):
+        """값, 딕셔너리 변환, 유효성 검사"""
+        card = Card('Spades', 'Queen')
+        self.assertEqual(card.value, 12)
+        self.assertEqual(card.to_dict(), {'suit': 'Spades', 'rank': 'Queen'})
+        self.assertNotEqual(card, Card('Hearts', 'Queen'))
+        with self.assertRaises(ValueError):
+            Card('Stars', 'Queen')
+        with self.assertRaises(ValueError):
+            Card('Spades', '1')
+        with self.assertRaises(AttributeError):
+            card.rank = 'King'
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,88 @@
+import unittest
+from app.models.game import Game
+from app.models.codec import encode_state, decode_state, decode_replay
+
+
+def legacy_dict(game):
+    """이전 버전의 딕셔너리 세션 형식"""
+    return {
+        'players': {
+            name: {
+                'name': player.name,
+                'hand': [card.to_dict() for card in player.hand],
+                'deck': [card.to_dict() for card in player.deck],
+                'score': player.score,
+                'previous_score': player.previous_score,
+                'card_changes': player.card_changes
+            } for name, player in game.players.items()
+        },
+        'current_turn': game.current_turn,
+        'max_turns': game.max_turns,
+        'winner': game.winner
+    }
+
+
+def played_game(turns):
+    game = Game()
+    game.start_game()
+    for _ in range(turns):
+        game.discard_cards('Player 1', [0, 2, 4])
+    return game
+
+
+class TestCodec(unittest.TestCase):
+
+    def assertSameGame(self, a, b):
+        self.assertEqual(legacy_dict(a), legacy_dict(b))
+        self.assertEqual(a.get_game_state(), b.get_game_state())
+
+    def test_round_trip(self):
+        """턴 진행 중/종료 후 상태 왕복 (시드 + 행동 로그)"""
+        for turns in range(6):
+            game = played_game(turns)
+            data = game.save_to_session()
+            self.assertIsInstance(data, bytes)
+            self.assertEqual(len(data), 11 + 2 * turns - (turns == 5))
+            restored = Game()
+            restored.load_from_session(data)
+            self.assertSameGame(game, restored)
+            self.assertEqual(restored.save_to_session(), data)
+
+    def test_full_state_round_trip(self):
+        """버전 1 (전체 상태) 형식도 읽음"""
+        for turns in range(6):
+            game = played_game(turns)
+            data = encode_state(game.current_turn, game.max_turns, game.winner, game.players)
+            restored = Game()
+            restored.load_from_session(data)
+            self.assertSameGame(game, restored)
+            self.assertIsNone(restored.seed)
+
+    def test_legacy_dict(self):
+        """이전 딕셔너리 형식 세션도 읽음"""
+        game = played_game(2)
+        restored = Game()
+        restored.load_from_session(legacy_dict(game))
+        self.assertSameGame(game, restored)
+
+    def test_invalid_data(self):
+        """알 수 없는 버전/손상된 데이터는 새 게임"""
+        game = played_game(1)
+        data = game.save_to_session()
+        for bad in (b'\x7f' + data[1:], data[:-1], data + b'\x00'):
+            restored = Game()
+            restored.load_from_session(bad)
+            self.assertEqual(restored.players, {})
+            self.assertIsNone(restored.current_turn)
+        with self.assertRaises(ValueError):
+            decode_state(encode_state(game.current_turn, game.max_turns, game.winner, game.players)[:20])
+        with self.assertRaises(ValueError):
+            decode_replay(data[:-1])
+
+    def test_empty_game(self):
+        """시작 전 게임"""
+        self.assertEqual(decode_state(encode_state(None, 5, None, {})), (None, 5, None, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
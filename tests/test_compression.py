@@ -0,0 +1,86 @@
+import gzip
+import unittest
+from flask import Flask
+from app.compression import init_compression
+from helpers import create_test_app
+
+GZIP = {'Accept-Encoding': 'gzip, deflate'}
+
+
+class TestCompression(unittest.TestCase):
+
+    def make_client(self, **config):
+        return create_test_app(**config).test_client()
+
+    def test_game_page_compressed(self):
+        client = self.make_client()
+        client.get('/start')
+        response = client.post('/discard', data={'discard': '0'}, headers=GZIP)
+        self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+        self.assertIn('Accept-Encoding', response.headers['Vary'])
+        html = gzip.decompress(response.data).decode('utf-8')
+        self.assertIn('현재 턴: 2 / 5', html)
+        self.assertLess(len(response.data), len(html) // 4)
+
+        # Accept-Encoding이 없으면 원본
+        response = client.get('/start')
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertIn('현재 턴: 2 / 5', response.get_data(as_text=True))
+
+    def test_skipped_responses(self):
+        client = self.make_client()
+        # 작은 응답
+        response = client.get('/healthz', headers=GZIP)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertEqual(response.get_json(), {'status': 'ok'})
+        # 강한 ETag가 붙은 JSON API
+        response = client.post('/api/games', headers=GZIP)
+        self.assertNotIn('Content-Encoding', response.headers)
+        self.assertIn('state', response.get_json())
+        # 파일 응답
+        response = client.get('/static/css/style.css', headers=GZIP)
+        self.assertNotIn('Content-Encoding', response.headers)
+        response.close()
+
+    def test_config(self):
+        for enabled, min_size, encoded in ((True, 100, True), (True, 5000, False), (False, 100, False)):
+            app = Flask(__name__)
+            app.config.update(COMPRESS_ENABLED=enabled, COMPRESS_MIN_SIZE=min_size)
+            init_compression(app)
+            app.add_url_rule('/', 'page', lambda: '<p>카드</p>' * 300)
+            response = app.test_client().get('/', headers=GZIP)
+            self.assertEqual(response.headers.get('Content-Encoding') == 'gzip', encoded)
+
+
+class TestConditionalGamePage(unittest.TestCase):
+
+    def test_not_modified_until_state_changes(self):
+        app = create_test_app()
+        client = app.test_client()
+        client.get('/start')
+        response = client.post('/discard', data={'discard': '0,1'})
+        etag, weak = response.get_etag()
+        self.assertTrue(weak)
+        self.assertEqual(response.headers['Cache-Control'], 'private, no-cache')
+
+        # 진행 중인 게임을 다시 불러오면 본문 없이 304
+        reload = client.get('/start', headers={'If-None-Match': response.headers['ETag'], **GZIP})
+        self.assertEqual(reload.status_code, 304)
+        self.assertEqual(reload.data, b'')
+        self.assertEqual(reload.get_etag(), (etag, True))
+
+        # 상태가 바뀌면 새 ETag와 전체 페이지
+        changed = client.post('/discard', data={'discard': '2'})
+        self.assertNotEqual(changed.get_etag()[0], etag)
+        response = client.get('/start', headers={'If-None-Match': response.headers['ETag']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_etag()[0], changed.get_etag()[0])
+
+        # 다른 세션의 같은 URL은 다른 ETag
+        other = app.test_client()
+        other.get('/start')
+        self.assertNotEqual(other.post('/discard', data={'discard': '0,1'}).get_etag()[0], etag)
+
+
+if __name__ == '__main__':
+    unittest.main()
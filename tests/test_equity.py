@@ -0,0 +1,56 @@
+import random
+import unittest
+from app.models.ai import MonteCarloAI, create_ai, PokerAI
+from app.models.card import Card
+from app.models.evaluator import evaluate_cards
+from app.models.equity import estimate_discards, candidate_discards
+
+
+def cards(*specs):
+    return [Card(suit, rank) for suit, rank in specs]
+
+
+class TestEquity(unittest.TestCase):
+
+    def test_candidates(self):
+        self.assertEqual(len(candidate_discards(7)), 128)
+        self.assertEqual(len(candidate_discards(7, max_discard=5)), 128 - 7 - 1)
+        self.assertEqual(candidate_discards(7)[0], ())
+
+    def test_keep_all_is_current_score(self):
+        """아무것도 버리지 않는 후보는 현재 점수"""
+        rng = random.Random(3)
+        deck = [Card(suit, rank) for suit in ('Spades', 'Hearts') for rank in ('2', '3', '4', '5')]
+        hand = cards(('Clubs', '9'), ('Clubs', 'Jack'), ('Diamonds', 'King'), ('Clubs', '7'),
+                     ('Diamonds', '10'), ('Diamonds', '6'), ('Clubs', 'Queen'))
+        estimates = estimate_discards(hand, deck, samples=64, rng=rng)
+        keep = next(e for e in estimates if e.indices == ())
+        self.assertEqual(keep.mean, evaluate_cards(hand)[0])
+
+    def test_single_card_deck_is_exact(self):
+        """덱이 한 장이면 모든 후보가 정확한 값"""
+        hand = cards(('Hearts', '10'), ('Hearts', 'Jack'), ('Hearts', 'Queen'), ('Hearts', 'King'),
+                     ('Clubs', '2'), ('Spades', '3'), ('Diamonds', '4'))
+        deck = cards(('Hearts', 'Ace'))
+        best = estimate_discards(hand, deck, samples=32, rng=random.Random(1))[0]
+        expected = evaluate_cards(hand[:4] + deck + hand[5:])
+        self.assertEqual(best.mean, expected[0])
+        self.assertEqual(expected[1], 'Royal Flush')
+
+    def test_monte_carlo_ai(self):
+        """몬테카를로 AI는 유효한 인덱스를 반환"""
+        deck = [Card(suit, rank) for suit in ('Spades', 'Hearts', 'Diamonds', 'Clubs')
+                for rank in ('2', '5', '8', 'Jack', 'Ace')]
+        hand, deck = deck[:7], deck[7:]
+        ai = MonteCarloAI(hand, deck, samples=64, time_budget=None, rng=random.Random(5))
+        indices = ai.decide_cards_to_discard()
+        self.assertTrue(all(0 <= i < 7 for i in indices))
+        self.assertEqual(len(set(indices)), len(indices))
+        self.assertIsInstance(create_ai(hand, deck, 'montecarlo'), MonteCarloAI)
+        self.assertIsInstance(create_ai(hand, deck, 'heuristic'), PokerAI)
+        with self.assertRaises(ValueError):
+            create_ai(hand, deck, 'unknown')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,72 @@
+import itertools
+import random
+import unittest
+from app.models.card import Card
+from app.models.hand import Hand
+from app.models.evaluator import MAX_CARDS, evaluate_cards, evaluate_ids, card_id
+from config.settings import SUITS, RANKS, HAND_RANKINGS
+
+
+def reference_analyze(cards):
+    """기존 getattr 규칙 체인으로 분석한 결과"""
+    hand = Hand(cards)
+    for hand_type, multiplier in HAND_RANKINGS[:-1]:
+        if getattr(hand, f'is_{hand_type.lower().replace(" ", "_")}')():
+            return (hand._total_value * multiplier, hand_type,
+                    hand._total_value, multiplier)
+    return (hand._total_value, 'High Card', hand._total_value, 1)
+
+
+def rank_multisets(size):
+    """각 랭크 최대 4장인 크기 size의 랭크 멀티셋"""
+    for combo in itertools.combinations_with_replacement(range(len(RANKS)), size):
+        if all(combo.count(r) <= 4 for r in set(combo)):
+            yield combo
+
+
+class TestEvaluator(unittest.TestCase):
+
+    def test_all_rank_multisets(self):
+        """모든 랭크 멀티셋 x 플러시 여부에 대해 기존 결과와 동일"""
+        # Hand.analyze는 랭크 멀티셋과 플러시 여부에만 의존하므로
+        # 이 조합을 모두 확인하면 C(52,7) 전체와 동치다.
+        for size in range(MAX_CARDS + 1):
+            for combo in rank_multisets(size):
+                # 플러시 없는 배치: 무늬를 순환 배정 (무늬당 최대 2장)
+                cards = [Card(SUITS[i % 4], RANKS[r]) for i, r in enumerate(combo)]
+                self.assertEqual(evaluate_cards(cards), reference_analyze(cards))
+
+                # 플러시 배치: 서로 다른 랭크 5장을 Hearts로
+                distinct = sorted(set(combo))
+                if len(distinct) < 5:
+                    continue
+                flush_ranks = distinct[:5]
+                rest = list(combo)
+                for r in flush_ranks:
+                    rest.remove(r)
+                cards = [Card('Hearts', RANKS[r]) for r in flush_ranks]
+                used = {(r, 'Hearts') for r in flush_ranks}
+                for r in rest:
+                    suit = next(s for s in ('Spades', 'Diamonds', 'Clubs', 'Hearts')
+                                if (r, s) not in used)
+                    used.add((r, suit))
+                    cards.append(Card(suit, RANKS[r]))
+                self.assertEqual(evaluate_cards(cards), reference_analyze(cards))
+
+    def test_random_hands(self):
+        """무작위 7장 패에서 Hand.analyze와 동일"""
+        rng = random.Random(7)
+        deck = [Card(suit, rank) for suit in SUITS for rank in RANKS]
+        for _ in range(2000):
+            cards = rng.sample(deck, 7)
+            self.assertEqual(Hand(cards).analyze(), reference_analyze(cards))
+
+    def test_card_ids(self):
+        """카드 id는 덱 생성 순서와 일치"""
+        ids = [card_id(suit, rank) for suit in SUITS for rank in RANKS]
+        self.assertEqual(ids, list(range(52)))
+        self.assertEqual(evaluate_ids([]), (0, 'High Card', 0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
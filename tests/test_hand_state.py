@@ -0,0 +1,70 @@
+import random
+import unittest
+from app.models.card import Card, full_deck
+from app.models.evaluator import MAX_CARDS, evaluate_cards
+from app.models.hand import Hand
+from app.models.hand_state import HandState
+from app.models.player import Player
+
+
+class TestHandState(unittest.TestCase):
+
+    def test_random_replacements(self):
+        """무작위 교체를 반복해도 전체 재계산과 같은 분포와 점수"""
+        rng = random.Random(12)
+        for _ in range(300):
+            deck = full_deck()
+            rng.shuffle(deck)
+            hand = [deck.pop() for _ in range(7)]
+            state = HandState(hand)
+            for _ in range(5):
+                removed = rng.sample(hand, rng.randint(0, 5))
+                added = [deck.pop() for _ in removed]
+                hand = [card for card in hand if card not in removed] + added
+                state.replace(removed, added)
+                self.assertEqual(state.score(), Hand(hand).analyze())
+                fresh = HandState(hand)
+                self.assertEqual((state.rank_counts, state.suit_counts, state.rank_mask, state.total),
+                                 (fresh.rank_counts, fresh.suit_counts, fresh.rank_mask, fresh.total))
+
+    def test_errors(self):
+        state = HandState([Card('Hearts', 'Ace')])
+        with self.assertRaises(ValueError):
+            state.remove(Card('Spades', 'King'))
+        # 랭크와 무늬는 각각 패에 있지만 카드 자체는 없음
+        state = HandState([Card('Hearts', 'Ace'), Card('Spades', 'King')])
+        with self.assertRaises(ValueError):
+            state.remove(Card('Spades', 'Ace'))
+        self.assertEqual(state.size, 2)
+        self.assertEqual(state.score(), evaluate_cards([Card('Hearts', 'Ace'), Card('Spades', 'King')]))
+        with self.assertRaises(ValueError):
+            state.add(Card('Hearts', 'Ace'))
+        with self.assertRaises(ValueError):
+            HandState(full_deck()[:8])
+        # 4비트 장수 필드가 한 바퀴 도는 장수도 거부
+        for size in (16, 17, 52):
+            with self.assertRaises(ValueError):
+                HandState(full_deck()[:size])
+        state = HandState(full_deck()[:MAX_CARDS])
+        with self.assertRaises(ValueError):
+            state.replace((), full_deck()[MAX_CARDS:MAX_CARDS + 9])
+        self.assertEqual(state.size, MAX_CARDS)
+
+    def test_player_discard(self):
+        """Player.discard_cards 점수가 Hand.analyze와 같고 hand 대입 시 상태 재생성"""
+        rng = random.Random(3)
+        player = Player('Player 1')
+        player.deck = full_deck()
+        rng.shuffle(player.deck)
+        player.draw_initial_cards(7)
+        for _ in range(5):
+            player.discard_cards(rng.sample(range(7), 3))
+            self.assertEqual(player.score, Hand(player.hand).analyze())
+
+        player.hand = full_deck()[:7]
+        player.discard_cards([0])
+        self.assertEqual(player.score, evaluate_cards(player.hand))
+
+
+if __name__ == '__main__':
+    unittest.main()
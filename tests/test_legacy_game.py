@@ -0,0 +1,56 @@
+import random
+import unittest
+import constants
+import game
+from app.models.card import Card, full_deck
+from app.models.hand import Hand
+from config.settings import HAND_RANKINGS, RANKS, SUITS
+
+
+def dict_hand(rng, size):
+    return [card.to_dict() for card in rng.sample(full_deck(), size)]
+
+
+class TestLegacyGame(unittest.TestCase):
+    """최상위 game.py가 app.models와 같은 평가기와 족보 규칙을 쓰는지 확인"""
+
+    def test_same_scores_as_app(self):
+        rng = random.Random(24)
+        legacy = game.PokerGame()
+        for size in (5, 6, 7, 8):
+            for _ in range(3000 if size == 7 else 300):
+                cards = dict_hand(rng, size)
+                expected = Hand([Card.from_dict(card) for card in cards]).analyze()
+                self.assertEqual(game.HandAnalyzer(cards).analyze(), expected)
+                self.assertEqual(legacy.calculate_score(cards), expected)
+
+    def test_two_triples_is_full_house(self):
+        """이전 HandAnalyzer는 트리플 두 개를 Three of a Kind로 판정했음"""
+        cards = [{'suit': suit, 'rank': rank} for rank in ('Queen', '9') for suit in SUITS[:3]]
+        cards.append({'suit': 'Spades', 'rank': '2'})
+        analyzer = game.HandAnalyzer(cards)
+        self.assertEqual(analyzer.analyze(), (7 * 65, 'Full House', 65, 7))
+        self.assertTrue(analyzer.is_full_house())
+        self.assertFalse(analyzer.is_three_of_a_kind())
+
+    def test_constants_match_settings(self):
+        self.assertEqual(list(constants.HAND_RANKINGS.items()), HAND_RANKINGS)
+        self.assertGreater(constants.HAND_RANKINGS['Flush'], constants.HAND_RANKINGS['Straight'])
+
+    def test_full_game(self):
+        random.seed(7)
+        legacy = game.PokerGame()
+        legacy.start_game()
+        while legacy.current_turn is not None:
+            legacy.discard_cards([0, 1])
+        self.assertIn(legacy.winner, ('Player 1', 'Computer', 'Draw'))
+        for player, hand in legacy.hands.items():
+            self.assertEqual(len(hand), constants.CARDS_PER_HAND)
+            self.assertEqual(legacy.scores[player], Hand([Card.from_dict(card) for card in hand]).analyze())
+            # 높은 랭크(같으면 무늬 순서 뒤쪽)부터 정렬
+            keys = [(RANKS.index(card['rank']), SUITS.index(card['suit'])) for card in hand]
+            self.assertEqual(keys, sorted(keys, reverse=True))
+
+
+if __name__ == '__main__':
+    unittest.main()
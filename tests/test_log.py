@@ -0,0 +1,63 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+import unittest
+from flask import Flask
+from app.log import JsonFormatter, SamplingFilter, RequestQueueHandler, start_logging, stop_logging
+
+
+def make_record(level=logging.INFO, msg='hello %s', args=('world',)):
+    return logging.LogRecord('app.test', level, __file__, 10, msg, args, None)
+
+
+class TestLogging(unittest.TestCase):
+
+    def test_json_formatter(self):
+        entry = json.loads(JsonFormatter().format(make_record()))
+        self.assertEqual((entry['level'], entry['logger'], entry['message'], entry['line']),
+                         ('INFO', 'app.test', 'hello world', 10))
+        self.assertNotIn('exc', entry)
+
+    def test_sampling_filter(self):
+        sampler = SamplingFilter({'DEBUG': 0.1, 'INFO': 1.0, 'WARNING': 0})
+        passed = sum(sampler.filter(make_record(logging.DEBUG)) for _ in range(100))
+        self.assertEqual(passed, 10)
+        self.assertTrue(all(sampler.filter(make_record(logging.INFO)) for _ in range(10)))
+        self.assertFalse(any(sampler.filter(make_record(logging.WARNING)) for _ in range(10)))
+        self.assertTrue(sampler.filter(make_record(logging.ERROR)))
+
+    def test_request_fields_and_exception(self):
+        handler = RequestQueueHandler(None)
+        with Flask(__name__).test_request_context('/start', method='POST'):
+            try:
+                raise ValueError('boom')
+            except ValueError:
+                record = make_record(logging.ERROR)
+                record.exc_info = sys.exc_info()
+                prepared = handler.prepare(record)
+        entry = json.loads(JsonFormatter().format(prepared))
+        self.assertEqual((entry['method'], entry['path']), ('POST', '/start'))
+        self.assertIn('ValueError: boom', entry['exc'])
+        self.assertIsNone(prepared.args)
+
+    def test_listener_writes_json_lines(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'logs', 'poker.log')
+            logger = logging.getLogger('app.test_log')
+            logger.propagate = False
+            start_logging(logger, logging.DEBUG, path, max_bytes=1 << 20, backup_count=1,
+                          console=False, sample_rates={'DEBUG': 0.5})
+            for i in range(10):
+                logger.debug('debug %d', i)
+            logger.info('done')
+            stop_logging()
+            with open(path, encoding='utf-8') as f:
+                messages = [json.loads(line)['message'] for line in f]
+        self.assertEqual(messages, ['debug 0', 'debug 2', 'debug 4', 'debug 6', 'debug 8', 'done'])
+        self.assertFalse(logger.handlers)
+
+
+if __name__ == '__main__':
+    unittest.main()
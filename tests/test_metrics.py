@@ -0,0 +1,55 @@
+import os
+import tempfile
+import unittest
+from app.metrics import Metrics
+from helpers import create_test_app
+
+
+class TestMetrics(unittest.TestCase):
+
+    def make_client(self, **config):
+        return create_test_app(**config).test_client()
+
+    def test_render_format(self):
+        metrics = Metrics(buckets=(0.1, 1.0))
+        metrics.observe('poker_session_seconds', 0.05, op='load')
+        metrics.observe('poker_session_seconds', 0.5, op='load')
+        text = metrics.render()
+        self.assertIn('# TYPE poker_session_seconds histogram', text)
+        self.assertIn('poker_session_seconds_bucket{op="load",le="0.1"} 1', text)
+        self.assertIn('poker_session_seconds_bucket{op="load",le="+Inf"} 2', text)
+        self.assertIn('poker_session_seconds_count{op="load"} 2', text)
+
+    def test_enabled(self):
+        client = self.make_client(METRICS_ENABLED=True)
+        client.get('/start')
+        client.post('/discard', data={'discard': '0,1'})
+        response = client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith('text/plain'))
+        text = response.get_data(as_text=True)
+        for line in ('poker_request_duration_seconds_count{method="GET",route="/start",status="200"} 1',
+                     'poker_request_duration_seconds_count{method="POST",route="/discard",status="200"} 1',
+                     'poker_session_seconds_count{op="save"} 2',
+                     'poker_template_render_seconds_count{template="computer.html"} 2',
+                     'poker_ai_decision_seconds_count{strategy="heuristic"} 1'):
+            self.assertIn(line, text)
+
+    def test_disabled(self):
+        client = self.make_client()
+        client.get('/start')
+        self.assertEqual(client.get('/metrics').status_code, 404)
+
+    def test_slow_request_profile(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            client = self.make_client(PROFILE_SLOW_REQUEST_MS=0.001, PROFILE_SAMPLE_RATE=1.0,
+                                      PROFILE_DIR=tmp)
+            client.get('/start')
+            files = os.listdir(tmp)
+            self.assertEqual(len(files), 1)
+            self.assertIn('start', files[0])
+            self.assertEqual(client.get('/metrics').status_code, 404)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import itertools
+import random
+import unittest
+from app.models.ai import PokerAI
+from app.models.card import Card, full_deck
+from app.models.hand import Hand
+from app.models.potential import decide_discards, straight_draw, get_potential_tables
+from config.settings import RANKS, SUITS
+
+
+def rank_multisets(size):
+    """랭크별 최대 4장인 size장 랭크 멀티셋 (랭크 인덱스 튜플)"""
+    for ranks in itertools.combinations_with_replacement(range(len(RANKS)), size):
+        if all(ranks.count(r) <= 4 for r in set(ranks)):
+            yield ranks
+
+
+def assign_suits(ranks, pattern):
+    """같은 랭크는 서로 다른 무늬가 되도록 무늬를 배정한 카드 목록"""
+    cards, seen = [], {}
+    for position, r in enumerate(ranks):
+        j = seen.get(r, 0)
+        seen[r] = j + 1
+        if pattern == 0:    # 랭크별로 무늬를 돌려 분산
+            suit = (j + r) % len(SUITS)
+        elif pattern == 1:  # 랭크마다 무늬 0부터 (무늬 0이 서로 다른 랭크 수만큼)
+            suit = j
+        else:               # 앞의 4장만 무늬 0 우선
+            suit = (j + (0 if position < 4 else 1)) % len(SUITS)
+        cards.append(Card(SUITS[suit], RANKS[r]))
+    return cards
+
+
+class TestPotential(unittest.TestCase):
+
+    def test_exhaustive_sweep(self):
+        """모든 7장 랭크 멀티셋 x 무늬 배치에서 기존 결정과 같음"""
+        rng = random.Random(16)
+        checked = 0
+        for ranks in rank_multisets(7):
+            for pattern in range(3):
+                hand = assign_suits(ranks, pattern)
+                rng.shuffle(hand)
+                self.assertEqual(decide_discards([card.id for card in hand]),
+                                 PokerAI(hand)._decide_by_scan(), hand)
+                checked += 1
+        self.assertGreater(checked, 100000)
+
+    def test_random_hands_of_every_size(self):
+        """0~7장 무작위 패에서 기존 결정과 같음"""
+        rng = random.Random(7)
+        for size in range(8):
+            for _ in range(500):
+                hand = rng.sample(full_deck(), size)
+                self.assertEqual(PokerAI(hand).decide_cards_to_discard(),
+                                 PokerAI(hand)._decide_by_scan(), hand)
+
+    def test_straight_draw_table(self):
+        """랭크 마스크 테이블이 기존 스트레이트 가능성 판정과 같음"""
+        straight_draws = get_potential_tables()[0]
+        self.assertEqual(len(straight_draws), 1 << len(RANKS))
+        for mask in range(1 << len(RANKS)):
+            values = sorted(r + 2 for r in range(len(RANKS)) if mask >> r & 1)
+            expected = any(values[i + 3] - values[i] <= 4 for i in range(len(values) - 3))
+            self.assertEqual(straight_draw(mask) != 0, expected, bin(mask))
+            if expected:
+                consecutive = PokerAI([])._find_consecutive_values(values)
+                self.assertEqual(straight_draw(mask), sum(1 << (v - 2) for v in consecutive))
+
+    def test_hand_potential_uses_table(self):
+        hand = [Card('Hearts', rank) for rank in ('2', '4', '5', '6')] + [Card('Spades', 'King')]
+        self.assertTrue(Hand(hand).get_hand_potential()['straight_potential'])
+        hand[0] = Card('Hearts', '9')
+        self.assertFalse(Hand(hand).get_hand_potential()['straight_potential'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,94 @@
+import os
+import re
+import tempfile
+import unittest
+from flask import Flask
+from app.models.game import Game
+from app.render_cache import RenderCache
+from helpers import create_test_app
+
+
+class TestCardRow(unittest.TestCase):
+
+    def test_same_markup_as_macro(self):
+        """미리 렌더링한 조각과 매크로 렌더링 결과가 같음"""
+        app = create_test_app()
+        game = Game(seed=4)
+        game.start_game()
+        hand = game.players['Player 1'].get_hand_dict()
+        cache = app.extensions['render_cache']
+        with app.test_request_context('/'):
+            cached = cache.card_row()
+            self.assertIs(cache.card_row(), cached)
+            cache.enabled = False
+            live = cache.card_row()
+            for player, selectable in (('Player 1', True), ('Computer', False)):
+                html = cached(hand, player, selectable)
+                self.assertEqual(html, live(hand, player, selectable))
+                self.assertEqual(html, cached(hand, player, selectable))
+                self.assertEqual(html.count('class="card selectable"'), len(hand) if selectable else 0)
+                self.assertIn(f'data-index="{len(hand) - 1}"', html)
+
+
+class TestPageCache(unittest.TestCase):
+
+    def test_csrf_token_per_session(self):
+        """캐시된 페이지에도 세션별 CSRF 토큰이 들어감"""
+        app = create_test_app(WTF_CSRF_ENABLED=True)
+        tokens = set()
+        for _ in range(2):
+            client = app.test_client()
+            first = client.get('/').get_data(as_text=True)
+            self.assertEqual(first, client.get('/').get_data(as_text=True))
+            tokens.add(re.search(r'name="csrf-token" content="([^"]+)"', first).group(1))
+            self.assertNotIn('\x00', first)
+        self.assertEqual(len(tokens), 2)
+
+    def test_hand_rankings_fragment(self):
+        """족보표 팝업은 페이지에 넣지 않고 따로 캐시 가능한 조각으로 내려줌"""
+        app = create_test_app()
+        client = app.test_client()
+        client.get('/start')
+        for html in (client.get('/').get_data(as_text=True),
+                     client.post('/discard', data={'discard': '0'}).get_data(as_text=True)):
+            self.assertNotIn('handRankingsPopup', html)
+            self.assertIn('data-src="/hand-rankings"', html)
+
+        response = client.get('/hand-rankings')
+        self.assertIn('id="handRankingsPopup"', response.get_data(as_text=True))
+        self.assertTrue(response.cache_control.public)
+        self.assertGreater(response.cache_control.max_age, 0)
+        cache = app.extensions['render_cache']
+        self.assertIs(cache.fragment('hand_rankings.html'), cache.fragment('hand_rankings.html'))
+        self.assertEqual(response.get_etag(), (cache.fragment_version('hand_rankings.html'), True))
+        self.assertEqual(client.get('/hand-rankings',
+                                    headers={'If-None-Match': response.headers['ETag']}).status_code, 304)
+
+    def test_invalidated_by_template_mtime(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            def write(name, text, mtime):
+                path = os.path.join(tmp, name)
+                with open(path, 'w', encoding='utf-8') as f:
+                    f.write(text)
+                os.utime(path, ns=(mtime, mtime))
+
+            write('page.html', '{% include "part.html" %} {{ cached_fragment("static.html") }} '
+                               '{{ csrf_token() }}', 1)
+            write('part.html', 'part-1', 1)
+            write('static.html', 'static-1', 1)
+            app = Flask(__name__, template_folder=tmp)
+            cache = RenderCache(app)
+            app.jinja_env.globals.update(csrf_token=lambda: 'token', cached_fragment=cache.fragment)
+            with app.test_request_context('/'):
+                self.assertEqual(cache.render_page('page.html'), 'part-1 static-1 token')
+                write('part.html', 'part-2', 2)
+                self.assertEqual(cache.render_page('page.html'), 'part-2 static-1 token')
+                write('static.html', 'static-2', 2)
+                self.assertEqual(cache.render_page('page.html'), 'part-2 static-2 token')
+                # 수정 시각이 그대로면 다시 렌더링하지 않음
+                write('part.html', 'part-3', 2)
+                self.assertEqual(cache.render_page('page.html'), 'part-2 static-2 token')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+import random
+import tempfile
+import unittest
+from app.models.ai import create_ai
+from app.models.card import full_deck
+from app.models.codec import encode_replay
+from app.models.game import Game, DECK_SHARED, seat_names
+from app.models.shuffle import counter_random, shuffled_deck, shuffled_ids
+from app.replay import replay_game, replay_stored
+from app.simulation import SimulationStats
+from app.store import SQLiteBackend, DirectoryBackend, MemoryBackend
+
+
+def play(seed, strategy='montecarlo'):
+    """시드 게임을 끝까지 진행하고 (게임, 턴 시작 점수) 반환"""
+    rng = random.Random(seed)
+    game = Game(ai_strategy=strategy, rng=rng, seed=seed)
+    game.start_game()
+    scores = {'Player 1': [], 'Computer': []}
+    while game.current_turn is not None:
+        for seat in scores:
+            scores[seat].append(game.players[seat].score[0])
+        player = game.players['Player 1']
+        indices = create_ai(player.hand, player.deck, 'heuristic').decide_cards_to_discard()
+        if rng.random() < 0.2:
+            game.next_turn()
+        else:
+            game.discard_cards('Player 1', indices)
+    return game, scores
+
+
+class TestShuffle(unittest.TestCase):
+
+    def test_deterministic_permutation(self):
+        """같은 시드는 같은 덱, 다른 시드는 다른 덱"""
+        self.assertEqual(shuffled_ids(1), shuffled_ids(1))
+        self.assertNotEqual(shuffled_ids(1), shuffled_ids(2))
+        self.assertEqual(sorted(shuffled_ids(2 ** 64 - 1)), list(range(52)))
+        self.assertEqual(sorted(shuffled_deck(5), key=lambda card: card.id), full_deck())
+        # SplitMix64 기준값 (seed 0의 첫 출력)
+        self.assertEqual(counter_random(0, 0), 0xE220A8397B1DCDAF)
+
+    def test_remaining_deck_from_seed(self):
+        """남은 덱은 (시드, 뽑은 장수)로 정해짐"""
+        game = Game(seed=99)
+        game.start_game()
+        game.discard_cards('Player 1', [0, 1, 2])
+        deck = shuffled_deck(99)
+        player = game.players['Player 1']
+        consumed = 52 // 2 - len(player.deck)
+        self.assertEqual(consumed, 10)
+        self.assertEqual(player.deck, deck[:52 // 2 - consumed])
+
+
+class TestReplay(unittest.TestCase):
+
+    def test_replay_matches_live_game(self):
+        """시드와 행동 로그로 재생한 상태가 실제 진행과 같음 (몬테카를로 컴퓨터 포함)"""
+        for seed in range(8):
+            game, scores = play(seed)
+            self.assertEqual(len(game.actions), 2 * game.max_turns - 1)
+            replayed = Game.replay(game.seed, bytes(game.actions))
+            self.assertEqual(replayed.get_game_state(), game.get_game_state())
+            result = replay_game(game.seed, game.max_turns, bytes(game.actions))
+            self.assertEqual(result['winner'], game.winner)
+            self.assertEqual(result['scores'], scores)
+
+    def test_prefix_replay(self):
+        """로그 앞부분으로 중간 상태 재생"""
+        game = Game(seed=7)
+        game.start_game()
+        states = [game.get_game_state()]
+        for indices in ([0, 1], [], [6], [2, 3, 4]):
+            game.discard_cards('Player 1', indices)
+            states.append(game.get_game_state())
+        for turn, state in enumerate(states):
+            self.assertEqual(Game.replay(7, bytes(game.actions[:2 * turn])).get_game_state(), state)
+
+    def test_actions_after_end(self):
+        game, _ = play(3, 'heuristic')
+        data = encode_replay(game.seed, game.max_turns, bytes(game.actions) + b'\x00')
+        restored = Game()
+        restored.load_from_session(data)
+        self.assertIsNone(restored.seed)
+        self.assertEqual(restored.players, {})
+
+    def test_actions_end_at_computer_turn(self):
+        """컴퓨터 차례에서 끊긴 로그는 AI로 채우지 않고 오류"""
+        game, _ = play(3, 'heuristic')
+        for end in (1, 3, len(game.actions) - 2):
+            with self.assertRaises(ValueError):
+                Game.replay(game.seed, bytes(game.actions[:end]))
+            restored = Game()
+            restored.load_from_session(encode_replay(game.seed, game.max_turns, bytes(game.actions[:end])))
+            self.assertEqual(restored.players, {})
+
+    def test_replay_stored_games(self):
+        """저장소 백엔드의 게임 일괄 재생 (이전 형식은 건너뜀)"""
+        finished, _ = play(1, 'heuristic')
+        ongoing = Game(seed=2)
+        ongoing.start_game()
+        ongoing.discard_cards('Player 1', [0])
+        with tempfile.TemporaryDirectory() as tmp:
+            for backend in (MemoryBackend(), SQLiteBackend(f'{tmp}/games.sqlite3'),
+                            DirectoryBackend(f'{tmp}/games')):
+                backend.save('done', finished.save_to_session(), True)
+                backend.save('ongoing', ongoing.save_to_session(), False)
+                backend.save('legacy', b'\x01\x00\x05\xff\x00', True)
+                results = list(replay_stored(backend.scan(finished_only=True)))
+                self.assertEqual([r['id'] for r in results], ['done'])
+                self.assertEqual(results[0]['winner'], finished.winner)
+                self.assertEqual(sorted(r['id'] for r in replay_stored(backend.scan())),
+                                 ['done', 'ongoing'])
+                backend.close()
+
+    def test_replay_stored_seated_games(self):
+        """좌석 구성을 저장한 게임(버전 3)은 그 좌석으로 재생하고 좌석별로 집계"""
+        rng = random.Random(4)
+        seats, computers = seat_names(4, 0b0110)
+        game = Game(rng=rng, seats=seats, computers=computers, deck_policy=DECK_SHARED)
+        game.start_game()
+        while game.current_turn is not None:
+            game.discard_cards(game.waiting_for, rng.sample(range(7), rng.randint(0, 3)))
+        backend = MemoryBackend()
+        backend.save('seated', game.save_to_session(), True)
+        backend.save('default', play(1, 'heuristic')[0].save_to_session(), True)
+        results = {r['id']: r for r in replay_stored(backend.scan())}
+        self.assertEqual(set(results), {'seated', 'default'})
+        result = results['seated']
+        self.assertEqual(list(result['final']), list(seats))
+        self.assertEqual(result['final'], {seat: list(p.score) for seat, p in game.players.items()})
+        self.assertEqual((result['winner'], result['ranking']), (game.winner, game.ranking))
+        self.assertEqual([len(turns) for turns in result['scores'].values()], [game.max_turns] * 4)
+
+        stats = SimulationStats()
+        for result in results.values():
+            stats.add(result)
+        summary = stats.summary()
+        self.assertEqual(set(summary['hand_types']), set(seats) | {'Computer'})
+        self.assertEqual(len(summary['average_score_per_turn']['Player 1']), game.max_turns + 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+from unittest import mock
+from app.models.game import Game
+from helpers import create_test_app
+
+
+class TestGameSerialization(unittest.TestCase):
+
+    def make_client(self, backend):
+        app = create_test_app(DEBUG_HEADERS=True, GAME_STORE_BACKEND=backend)
+        return app.test_client()
+
+    def check_counts(self, client):
+        def saves(response):
+            self.assertEqual(response.status_code, 200)
+            count = int(response.headers['X-Game-Serializations'])
+            # 페이지 ETag의 상태 버전은 저장/로드한 바이트열로 만들어 따로 인코딩하지 않음
+            self.assertEqual(encode.call_count, count)
+            encode.reset_mock()
+            return count
+
+        encode = mock.patch.object(Game, 'save_to_session', autospec=True,
+                                   side_effect=Game.save_to_session).start()
+        self.addCleanup(mock.patch.stopall)
+
+        self.assertEqual(saves(client.get('/start')), 1)
+        # 진행 중인 게임을 다시 조회하면 저장하지 않음
+        self.assertEqual(saves(client.get('/hand-rankings')), 0)
+        self.assertEqual(saves(client.post('/discard', data={'discard': '0,1'})), 1)
+        self.assertEqual(saves(client.get('/next_turn')), 1)
+        self.assertEqual(saves(client.get('/start')), 0)
+
+    def test_cookie_backend(self):
+        """쿠키 세션: 요청당 최대 한 번 직렬화"""
+        self.check_counts(self.make_client('cookie'))
+
+    def test_store_backend(self):
+        """게임 저장소: 요청당 최대 한 번 기록"""
+        self.check_counts(self.make_client('memory'))
+
+
+class TestHealthChecks(unittest.TestCase):
+
+    def test_liveness_and_readiness(self):
+        app = create_test_app()
+        client = app.test_client()
+        self.assertEqual(client.get('/healthz').get_json(), {'status': 'ok'})
+        self.assertEqual(client.get('/readyz').status_code, 200)
+
+        # 저장소가 닫히면 준비 안 됨 (생존 확인은 그대로)
+        app.extensions['game_store'].close()
+        self.assertEqual(client.get('/readyz').status_code, 503)
+        self.assertEqual(client.get('/healthz').status_code, 200)
+
+
+if __name__ == '__main__':
+    unittest.main()
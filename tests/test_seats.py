@@ -0,0 +1,128 @@
+import random
+import unittest
+from app.models.codec import decode_seated_replay, encode_action
+from app.models.game import (Game, GameError, DECK_PER_SEAT, DECK_POLICIES, DECK_SHARED, DECK_SPLIT,
+                             DEFAULT_SEATS, COMPUTER_SEATS, seat_names)
+from config.settings import CARDS_PER_HAND
+
+
+def play(game, rng):
+    """사람 좌석은 무작위 교체/넘김으로 끝까지 진행"""
+    game.start_game()
+    while game.current_turn is not None:
+        seat = game.waiting_for
+        hand_size = len(game.players[seat].hand)
+        game.discard_cards(seat, rng.sample(range(hand_size), rng.randint(0, 3)))
+    return game
+
+
+class TestSeatNames(unittest.TestCase):
+
+    def test_names(self):
+        self.assertEqual(seat_names(2, 0b10), (DEFAULT_SEATS, COMPUTER_SEATS))
+        self.assertEqual(seat_names(2), (('Player 1', 'Player 2'), ()))
+        self.assertEqual(seat_names(4, 0b1010),
+                         (('Player 1', 'Computer 1', 'Player 2', 'Computer 2'), ('Computer 1', 'Computer 2')))
+
+
+class TestMultiSeatGame(unittest.TestCase):
+
+    def test_deck_policies(self):
+        seats, computers = seat_names(4, 0b1110)
+        split = Game(seed=3, seats=seats, computers=computers)
+        split.start_game()
+        self.assertEqual([len(p.deck) for p in split.players.values()], [13 - CARDS_PER_HAND] * 4)
+        ids = [card.id for p in split.players.values() for card in p.hand + p.deck]
+        self.assertEqual(len(set(ids)), 52)
+
+        shared = Game(seed=3, seats=seats, computers=computers, deck_policy=DECK_SHARED)
+        shared.start_game()
+        decks = [p.deck for p in shared.players.values()]
+        self.assertTrue(all(deck is decks[0] for deck in decks))
+        self.assertEqual(len(decks[0]), 52 - 4 * CARDS_PER_HAND)
+
+        seats, computers = seat_names(8, 0b11111110)
+        per_seat = Game(seed=3, seats=seats, computers=computers, deck_policy=DECK_PER_SEAT)
+        per_seat.start_game()
+        hands = [tuple(card.id for card in p.hand) for p in per_seat.players.values()]
+        self.assertEqual(len(set(hands)), 8)
+        self.assertEqual(len(per_seat.players['Computer 7'].deck), 52 - CARDS_PER_HAND)
+
+    def test_invalid_layouts(self):
+        eight, _ = seat_names(8)
+        for kwargs in ({'seats': ('A',)}, {'seats': eight + ('Player 9',)},
+                       {'seats': eight, 'deck_policy': DECK_SPLIT},
+                       {'seats': eight, 'deck_policy': DECK_SHARED},
+                       {'seats': eight, 'deck_policy': 'unknown'}):
+            with self.assertRaises(GameError):
+                Game(computers=(), **kwargs)
+        Game(seats=eight, computers=(), deck_policy=DECK_PER_SEAT)
+
+    def test_turn_order_and_computers(self):
+        seats, computers = seat_names(5, 0b10100)
+        game = Game(seed=9, seats=seats, computers=computers)
+        game.start_game()
+        for turn in (1, 2):
+            for seat in ('Player 1', 'Player 2', 'Player 3'):
+                self.assertEqual((game.current_turn, game.waiting_for), (turn, seat))
+                game.next_turn(seat)
+        # 두 번째 턴 시작과 세 번째 턴 시작에 컴퓨터 좌석이 한 번씩 행동
+        self.assertEqual(len(game.actions), 6 + 2 * 2)
+        with self.assertRaises(GameError):
+            game.next_turn('Player 2')
+
+    def test_session_round_trip(self):
+        """버전 3 (좌석 구성 포함) 저장/복원"""
+        rng = random.Random(1)
+        for count, mask, policy in ((2, 0, DECK_SPLIT), (4, 0b1100, DECK_SHARED), (8, 0b11111100, DECK_PER_SEAT)):
+            seats, computers = seat_names(count, mask)
+            game = Game(rng=rng, seats=seats, computers=computers, deck_policy=policy)
+            play(game, rng)
+            data = game.save_to_session()
+            self.assertEqual(decode_seated_replay(data)[3:], (count, mask, DECK_POLICIES.index(policy)))
+            self.assertEqual(len(data), 13 + len(game.actions))
+            restored = Game()
+            restored.load_from_session(data)
+            self.assertEqual((restored.seats, restored.deck_policy), (seats, policy))
+            self.assertEqual(restored.get_game_state(), game.get_game_state())
+            # 기본 좌석 게임을 불러오면 다시 기본 좌석
+            restored.load_from_session(Game(seed=1).save_to_session())
+            self.assertEqual(restored.seats, DEFAULT_SEATS)
+
+        with self.assertRaises(GameError):
+            Game(seed=1, seats=('A', 'B'), computers=('B',)).save_to_session()
+
+    def test_winner_single_pass(self):
+        seats, _ = seat_names(3)
+        game = Game(seed=1, seats=seats, computers=())
+        game.start_game()
+        for player, score in zip(game.players.values(), (10, 30, 20)):
+            player.score = (score, 'High Card', score, 1)
+        self.assertEqual(game.ranking, [])
+        self.assertEqual(game.determine_winner(), ['Player 2', 'Player 3', 'Player 1'])
+        self.assertEqual(game.winner, 'Player 2')
+        self.assertEqual(game.get_game_state()['ranking'], game.ranking)
+        game.players['Player 3'].score = (30, 'High Card', 30, 1)
+        self.assertEqual(game.determine_winner(), ['Player 2', 'Player 3', 'Player 1'])
+        self.assertEqual(game.winner, 'Draw')
+
+    def test_discards_capped_by_deck(self):
+        """덱이 모자라면 남은 장수만큼만 교체해 패가 줄지 않음"""
+        for count, policy in ((7, DECK_SPLIT), (4, DECK_SHARED), (2, DECK_SPLIT)):
+            seats, computers = seat_names(count, 0b10)
+            game = Game(seed=5, seats=seats, computers=computers, deck_policy=policy)
+            game.start_game()
+            while game.current_turn is not None:
+                game.discard_cards(game.waiting_for, range(CARDS_PER_HAND))
+            for player in game.players.values():
+                self.assertEqual(len(player.hand), CARDS_PER_HAND)
+            restored = Game()
+            restored.load_from_session(game.save_to_session())
+            self.assertEqual(restored.get_game_state(), game.get_game_state())
+            if count == 7:
+                # 나눠 준 뒤 덱이 비어 모든 교체가 넘김으로 기록됨
+                self.assertEqual(set(game.actions), {encode_action(())})
+
+
+if __name__ == '__main__':
+    unittest.main()
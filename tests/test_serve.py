@@ -0,0 +1,23 @@
+import unittest
+from app.serve import load_settings, gunicorn_options
+
+
+class TestServeOptions(unittest.TestCase):
+
+    def test_production_settings(self):
+        settings = load_settings('production')
+        self.assertGreaterEqual(settings['SERVER_WORKERS'], 1)
+        options = gunicorn_options(settings, pidfile='server.pid')
+        self.assertEqual(options['workers'], settings['SERVER_WORKERS'])
+        self.assertEqual(options['worker_class'], 'gthread' if settings['SERVER_THREADS'] > 1 else 'sync')
+        self.assertFalse(options['preload_app'])
+        self.assertEqual(options['pidfile'], 'server.pid')
+
+    def test_development_settings(self):
+        options = gunicorn_options(load_settings('development'))
+        self.assertEqual((options['workers'], options['worker_class']), (1, 'sync'))
+        self.assertNotIn('pidfile', options)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import itertools
+import time
+import unittest
+from unittest import mock
+from app.models.game import Game
+from app.simulation import human_discard, play_game, run_games, SimulationStats
+from config.settings import MAX_CARDS_TO_DISCARD
+
+
+class TestSimulation(unittest.TestCase):
+
+    def test_seeded_games_are_reproducible(self):
+        """같은 시드의 게임은 워커 수와 무관하게 같은 결과"""
+        serial = list(run_games(12, seed=3, workers=1, chunk_size=5))
+        parallel = sorted(run_games(12, seed=3, workers=2, chunk_size=5), key=lambda r: r['index'])
+        self.assertEqual(serial, parallel)
+        self.assertEqual(play_game(4, 3, 'heuristic', 'heuristic'), serial[4])
+        self.assertNotEqual(serial[0], play_game(0, 4, 'heuristic', 'heuristic'))
+
+    def test_montecarlo_ignores_clock(self):
+        """montecarlo 게임도 결정 시간(머신 부하)과 무관하게 같은 결과"""
+        expected = play_game(1, 5, 'montecarlo', 'montecarlo')
+        real_clock = time.perf_counter
+        slow = itertools.count(step=0.01)  # 호출마다 10ms씩 흐르는 시계
+        with mock.patch('time.perf_counter', lambda: real_clock() + next(slow)):
+            self.assertEqual(play_game(1, 5, 'montecarlo', 'montecarlo'), expected)
+
+    def test_human_discard_limit(self):
+        """Player 1 자리도 웹과 같이 한 번에 MAX_CARDS_TO_DISCARD장까지만 교체"""
+        self.assertEqual(human_discard([0, 1, 2, 3, 4, 5]), [1, 2, 3, 4, 5])
+        self.assertEqual(human_discard([4, 2]), [2, 4])
+        self.assertEqual(human_discard([]), [])
+        with mock.patch.object(Game, 'discard_cards', autospec=True,
+                               side_effect=Game.discard_cards) as discard:
+            for index in range(20):
+                play_game(index, 0, 'heuristic', 'heuristic')
+        sizes = [len(call.args[2]) for call in discard.call_args_list]
+        self.assertLessEqual(max(sizes), MAX_CARDS_TO_DISCARD)
+
+    def test_stats(self):
+        stats = SimulationStats()
+        for result in run_games(20, player='montecarlo', computer='heuristic', workers=1):
+            stats.add(result)
+        summary = stats.summary()
+        self.assertEqual(summary['games'], 20)
+        self.assertAlmostEqual(sum(summary['win_rates'].values()), 1.0)
+        self.assertAlmostEqual(sum(summary['hand_types']['Player 1'].values()), 1.0)
+        # 1~5턴 시작 시 점수 + 최종 점수
+        self.assertEqual(len(summary['average_score_per_turn']['Player 1']), 6)
+
+    def test_unknown_strategy(self):
+        with self.assertRaises(ValueError):
+            list(run_games(1, player='nope'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import itertools
+import random
+import unittest
+from app.models.ai import ExactAI
+from app.models.card import full_deck
+from app.models.evaluator import evaluate_cards
+from app.models.player import Player
+from app.models.solver import solve, best_single_discard
+
+
+def brute_force(hand, deck, turns, limit):
+    """모든 턴별 교체 조합을 직접 시도한 최고 점수"""
+    best = evaluate_cards(hand)[0]
+    if turns == 0:
+        return best
+    for k in range(1, min(limit, len(hand)) + 1):
+        if k > len(deck):
+            break
+        for indices in itertools.combinations(range(len(hand)), k):
+            kept = [card for i, card in enumerate(hand) if i not in indices]
+            drawn = list(reversed(deck[-k:]))
+            best = max(best, brute_force(kept + drawn, deck[:-k], turns - 1, limit))
+    return best
+
+
+def play_plan(hand, deck, plan):
+    """계획을 Player.discard_cards로 실제 진행한 최종 점수"""
+    player = Player('Solver')
+    player.hand, player.deck = list(hand), list(deck)
+    for discard in plan.discards:
+        player.discard_cards([i for i, card in enumerate(player.hand) if card in discard])
+    return evaluate_cards(player.hand)
+
+
+class TestSolver(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(11)
+
+    def deal(self, deck_size=19):
+        deck = full_deck()
+        self.rng.shuffle(deck)
+        return deck[:7], deck[7:7 + deck_size]
+
+    def test_matches_brute_force(self):
+        """1~2턴, 교체 한도 5/7에서 전수 탐색과 같은 점수"""
+        for _ in range(6):
+            hand, deck = self.deal(self.rng.randint(4, 19))
+            for turns in (1, 2):
+                for limit in (5, 7):
+                    plan = solve(hand, deck, turns, limit)
+                    self.assertEqual(plan.score[0], brute_force(hand, deck, turns, limit))
+
+    def test_single_discard(self):
+        hand, deck = self.deal()
+        indices, score = best_single_discard(hand, deck)
+        self.assertEqual(score[0], solve(hand, deck, 1).score[0])
+
+    def test_plan_is_playable(self):
+        """계획대로 진행하면 계획한 점수가 나옴"""
+        for turns in (3, 5):
+            hand, deck = self.deal()
+            plan = solve(hand, deck, turns)
+            self.assertLessEqual(len(plan.discards), turns)
+            self.assertEqual(play_plan(hand, deck, plan), plan.score)
+
+    def test_exact_ai(self):
+        hand, deck = self.deal()
+        indices = ExactAI(hand, deck, turns_left=2).decide_cards_to_discard()
+        self.assertEqual(indices, solve(hand, deck, 2).first_indices(hand))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from app.models.game import Game
+from app.store import GameStore, MemoryBackend, SQLiteBackend, DirectoryBackend
+from helpers import create_test_app
+
+
+def started_game():
+    game = Game()
+    game.start_game()
+    return game
+
+
+class TestBackends(unittest.TestCase):
+
+    def check_backend(self, backend):
+        data = started_game().save_to_session()
+        self.assertIsNone(backend.load('g1'))
+        backend.save('g1', data, False)
+        self.assertEqual(backend.load('g1'), data)
+        backend.save('g1', data, True)
+        self.assertEqual(backend.load('g1'), data)
+        self.assertEqual(backend.purge_finished(time.time() - 60), 0)
+        self.assertEqual(backend.purge_finished(time.time() + 60), 1)
+        self.assertIsNone(backend.load('g1'))
+        backend.save('g2', data, False)
+        backend.delete('g2')
+        self.assertIsNone(backend.load('g2'))
+        backend.close()
+
+    def test_memory(self):
+        self.check_backend(MemoryBackend())
+
+    def test_sqlite(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.check_backend(SQLiteBackend(os.path.join(tmp, 'games.sqlite3')))
+
+    def test_directory(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            self.check_backend(DirectoryBackend(tmp))
+
+
+class TestGameStore(unittest.TestCase):
+
+    def test_cache_hit_returns_live_game(self):
+        """캐시 적중 시 같은 Game 객체 반환"""
+        store = GameStore(MemoryBackend(), flush_interval=60)
+        game = started_game()
+        revision = store.put('a', game)
+        self.assertIs(store.get('a', revision)[0], game)
+        self.assertEqual(store.stats['hits'], 1)
+        # write-behind: 아직 백엔드에 없음
+        self.assertIsNone(store.backend.load('a'))
+        store.flush()
+        self.assertEqual(store.backend.load('a'), game.save_to_session())
+
+    def test_revision_mismatch_reloads(self):
+        """리비전이 다르면 백엔드에서 다시 읽음"""
+        backend = MemoryBackend()
+        store = GameStore(backend)
+        game = started_game()
+        store.put('a', game)
+        other = started_game()
+        backend.save('a', other.save_to_session(), False)
+        loaded, _ = store.get('a', 5)
+        self.assertIsNot(loaded, game)
+        self.assertEqual(loaded.get_game_state(), other.get_game_state())
+
+    def test_revision_mismatch_keeps_unflushed(self):
+        """write-behind에서 아직 쓰지 않은 변경은 리비전이 달라도 버리지 않음"""
+        store = GameStore(MemoryBackend(), flush_interval=60)
+        game = started_game()
+        store.put('a', game)
+        self.assertIs(store.get('a', 5)[0], game)
+        store.flush()
+        self.assertEqual(store.backend.load('a'), game.save_to_session())
+        self.assertIsNot(store.get('a', 5)[0], game)
+
+    def test_concurrent_writes_keep_latest(self):
+        """같은 게임을 동시에 쓰면 나중 put의 상태가 남음"""
+        class SlowBackend(MemoryBackend):
+            def save(self, game_id, data, finished):
+                if data == b'first':
+                    time.sleep(0.05)
+                super().save(game_id, data, finished)
+
+        store = GameStore(SlowBackend())
+        game = started_game()
+        first = threading.Thread(target=store.put, args=('a', game, b'first'))
+        first.start()
+        time.sleep(0.01)
+        store.put('a', game, b'second')
+        first.join()
+        self.assertEqual(store.backend.load('a'), b'second')
+
+    def test_evicted_game_found_before_written(self):
+        """밀려난 변경 게임은 기록이 끝나기 전에 읽어도 백엔드의 이전 상태 대신 반환"""
+        seen = []
+
+        class ProbeBackend(MemoryBackend):
+            def save(self, game_id, data, finished):
+                seen.append(store.get(game_id, 99)[0])
+                super().save(game_id, data, finished)
+
+        store = GameStore(ProbeBackend(), capacity=1, flush_interval=60)
+        game = started_game()
+        store.put('a', game)
+        store.put('b', started_game())  # 'a'를 밀어내며 기록
+        self.assertEqual(seen, [game])
+        self.assertEqual(store.backend.load('a'), game.save_to_session())
+
+    def test_lru_eviction_writes_dirty(self):
+        """용량 초과로 밀려난 변경 게임은 백엔드에 기록"""
+        store = GameStore(MemoryBackend(), capacity=2, flush_interval=60)
+        games = {key: started_game() for key in 'abc'}
+        for key, game in games.items():
+            store.put(key, game)
+        self.assertEqual(store.backend.load('a'), games['a'].save_to_session())
+        self.assertIsNone(store.backend.load('c'))
+
+    def test_finished_games_expire(self):
+        """TTL이 지난 종료 게임 제거"""
+        store = GameStore(MemoryBackend(), ttl=0)
+        game = started_game()
+        game.determine_winner()
+        store.put('a', game)
+        time.sleep(0.01)
+        store.evict_expired()
+        self.assertIsNone(store.backend.load('a'))
+        self.assertIsNot(store.get('a')[0], game)
+
+    def test_finished_games_expire_write_through(self):
+        """write-through(flush 없음)에서도 put 중에 TTL이 지난 종료 게임 정리"""
+        store = GameStore(MemoryBackend(), ttl=0.05, flush_interval=0)
+        game = started_game()
+        game.determine_winner()
+        store.put('a', game)
+        store.put('b', started_game())
+        self.assertIsNotNone(store.backend.load('a'))
+        time.sleep(0.06)
+        store.put('b', started_game())
+        self.assertIsNone(store.backend.load('a'))
+        self.assertNotIn('a', store._cache)
+        self.assertEqual(store.stats['flushes'], 0)
+
+    def test_invalid_game_id(self):
+        with self.assertRaises(ValueError):
+            GameStore(MemoryBackend()).get('../etc/passwd')
+
+
+class TestStoreRoutes(unittest.TestCase):
+
+    def test_game_flow(self):
+        """저장소 모드에서 게임 진행"""
+        app = create_test_app()
+        store = app.extensions['game_store']
+        client = app.test_client()
+
+        self.assertEqual(client.get('/start').status_code, 200)
+        self.assertEqual(client.post('/discard', data={'discard': '0,1'}).status_code, 200)
+        self.assertEqual(client.get('/next_turn').status_code, 200)
+        with client.session_transaction() as sess:
+            self.assertNotIn('game', sess)
+            game, _ = store.get(sess['game_id'], sess['game_rev'])
+        self.assertEqual(game.current_turn, 3)
+        self.assertEqual(store.stats['misses'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+import os
+import tempfile
+import unittest
+from app.models import evaluator, potential, table_cache
+
+
+def current_tables():
+    return (evaluator._RANK_TABLE, evaluator._FLUSH_TABLE,
+            potential._STRAIGHT_DRAWS, potential._FLUSH_DRAWS, potential._RANK_KEEP)
+
+
+def clear_tables():
+    evaluator._RANK_TABLE = evaluator._FLUSH_TABLE = None
+    potential._STRAIGHT_DRAWS = potential._FLUSH_DRAWS = potential._RANK_KEEP = None
+
+
+class TestTableCache(unittest.TestCase):
+
+    def setUp(self):
+        evaluator.get_tables()
+        potential.get_potential_tables()
+        self.built = current_tables()
+        self.saved_path = table_cache._path
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache', 'tables.bin')
+        table_cache.set_cache_path(self.path)
+
+    def tearDown(self):
+        table_cache.set_cache_path(self.saved_path)
+        (evaluator._RANK_TABLE, evaluator._FLUSH_TABLE,
+         potential._STRAIGHT_DRAWS, potential._FLUSH_DRAWS, potential._RANK_KEEP) = self.built
+        self.tmp.cleanup()
+
+    def test_round_trip(self):
+        """저장한 파일에서 만든 것과 같은 테이블을 읽음"""
+        table_cache._write(self.path, table_cache._fingerprint())
+        clear_tables()
+        self.assertEqual(potential.get_potential_tables(), self.built[2:])
+        loaded = current_tables()
+        self.assertEqual(loaded, self.built)
+        self.assertEqual(evaluator.evaluate_ids([12, 25, 38, 51, 11, 0, 1]), (592, 'Four of a Kind', 74, 8))
+
+    def test_header_alignment(self):
+        """헤더 뒤의 키 배열(Q)이 8바이트 경계에서 시작"""
+        self.assertEqual(table_cache._HEADER.size % 8, 0)
+
+    def test_rebuilt_when_stale_or_broken(self):
+        table_cache._write(self.path, b'\0' * 16)  # 다른 설정/코드로 만든 파일
+        stale = os.path.getsize(self.path)
+        clear_tables()
+        with self.assertNoLogs('app.models.table_cache', 'WARNING'):
+            evaluator.get_tables()
+        self.assertEqual(current_tables(), self.built)
+        self.assertEqual(table_cache._read(self.path, table_cache._fingerprint())[0], self.built[0])
+        self.assertEqual(os.path.getsize(self.path), stale)
+
+        # 잘린 파일은 경고 후 무시
+        with open(self.path, 'r+b') as f:
+            f.truncate(stale // 2)
+        with self.assertLogs('app.models.table_cache', 'WARNING'):
+            self.assertIsNone(table_cache._read(self.path, table_cache._fingerprint()))
+
+    def test_no_path(self):
+        table_cache.set_cache_path(None)
+        self.assertFalse(table_cache.load_tables())
+        self.assertFalse(os.path.exists(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
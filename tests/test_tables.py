@@ -0,0 +1,172 @@
+import asyncio
+import json
+import unittest
+from app.models.game import Game, GameError
+from app.realtime import RealtimeServer
+from app.tables import TABLE_SEATS, TableError, TableManager
+from config.settings import CARDS_PER_HAND
+
+
+def started(manager):
+    """두 명이 참가한 (테이블, {좌석: 토큰})"""
+    table = manager.create()
+    tokens = {}
+    for _ in TABLE_SEATS:
+        seat, token = manager.join(table.id)
+        tokens[seat] = token
+    return table, tokens
+
+
+class TestTwoHumanGame(unittest.TestCase):
+
+    def test_seats_act_in_order(self):
+        """사람 좌석이 차례대로 교체해야 턴이 넘어감"""
+        game = Game(seats=TABLE_SEATS, computers=(), seed=7)
+        game.start_game()
+        self.assertEqual(game.waiting_for, 'Player 1')
+        with self.assertRaises(GameError):
+            game.discard_cards('Player 2', [0])
+        game.discard_cards('Player 1', [0])
+        self.assertEqual((game.current_turn, game.waiting_for), (1, 'Player 2'))
+        game.next_turn('Player 2')
+        self.assertEqual((game.current_turn, game.waiting_for), (2, 'Player 1'))
+        self.assertEqual(len(game.actions), 2)
+
+    def test_invalid_seats(self):
+        with self.assertRaises(GameError):
+            Game(seats=('A', 'A'))
+        with self.assertRaises(GameError):
+            Game(seats=('A', 'B'), computers=('A', 'B'))
+        with self.assertRaises(GameError):
+            Game(seats=TABLE_SEATS, computers=()).save_to_session()
+
+
+class TestTableManager(unittest.TestCase):
+
+    def setUp(self):
+        self.manager = TableManager(max_tables=2, ttl=10)
+
+    def test_join_starts_game(self):
+        table = self.manager.create()
+        self.assertEqual(self.manager.join(table.id)[0], 'Player 1')
+        self.assertIsNone(table.game.current_turn)
+        self.assertEqual(self.manager.join(table.id)[0], 'Player 2')
+        self.assertEqual(table.game.current_turn, 1)
+        with self.assertRaises(TableError) as ctx:
+            self.manager.join(table.id)
+        self.assertEqual(ctx.exception.status, 409)
+
+    def test_view_hides_opponent_until_finished(self):
+        table, tokens = started(self.manager)
+        view = table.view('Player 1')
+        self.assertIsNotNone(view['players']['Player 1']['hand'])
+        self.assertIsNone(view['players']['Player 2']['hand'])
+        self.assertIsNone(view['players']['Player 2']['score'])
+        self.assertEqual(view['players']['Player 2']['cards'], CARDS_PER_HAND)
+        while table.game.winner is None:
+            seat = table.game.waiting_for
+            self.manager.discard(table.id, tokens[seat], [])
+        self.assertIsNotNone(table.view('Player 1')['players']['Player 2']['hand'])
+
+    def test_discard_errors(self):
+        table, tokens = started(self.manager)
+        cases = [
+            (tokens['Player 2'], [0], 409),       # 차례가 아님
+            ('bad', [0], 403),
+            (tokens['Player 1'], [CARDS_PER_HAND], 400),
+            (tokens['Player 1'], [0, 0], 400),
+            (tokens['Player 1'], '0', 400),
+        ]
+        for token, indices, status in cases:
+            with self.assertRaises(TableError) as ctx:
+                self.manager.discard(table.id, token, indices)
+            self.assertEqual(ctx.exception.status, status, (token, indices))
+        with self.assertRaises(TableError) as ctx:
+            self.manager.discard('missing', tokens['Player 1'], [0])
+        self.assertEqual(ctx.exception.status, 404)
+
+    def test_subscribers_receive_versions(self):
+        table = self.manager.create()
+        _, token = self.manager.join(table.id)
+        received = []
+        unsubscribe = self.manager.subscribe(table.id, token, received.append)
+        _, other = self.manager.join(table.id)
+        self.manager.discard(table.id, token, [1, 2])
+        self.assertEqual([state['version'] for state in received], [1, 2, 3])
+        self.assertEqual(received[-1]['waiting_for'], 'Player 2')
+        unsubscribe()
+        self.manager.discard(table.id, other, [])
+        self.assertEqual(len(received), 3)
+
+    def test_capacity_and_eviction(self):
+        first = self.manager.create()
+        self.manager.create()
+        with self.assertRaises(TableError) as ctx:
+            self.manager.create()
+        self.assertEqual(ctx.exception.status, 503)
+        # 구독 중인 테이블은 정리하지 않음
+        _, token = self.manager.join(first.id)
+        self.manager.subscribe(first.id, token, lambda state: None)
+        self.assertEqual(self.manager.evict_idle(first.touched_at + 11), 1)
+        self.assertIn(first.id, self.manager.tables)
+
+
+class TestRealtimeServer(unittest.TestCase):
+
+    def test_play_over_http_and_events(self):
+        asyncio.run(self._play())
+
+    async def _play(self):
+        server = RealtimeServer(TableManager(), heartbeat=0.05)
+        host, port = await server.start('127.0.0.1', 0)
+
+        async def request(method, path, body=None):
+            reader, writer = await asyncio.open_connection(host, port)
+            data = json.dumps(body).encode() if body is not None else b''
+            writer.write(f'{method} {path} HTTP/1.1\r\nHost: x\r\nConnection: close\r\n'
+                         f'Content-Length: {len(data)}\r\n\r\n'.encode() + data)
+            response = await reader.read()
+            writer.close()
+            head, _, payload = response.partition(b'\r\n\r\n')
+            return int(head.split()[1]), json.loads(payload) if payload else None
+
+        try:
+            status, body = await request('POST', '/tables')
+            self.assertEqual(status, 201)
+            table_id = body['table']
+            _, first = await request('POST', f'/tables/{table_id}/join')
+            _, second = await request('POST', f'/tables/{table_id}/join')
+            self.assertEqual((first['seat'], second['seat']), TABLE_SEATS)
+
+            reader, writer = await asyncio.open_connection(host, port)
+            writer.write(f'GET /tables/{table_id}/events?token={second["token"]} HTTP/1.1\r\n'
+                         'Host: x\r\n\r\n'.encode())
+            head = await reader.readuntil(b'\r\n\r\n')
+            self.assertIn(b'text/event-stream', head)
+
+            async def next_state():
+                while True:
+                    chunk = (await reader.readuntil(b'\n\n')).decode()
+                    if not chunk.startswith(':'):  # 하트비트는 건너뜀
+                        return json.loads(chunk.split('data: ', 1)[1])
+
+            state = await next_state()
+            self.assertEqual((state['seat'], state['waiting_for']), ('Player 2', 'Player 1'))
+            status, _ = await request('POST', f'/tables/{table_id}/discard',
+                                      {'token': first['token'], 'discard': [0]})
+            self.assertEqual(status, 200)
+            state = await asyncio.wait_for(next_state(), 1)
+            self.assertEqual(state['waiting_for'], 'Player 2')
+            writer.close()
+
+            status, body = await request('POST', f'/tables/{table_id}/discard',
+                                         {'token': first['token'], 'discard': [0]})
+            self.assertEqual(status, 409)
+            status, body = await request('GET', '/healthz')
+            self.assertEqual((status, body['tables']), (200, 1))
+        finally:
+            await server.close()
+
+
+if __name__ == '__main__':
+    unittest.main()